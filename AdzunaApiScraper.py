@@ -1,30 +1,49 @@
 ﻿import tkinter as tk
 from tkinter import messagebox, ttk, filedialog, StringVar
-import requests
 import os
-import json
-from datetime import datetime
+import queue
+import threading
 from dotenv import load_dotenv
 
+# The API functions are headless (adzuna.api); re-exported here for existing callers
+from adzuna.api import get_adzuna_jobs, get_adzuna_market  # noqa: F401
+from adzuna.client import AdzunaAPIError
+from adzuna.countries import DEFAULT_COUNTRY, format_salary, get_country
+from virtual_table import VirtualTable
+from adzuna.table_model import JobTableModel, parse_day
+from adzuna.job_io import export_jobs
+from adzuna.job_record import parse_results
+from adzuna.skills import default_extractor, enrich
+
 load_dotenv()
 
 # Global variable to store current jobs
 current_jobs = []
 sort_reverse = False
 
-# ----- API Functions -----
-def get_adzuna_jobs(app_id, api_key, search_term="python", location="UK"):
-    """Fetch jobs from Adzuna API."""
-    try:
-        url = f"https://api.adzuna.com/v1/api/jobs/gb/search/1?app_id={app_id}&app_key={api_key}&what={search_term}&where={location}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        jobs = data.get('results', [])
-        return jobs
-    except Exception as e:
-        print("Adzuna API error:", e)
-        return []
+# Sort/filter engine over current_jobs; the table displays its view
+table_model = JobTableModel()
+
+# How often (ms) the UI checks whether the market stats worker has finished
+QUEUE_POLL_MS = 100
+
+# Results table columns (smart_ai_job_system.py layout); Link is hidden
+TABLE_COLUMNS = ('Date', 'Score', 'Category', 'Title', 'Company', 'Location',
+                 'Type', 'Salary', 'Skills', 'Link')
+
+# Results table column -> job_io CSV column
+CSV_EXPORT_COLUMNS = {
+    'Date': 'Date',
+    'Score': 'Score',
+    'Category': 'Category',
+    'Title': 'Title',
+    'Company': 'Company',
+    'Location': 'Location',
+    'Type': 'Type',
+    'Salary': 'Salary Max',
+    'Skills': 'Skills',
+    'Link': 'Link',
+}
 
 # ----- Save/Export Functions -----
 def save_to_json():
@@ -35,35 +54,111 @@ def save_to_json():
     
     filename = filedialog.asksaveasfilename(
         defaultextension=".json",
-        filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        filetypes=[("JSON files", "*.json"), ("NDJSON files", "*.ndjson"),
+                   ("CSV files", "*.csv"), ("All files", "*.*")]
     )
     if filename:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(current_jobs, f, ensure_ascii=False, indent=4)
-        messagebox.showinfo("Success", f"Saved {len(current_jobs)} jobs to {filename}")
+        # Streamed one job at a time; format follows the extension (.gz compresses).
+        # CSV gets the table's columns, including Score/Category/Skills.
+        columns = [CSV_EXPORT_COLUMNS[column] for column in TABLE_COLUMNS]
+        count = export_jobs(current_jobs, filename, columns=columns)
+        messagebox.showinfo("Success", f"Saved {count} jobs to {filename}")
 
 # ----- GUI Functions -----
 def on_table_click(event):
     """Open job link when table row is double-clicked."""
-    item = table.identify_row(event.y)
-    if item:
-        values = table.item(item, "values")
-        if len(values) > 2:  # Ensure link exists (it's in column index 2 - "Link")
-            # Get all values: (Date, Score, Category, Title, Company, Location, Type, Rate, Skills, Applied, Link)
+    values = table.values_at(event.y)
+    if values:
+        if len(values) > 2:  # Ensure link exists
+            # Get all values: (Date, Score, Category, Title, Company, Location, Type, Salary, Skills, Link)
             link = values[-1]  # Link is the last column
             if link.startswith("http"):
                 import webbrowser
                 webbrowser.open(link)
 
-# TODO: Implement sorting functionality for table columns
+def job_row(idx, job):
+    """Return ('#' text, column values) for a Job record row in the table."""
+    salary_str = format_salary(job.salary_max, job.country)
+    
+    # Columns matching smart_ai_job_system.py structure
+    # (Date, Score, Category, Title, Company, Location, Type, Salary, Skills, Link)
+    return str(idx + 1), (
+        job.created_date or 'N/A',  # Date
+        str(job.score) if job.score is not None else 'N/A',  # Score (skills.py)
+        job.category or 'N/A',      # Category
+        job.title or 'N/A',         # Title
+        job.company or 'N/A',       # Company
+        job.location or 'N/A',      # Location
+        job.contract_type or 'N/A', # Type
+        salary_str,                 # Salary
+        ', '.join(job.skills or ()),  # Skills
+        job.redirect_url            # Link (hidden from display but used for opening)
+    )
+
+def show_market_stats():
+    """Show Adzuna's aggregate statistics for the current search in a window."""
+    app_id = os.getenv("ADZUNA_APP_ID")
+    api_key = os.getenv("ADZUNA_API_KEY")
+    if not app_id or not api_key:
+        messagebox.showerror("Error", "API credentials not found in .env file")
+        return
+    try:
+        country = get_country(country_entry.get() or DEFAULT_COUNTRY).code
+    except ValueError as e:
+        messagebox.showerror("Error", str(e))
+        return
+    search_term = search_entry.get() or "python"
+    location = location_entry.get() or "UK"
+    jobs = list(current_jobs)
+    results = queue.Queue()
+    
+    def worker():
+        # Several aggregate requests, with retries: keep them off the Tk thread
+        try:
+            results.put(('report', get_adzuna_market(app_id, api_key, search_term, location,
+                                                     country, jobs)))
+        except Exception as e:
+            results.put(('error', e))
+    
+    market_button.config(state="disabled")
+    threading.Thread(target=worker, daemon=True).start()
+    root.after(QUEUE_POLL_MS, poll_market_stats, results)
+
+def poll_market_stats(results):
+    """Show the market report in a window once the worker has finished."""
+    try:
+        kind, payload = results.get_nowait()
+    except queue.Empty:
+        root.after(QUEUE_POLL_MS, poll_market_stats, results)
+        return
+    market_button.config(state="normal")
+    if kind == 'error':
+        messagebox.showerror("Error", f"Failed to load market stats: {payload}")
+        return
+    window = tk.Toplevel(root)
+    window.title("Market Statistics")
+    text = tk.Text(window, width=90, height=30, font=("Courier", 10))
+    text.pack(fill=tk.BOTH, expand=True)
+    text.insert('1.0', payload.format())
+    text.config(state='disabled')
+
 def sort_table(col):
-    """Sort table by column (TODO: implement full sort)."""
-    pass
+    """Sort table by column; clicking the same heading again reverses it."""
+    global sort_reverse
+    table_model.sort(col)
+    sort_reverse = table_model.sort_reverse
+    table.refresh()
 
-# TODO: Check date filtering and sorting implementation
 def filter_by_date():
-    """Filter jobs by date (TODO: implement date filtering)."""
-    pass
+    """Filter jobs to the From/To dates (YYYY-MM-DD, either may be blank)."""
+    try:
+        start = parse_day(date_from_entry.get()) if date_from_entry.get().strip() else None
+        end = parse_day(date_to_entry.get(), end=True) if date_to_entry.get().strip() else None
+    except ValueError:
+        messagebox.showerror("Error", "Dates must be in YYYY-MM-DD format")
+        return
+    table_model.filter_by_date(start, end)
+    table.set_model(table_model)
 
 def fetch_jobs():
     """Fetch jobs from Adzuna API and populate table."""
@@ -71,6 +166,11 @@ def fetch_jobs():
     
     search_term = search_entry.get() or "python"
     location = location_entry.get() or "UK"
+    try:
+        country = get_country(country_entry.get() or DEFAULT_COUNTRY).code
+    except ValueError as e:
+        messagebox.showerror("Error", str(e))
+        return
     
     app_id = os.getenv("ADZUNA_APP_ID")
     api_key = os.getenv("ADZUNA_API_KEY")
@@ -80,108 +180,121 @@ def fetch_jobs():
         return
     
     # Clear table
-    for item in table.get_children():
-        table.delete(item)
+    table.clear()
     
-    jobs = get_adzuna_jobs(app_id, api_key, search_term, location)
+    try:
+        jobs = get_adzuna_jobs(app_id, api_key, search_term, location, raise_errors=True,
+                               country=country)
+    except AdzunaAPIError as e:
+        messagebox.showerror("Error", f"Failed to fetch jobs: {e}")
+        return
     
     if jobs:
-        current_jobs = jobs
-        for idx, job in enumerate(jobs[:100], 1):  # Limit display to first 100
-            # Get job details
-            date_str = job.get('created', datetime.now().isoformat())[:10]  # TODO: Check date extraction
-            title = job.get('title', 'N/A')
-            company = job.get('company', {}).get('display_name', 'N/A')
-            location_name = job.get('location', {}).get('display_name', 'N/A')
-            salary_max = job.get('salary_max', 0)
-            salary_min = job.get('salary_min', 0)
-            salary_str = f"£{salary_max:,.0f}" if salary_max else "N/A"
-            job_type = job.get('contract_type', 'N/A')
-            link = job.get('redirect_url', '')
-            
-            # Insert with all columns matching smart_ai_job_system.py structure
-            # (Date, Title, Company, Location, Type, Salary, Link)
-            table.insert('', 'end', values=(
-                date_str,      # Date
-                title,         # Title
-                company,       # Company
-                location_name, # Location
-                job_type,      # Type
-                salary_str,    # Salary
-                link           # Link (hidden from display but used for opening)
-            ))
+        current_jobs = parse_results(jobs)
+        # Skills and relevance to the search term, across processes for big result sets
+        enrich(current_jobs, default_extractor(search_term))
+        table_model.load(current_jobs)
+        table_model.filter_by_date(None, None)
+        table.set_model(table_model)
         
         save_button.config(state="normal")
         messagebox.showinfo("Success", f"Fetched {len(jobs)} jobs")
     else:
-        messagebox.showerror("Error", "Failed to fetch jobs. Check your API credentials.")
+        messagebox.showinfo("Info", "No jobs found for this search")
 
 # ----- GUI Setup -----
-root = tk.Tk()
-root.title("Adzuna Job Scraper")
-root.geometry("1200x600")
-
-# Control Panel
-control_frame = tk.Frame(root)
-control_frame.pack(pady=10, fill=tk.X, padx=10)
-
-tk.Label(control_frame, text="Search Term:").pack(side=tk.LEFT, padx=5)
-search_entry = tk.Entry(control_frame, width=30)
-search_entry.pack(side=tk.LEFT, padx=5)
-search_entry.insert(0, "python")
-
-tk.Label(control_frame, text="Location:").pack(side=tk.LEFT, padx=5)
-location_entry = tk.Entry(control_frame, width=30)
-location_entry.pack(side=tk.LEFT, padx=5)
-location_entry.insert(0, "UK")
-
-# Buttons
-button_frame = tk.Frame(root)
-button_frame.pack(pady=10)
-
-tk.Button(button_frame, text="Fetch Jobs", command=fetch_jobs, bg="green", fg="white", padx=15, pady=5).pack(side=tk.LEFT, padx=5)
-save_button = tk.Button(button_frame, text="Save JSON", command=save_to_json, bg="blue", fg="white", padx=15, pady=5, state="disabled")
-save_button.pack(side=tk.LEFT, padx=5)
-
-# Results Table with scrollbars (matching smart_ai_job_system.py structure)
-table_frame = tk.Frame(root)
-table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-tree_scroll = ttk.Scrollbar(table_frame)
-tree_scroll.pack(side='right', fill='y')
-
-table = ttk.Treeview(table_frame, yscrollcommand=tree_scroll.set, selectmode='browse')
-table.pack(side='left', fill='both', expand=True)
-tree_scroll.config(command=table.yview)
-
-# Define columns matching smart_ai_job_system.py
-table['columns'] = ('Date', 'Title', 'Company', 'Location', 'Type', 'Salary', 'Link')
-
-# Column definitions
-table.column('#0', width=50, minwidth=50)
-table.column('Date', width=70, minwidth=60)
-table.column('Title', width=250, minwidth=200)
-table.column('Company', width=150, minwidth=100)
-table.column('Location', width=150, minwidth=100)
-table.column('Type', width=100, minwidth=80)
-table.column('Salary', width=100, minwidth=80)
-table.column('Link', width=0, stretch=False)  # Hidden column for job link
-
-# Headings
-table.heading('#0', text='#', anchor=tk.W)
-table.heading('Date', text='Date', anchor=tk.W)
-table.heading('Title', text='Job Title', anchor=tk.W)
-table.heading('Company', text='Company', anchor=tk.W)
-table.heading('Location', text='Location', anchor=tk.W)
-table.heading('Type', text='Type', anchor=tk.W)
-table.heading('Salary', text='Salary', anchor=tk.W)
-
-# Add horizontal scrollbar
-hsb = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=table.xview)
-hsb.pack(side='bottom', fill='x')
-table.configure(xscroll=hsb.set)
-
-# Bind double-click to open links
-table.bind("<Double-1>", on_table_click)
-
-root.mainloop()
+def main():
+    """Build the window and run the Tk event loop."""
+    global root, search_entry, location_entry, country_entry, date_from_entry, date_to_entry
+    global save_button, market_button, table
+    
+    root = tk.Tk()
+    root.title("Adzuna Job Scraper")
+    root.geometry("1200x600")
+
+    # Control Panel
+    control_frame = tk.Frame(root)
+    control_frame.pack(pady=10, fill=tk.X, padx=10)
+
+    tk.Label(control_frame, text="Search Term:").pack(side=tk.LEFT, padx=5)
+    search_entry = tk.Entry(control_frame, width=30)
+    search_entry.pack(side=tk.LEFT, padx=5)
+    search_entry.insert(0, "python")
+
+    tk.Label(control_frame, text="Location:").pack(side=tk.LEFT, padx=5)
+    location_entry = tk.Entry(control_frame, width=30)
+    location_entry.pack(side=tk.LEFT, padx=5)
+    location_entry.insert(0, "UK")
+
+    tk.Label(control_frame, text="Country:").pack(side=tk.LEFT, padx=5)
+    country_entry = tk.Entry(control_frame, width=4)
+    country_entry.pack(side=tk.LEFT, padx=5)
+    country_entry.insert(0, DEFAULT_COUNTRY)
+
+    tk.Label(control_frame, text="From:").pack(side=tk.LEFT, padx=5)
+    date_from_entry = tk.Entry(control_frame, width=12)
+    date_from_entry.pack(side=tk.LEFT, padx=5)
+
+    tk.Label(control_frame, text="To:").pack(side=tk.LEFT, padx=5)
+    date_to_entry = tk.Entry(control_frame, width=12)
+    date_to_entry.pack(side=tk.LEFT, padx=5)
+
+    tk.Button(control_frame, text="Filter", command=filter_by_date).pack(side=tk.LEFT, padx=5)
+
+    # Buttons
+    button_frame = tk.Frame(root)
+    button_frame.pack(pady=10)
+
+    tk.Button(button_frame, text="Fetch Jobs", command=fetch_jobs, bg="green", fg="white", padx=15, pady=5).pack(side=tk.LEFT, padx=5)
+    save_button = tk.Button(button_frame, text="Save JSON", command=save_to_json, bg="blue", fg="white", padx=15, pady=5, state="disabled")
+    save_button.pack(side=tk.LEFT, padx=5)
+    market_button = tk.Button(button_frame, text="Market Stats", command=show_market_stats, padx=15, pady=5)
+    market_button.pack(side=tk.LEFT, padx=5)
+
+    # Results Table with scrollbars (matching smart_ai_job_system.py structure)
+    table_frame = tk.Frame(root)
+    table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    # Define columns matching smart_ai_job_system.py; only visible rows are
+    # materialized, so the full result set can be shown without truncation
+    table = VirtualTable(table_frame, TABLE_COLUMNS, job_row)
+    table.pack(fill='both', expand=True)
+
+    # Column definitions
+    table.column('#0', width=50, minwidth=50)
+    table.column('Date', width=70, minwidth=60)
+    table.column('Score', width=50, minwidth=40)
+    table.column('Category', width=120, minwidth=80)
+    table.column('Title', width=250, minwidth=200)
+    table.column('Company', width=150, minwidth=100)
+    table.column('Location', width=150, minwidth=100)
+    table.column('Type', width=100, minwidth=80)
+    table.column('Salary', width=100, minwidth=80)
+    table.column('Skills', width=250, minwidth=100)
+    table.column('Link', width=0, stretch=False)  # Hidden column for job link
+
+    # Headings
+    table.heading('#0', text='#', anchor=tk.W)
+    table.heading('Date', text='Date', anchor=tk.W, command=lambda: sort_table('Date'))
+    table.heading('Score', text='Score', anchor=tk.W, command=lambda: sort_table('Score'))
+    table.heading('Category', text='Category', anchor=tk.W, command=lambda: sort_table('Category'))
+    table.heading('Title', text='Job Title', anchor=tk.W, command=lambda: sort_table('Title'))
+    table.heading('Company', text='Company', anchor=tk.W, command=lambda: sort_table('Company'))
+    table.heading('Location', text='Location', anchor=tk.W, command=lambda: sort_table('Location'))
+    table.heading('Type', text='Type', anchor=tk.W, command=lambda: sort_table('Type'))
+    table.heading('Salary', text='Salary', anchor=tk.W, command=lambda: sort_table('Salary'))
+    table.heading('Skills', text='Skills', anchor=tk.W, command=lambda: sort_table('Skills'))
+
+    # Add horizontal scrollbar
+    hsb = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL, command=table.xview)
+    hsb.pack(side='bottom', fill='x')
+    table.configure(xscroll=hsb.set)
+
+    # Bind double-click to open links
+    table.bind("<Double-1>", on_table_click)
+
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
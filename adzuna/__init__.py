@@ -0,0 +1,18 @@
+"""
+Headless core of the Adzuna job scraper.
+
+Fetching, parsing, storage, sync and export live here and never import
+tkinter, so they can run from cron, containers and benchmarks; the Tk
+GUIs (AdzunaApiScraper.py, adzuna_smart_gui.py) are layered on top.
+Submodules are imported on demand to keep start-up fast:
+
+- ``adzuna.client``: pooled API client with retries and pagination
+- ``adzuna.api``: get_adzuna_jobs / get_adzuna_market, used by AdzunaApiScraper
+- ``adzuna.response_cache``: on-disk response cache
+- ``adzuna.job_record``: compact Job records
+- ``adzuna.job_store``: SQLite job history
+- ``adzuna.incremental_sync``: fetch only postings newer than the last run
+- ``adzuna.job_io``: streaming JSON/NDJSON/CSV export and import
+- ``adzuna.table_model``: sort and date-filter engine for result tables
+- ``adzuna.cli``: command-line entry point (``python -m adzuna``)
+"""
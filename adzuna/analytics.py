@@ -0,0 +1,249 @@
+"""
+Market statistics from Adzuna's aggregate endpoints.
+
+Answering "how many jobs, what salary spread, which companies" used to
+mean paging through every posting. Adzuna computes these server-side:
+
+- the search endpoint's ``count`` and ``mean`` (one result per page is enough)
+- ``histogram``: postings per salary band
+- ``top_companies``: companies with the most postings and their average salary
+- ``geodata``: postings per location
+- ``history``: average advertised salary per month (per country; the
+  endpoint takes no search term)
+
+MarketAnalytics.report() makes those five requests concurrently through
+an AdzunaClient, so they share its response cache, retries and rate
+limiter. That is five requests however many postings match, where paging
+through them costs one per 50.
+
+A part that fails (an error response, quota exhausted, offline) falls back
+to local computation over a stats.MarketStats of jobs already loaded,
+if one is available; MarketReport.sources records which parts came from
+where. Local medians stand in for Adzuna's averages.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import MAX_RESULTS_PER_PAGE
+from .countries import DEFAULT_COUNTRY, format_salary, get_country
+from .errors import AdzunaAPIError
+
+PARTS = ("summary", "histogram", "top_companies", "geodata", "history")
+DEFAULT_MONTHS = 12
+DEFAULT_TOP = 10
+# Salary bands for local histograms (Adzuna's own are 10k wide in most markets)
+LOCAL_HISTOGRAM_BINS = 10
+
+
+def parse_summary(data):
+    """(count, mean salary or None) from a search response."""
+    mean = data.get("mean")
+    return int(data.get("count") or 0), float(mean) if mean else None
+
+
+def parse_histogram(data):
+    """[(band lower bound, postings), ...] in ascending salary order."""
+    bands = data.get("histogram") or {}
+    return sorted((float(low), int(count)) for low, count in bands.items())
+
+
+def parse_top_companies(data):
+    """[(company, postings, average salary or None), ...] as ranked by Adzuna."""
+    rows = []
+    for entry in data.get("leaderboard") or []:
+        salary = entry.get("average_salary")
+        rows.append((entry.get("canonical_name") or entry.get("display_name") or "",
+                     int(entry.get("count") or 0), float(salary) if salary else None))
+    return rows
+
+
+def parse_geodata(data):
+    """[(location, postings), ...] with the most postings first."""
+    rows = [((entry.get("location") or {}).get("display_name") or "", int(entry.get("count") or 0))
+            for entry in data.get("locations") or []]
+    return sorted(rows, key=lambda row: -row[1])
+
+
+def parse_history(data):
+    """[('YYYY-MM', average salary), ...] in month order."""
+    return sorted((month, float(salary)) for month, salary in (data.get("month") or {}).items()
+                  if salary is not None)
+
+
+# Aggregate endpoint -> response parser
+AGGREGATE_PARSERS = {
+    "histogram": parse_histogram,
+    "top_companies": parse_top_companies,
+    "geodata": parse_geodata,
+    "history": parse_history,
+}
+
+
+class MarketReport:
+    """Aggregates for one search; sources maps each part to 'api' or 'local'."""
+
+    def __init__(self, search_term, location, country):
+        self.search_term = search_term
+        self.location = location
+        self.country = country
+        self.count = None
+        self.mean_salary = None
+        self.histogram = []
+        self.companies = []
+        self.locations = []
+        self.history = []
+        self.sources = {}
+        self.errors = {}
+
+    @property
+    def api_requests(self):
+        return sum(1 for source in self.sources.values() if source == "api")
+
+    def to_dict(self):
+        return {
+            "search_term": self.search_term,
+            "location": self.location,
+            "country": self.country,
+            "count": self.count,
+            "mean_salary": self.mean_salary,
+            "histogram": self.histogram,
+            "top_companies": self.companies,
+            "geodata": self.locations,
+            "history": self.history,
+            "sources": self.sources,
+            "errors": {part: str(error) for part, error in self.errors.items()},
+        }
+
+    def format(self, top=DEFAULT_TOP):
+        """Multi-line text summary for the Tools tab and the command line."""
+        def money(amount):
+            return format_salary(amount, self.country)
+
+        where = f" in {self.location}" if self.location else ""
+        lines = [f"'{self.search_term}'{where} ({self.country.upper()})"]
+        if self.count is not None:
+            lines.append(f"Jobs: {self.count:,}   mean salary: {money(self.mean_salary)}")
+            if self.sources.get("summary") == "api":
+                pages = -(-self.count // MAX_RESULTS_PER_PAGE)
+                lines.append(f"API requests: {self.api_requests} (downloading every posting: {pages:,})")
+        if self.histogram:
+            lines.append("Salary bands:")
+            peak = max(count for _, count in self.histogram) or 1
+            for low, count in self.histogram:
+                lines.append(f"  {money(low):>12} {count:>8,} {'#' * round(30 * count / peak)}")
+        if self.companies:
+            lines.append("Top companies:")
+            for name, count, salary in self.companies[:top]:
+                lines.append(f"  {name[:40]:<40}{count:>8,}  {money(salary)}")
+        if self.locations:
+            lines.append("Locations:")
+            for name, count in self.locations[:top]:
+                lines.append(f"  {name[:40]:<40}{count:>8,}")
+        if self.history:
+            lines.append("Average salary by month: " + ", ".join(
+                f"{month} {money(salary)}" for month, salary in self.history[-6:]))
+        local = [part for part, source in self.sources.items() if source == "local"]
+        if local:
+            lines.append(f"Computed from loaded jobs: {', '.join(local)}")
+        for part, error in self.errors.items():
+            if part not in self.sources:
+                lines.append(f"{part} unavailable: {error}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"MarketReport({self.search_term!r}, count={self.count}, sources={self.sources})"
+
+
+class MarketAnalytics:
+    """Aggregate statistics through an AdzunaClient, with a local fallback.
+
+    local_stats is a stats.MarketStats, or a callable returning one, used
+    only for parts the API can't provide; a callable is called at most once.
+    """
+
+    def __init__(self, client, local_stats=None, top=DEFAULT_TOP, months=DEFAULT_MONTHS):
+        self.client = client
+        self._local_stats = local_stats
+        self.top = top
+        self.months = months
+
+    def local_stats(self):
+        if callable(self._local_stats):
+            self._local_stats = self._local_stats()
+        return self._local_stats
+
+    # ----- API -----
+    def fetch(self, part, search_term="python", location="", country=DEFAULT_COUNTRY,
+              use_cache=True):
+        """Parsed rows of one part from the API (AdzunaAPIError on failure)."""
+        if part == "summary":
+            return parse_summary(self.client.fetch_page(search_term, location, 1, 1, country,
+                                                        use_cache=use_cache))
+        parse = AGGREGATE_PARSERS.get(part)
+        if parse is None:
+            raise ValueError(f"Unknown part {part!r}; expected one of {', '.join(PARTS)}")
+        if part == "history":
+            params = {"months": self.months}
+        else:
+            params = {"what": search_term}
+            if location:
+                params["where"] = location
+        return parse(self.client.fetch_aggregate(part, country, params, use_cache))
+
+    # ----- Local fallback -----
+    def compute(self, part, country=DEFAULT_COUNTRY):
+        """Rows of one part computed from the local stats, or None without them."""
+        stats = self.local_stats()
+        if stats is None or not len(stats):
+            return None
+        if part == "summary":
+            salaries = stats.salaries(country=country)
+            return (int(stats.mask(country=country).sum()),
+                    float(salaries.mean()) if len(salaries) else None)
+        if part == "histogram":
+            counts, edges = stats.histogram(LOCAL_HISTOGRAM_BINS, country=country)
+            return [(float(low), int(count)) for low, count in zip(edges[:-1], counts)]
+        if part == "top_companies":
+            return [(name, jobs, median) for name, jobs, _, median
+                    in stats.group("company", country=country, top=self.top)]
+        if part == "geodata":
+            return [(name, jobs) for name, jobs, _, _
+                    in stats.group("location", country=country, top=self.top)]
+        if part == "history":
+            return [(month[:7], median) for month, _, median
+                    in stats.time_series("month", country=country)[-self.months:]
+                    if median is not None]
+        raise ValueError(f"Unknown part {part!r}; expected one of {', '.join(PARTS)}")
+
+    # ----- Report -----
+    def report(self, search_term="python", location="", country=DEFAULT_COUNTRY, use_cache=True,
+               local_only=False):
+        """MarketReport from concurrent API requests, falling back per part to local stats."""
+        country = get_country(country).code
+        report = MarketReport(search_term, location, country)
+        results = {}
+        if not local_only:
+            with ThreadPoolExecutor(max_workers=len(PARTS)) as pool:
+                futures = {part: pool.submit(self.fetch, part, search_term, location, country,
+                                             use_cache)
+                           for part in PARTS}
+                for part, future in futures.items():
+                    try:
+                        results[part] = future.result()
+                        report.sources[part] = "api"
+                    except AdzunaAPIError as e:
+                        report.errors[part] = e
+        for part in PARTS:
+            if part not in results:
+                rows = self.compute(part, country)
+                if rows is not None:
+                    results[part] = rows
+                    report.sources[part] = "local"
+
+        if "summary" in results:
+            report.count, report.mean_salary = results["summary"]
+        report.histogram = results.get("histogram", [])
+        report.companies = results.get("top_companies", [])[:self.top]
+        report.locations = results.get("geodata", [])[:self.top]
+        report.history = results.get("history", [])
+        return report
@@ -0,0 +1,45 @@
+"""
+Function-style API helpers behind the classic GUI (AdzunaApiScraper.py).
+
+get_adzuna_jobs and get_adzuna_market wrap the shared AdzunaClient for
+callers that want one call per search. They live here rather than in
+the Tk module so they can be used, and tested, without tkinter;
+AdzunaApiScraper re-exports them.
+"""
+
+from .analytics import MarketAnalytics
+from .client import AdzunaAPIError, fetch_jobs_paginated, get_client
+from .countries import DEFAULT_COUNTRY
+from .stats import MarketStats
+
+
+def get_adzuna_jobs(app_id, api_key, search_term="python", location="UK", max_results=100,
+                    raise_errors=False, country=DEFAULT_COUNTRY):
+    """Fetch up to max_results jobs from Adzuna API, paging as needed.
+
+    Failures return an empty list unless raise_errors is set, in which case
+    AdzunaAPIError propagates so callers can tell "no jobs" from "failed".
+    """
+    try:
+        return fetch_jobs_paginated(app_id, api_key, search_term, location, max_results=max_results,
+                                    country=country)
+    except Exception as e:
+        if raise_errors:
+            if isinstance(e, AdzunaAPIError):
+                raise
+            raise AdzunaAPIError(str(e)) from e
+        print("Adzuna API error:", e)
+        return []
+
+
+def get_adzuna_market(app_id, api_key, search_term="python", location="UK",
+                      country=DEFAULT_COUNTRY, local_jobs=None):
+    """Job count, salary bands, top companies, locations and salary history.
+
+    Uses Adzuna's aggregate endpoints (a handful of requests instead of
+    paging through every posting), through the same cached, rate-limited
+    client as get_adzuna_jobs. Parts the API can't provide are computed
+    from local_jobs (Job records) if given. Returns an analytics.MarketReport.
+    """
+    local = (lambda: MarketStats(local_jobs)) if local_jobs else None
+    return MarketAnalytics(get_client(app_id, api_key), local).report(search_term, location, country)
@@ -0,0 +1,399 @@
+"""
+Append-only columnar archive of fetched results, for trend analysis.
+
+A pretty-printed JSON save has to be parsed in full to read one field.
+SnapshotArchive instead writes each fetch as a new segment directory,
+one file per column, and never rewrites a segment:
+
+- float columns (created, salaries, coordinates, score) as ``.npy``
+  float64, NaN when missing
+- label columns (country, company, location, ...) as ``.npy`` int32
+  codes into a per-segment label list kept in ``meta.json`` (-1 = missing)
+- text columns (id, title, description, ...) as ``.offsets.npy`` int64
+  offsets into a ``.utf8`` blob
+
+Readers memory-map only the columns they ask for (projection), so a
+salary trend over six months of snapshots never touches descriptions.
+Rows in a segment are sorted by ``created``, so a date range is a binary
+search for a slice rather than a scan. meta.json records each segment's
+fetch time, created range and countries, so whole segments outside a
+date/country predicate are skipped without opening their columns.
+
+Segments are written to a hidden temporary directory and renamed into
+place, so readers never see a partial segment, and any number of
+processes can append to one archive.
+"""
+
+import itertools
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from .countries import format_salary
+from .job_record import Job, as_job
+
+FORMAT_VERSION = 1
+DEFAULT_ARCHIVE_DIR = "adzuna_archive"
+
+FLOAT_COLUMNS = ('created', 'salary_min', 'salary_max', 'latitude', 'longitude', 'score')
+FLAG_COLUMNS = ('salary_is_predicted',)
+LABEL_COLUMNS = ('country', 'company', 'location', 'category', 'category_tag',
+                 'contract_type', 'contract_time')
+TEXT_COLUMNS = ('id', 'title', 'description', 'redirect_url', 'area', 'skills')
+COLUMNS = FLOAT_COLUMNS + FLAG_COLUMNS + LABEL_COLUMNS + TEXT_COLUMNS
+# Not stored: every row of a segment shares its fetch time
+FETCHED = 'fetched'
+# Joins the parts of area and skills tuples in their text columns
+LIST_SEPARATOR = '\x1f'
+LIST_COLUMNS = ('area', 'skills')
+
+_sequence = itertools.count()
+
+
+def default_archive_dir():
+    """ADZUNA_ARCHIVE_DIR, or adzuna_archive in the working directory."""
+    return os.path.expanduser(os.getenv("ADZUNA_ARCHIVE_DIR", DEFAULT_ARCHIVE_DIR))
+
+
+def _nan(value):
+    return value if value is not None else np.nan
+
+
+def _text(job, name):
+    value = getattr(job, name)
+    if name in LIST_COLUMNS:
+        return LIST_SEPARATOR.join(value or ())
+    return value or ''
+
+
+class TextColumn:
+    """Memory-mapped strings: row i is data[offsets[i]:offsets[i + 1]]."""
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return bytes(self.data[self.offsets[i]:self.offsets[i + 1]]).decode('utf-8')
+
+    def take(self, rows):
+        """Strings of a slice or index array of rows."""
+        if isinstance(rows, slice):
+            lo, hi, _ = rows.indices(len(self))
+            if lo >= hi:
+                return []
+            # One copy of the whole range, split in Python
+            offsets = (self.offsets[lo:hi + 1] - self.offsets[lo]).tolist()
+            blob = bytes(self.data[self.offsets[lo]:self.offsets[hi]])
+            return [blob[a:b].decode('utf-8') for a, b in zip(offsets, offsets[1:])]
+        return [self[i] for i in rows]
+
+
+class Segment:
+    """One archived fetch, opened lazily column by column."""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.rows = self.meta['rows']
+        self.fetched = self.meta['fetched']
+        self.countries = frozenset(self.meta['countries'])
+        self._columns = {}
+
+    def __len__(self):
+        return self.rows
+
+    def labels(self, name):
+        """Label list that a label column's codes index."""
+        return self.meta['labels'][name]
+
+    def column(self, name):
+        """Read-only array of a float, flag or label (codes) column."""
+        array = self._columns.get(name)
+        if array is None:
+            if name == FETCHED:
+                array = np.full(self.rows, self.fetched)
+            elif name in TEXT_COLUMNS:
+                raise ValueError(f"{name!r} is a text column; use text()")
+            elif name not in COLUMNS:
+                raise ValueError(f"Unknown column {name!r}")
+            else:
+                array = np.load(os.path.join(self.path, f'{name}.npy'), mmap_mode='r')
+            self._columns[name] = array
+        return array
+
+    def text(self, name):
+        """TextColumn of a text column."""
+        column = self._columns.get(name)
+        if column is None:
+            if name not in TEXT_COLUMNS:
+                raise ValueError(f"{name!r} is not a text column")
+            offsets = np.load(os.path.join(self.path, f'{name}.offsets.npy'), mmap_mode='r')
+            blob = os.path.join(self.path, f'{name}.utf8')
+            # Empty files can't be mapped
+            data = (np.memmap(blob, dtype=np.uint8, mode='r') if os.path.getsize(blob)
+                    else np.empty(0, dtype=np.uint8))
+            column = self._columns[name] = TextColumn(offsets, data)
+        return column
+
+    def overlaps(self, start=None, end=None, countries=None):
+        """Whether any row could match, from meta.json alone."""
+        if countries is not None and not self.countries.intersection(countries):
+            return False
+        if start is not None or end is not None:
+            low, high = self.meta['created_min'], self.meta['created_max']
+            if low is None:
+                return False
+            if start is not None and high < start:
+                return False
+            if end is not None and low >= end:
+                return False
+        return True
+
+    def select(self, start=None, end=None, countries=None):
+        """Rows with start <= created < end and a country in countries (None = any).
+
+        A slice when only the date range applies (rows are in created
+        order), else an index array.
+        """
+        rows = slice(0, self.rows)
+        if start is not None or end is not None:
+            created = self.column('created')
+            # NaN (undated) sorts last, after every finite bound
+            lo = int(np.searchsorted(created, start, 'left')) if start is not None else 0
+            hi = (int(np.searchsorted(created, end, 'left')) if end is not None
+                  else int(np.count_nonzero(~np.isnan(created))))
+            rows = slice(lo, max(lo, hi))
+        if countries is not None and not self.countries <= set(countries):
+            labels = self.labels('country')
+            wanted = [code for code, country in enumerate(labels) if country in countries]
+            codes = self.column('country')[rows]
+            rows = np.flatnonzero(np.isin(codes, wanted)) + rows.start
+        return rows
+
+    def read(self, name, rows=slice(None)):
+        """Decoded values of one column for rows: floats, bools, labels, strings or tuples."""
+        if name in TEXT_COLUMNS:
+            values = self.text(name).take(rows)
+            if name in LIST_COLUMNS:
+                return [tuple(value.split(LIST_SEPARATOR)) if value else () for value in values]
+            return values
+        values = self.column(name)[rows]
+        if name in LABEL_COLUMNS:
+            # Code -1 picks the trailing None
+            return np.asarray(self.labels(name) + [None], dtype=object)[values]
+        if name in FLAG_COLUMNS:
+            return values.astype(bool)
+        return np.asarray(values)
+
+    def __repr__(self):
+        return f"Segment({self.name!r}, rows={self.rows}, countries={sorted(self.countries)})"
+
+
+class SnapshotArchive:
+    """Directory of append-only columnar segments, one per fetch."""
+
+    def __init__(self, path=None):
+        self.path = path or default_archive_dir()
+        self._segments = {}
+
+    # ----- Writing -----
+    def append(self, jobs, search_term='', location='', fetched=None):
+        """Write jobs (Jobs or raw dicts) as a new segment; returns it, or None if empty."""
+        jobs = [as_job(job) for job in jobs]
+        if not jobs:
+            return None
+        fetched = time.time() if fetched is None else fetched
+        created = np.fromiter((_nan(job.created) for job in jobs), dtype=np.float64, count=len(jobs))
+        # Stable, and NaN sorts last
+        order = np.argsort(created, kind='stable')
+        jobs = [jobs[i] for i in order]
+        created = created[order]
+
+        os.makedirs(self.path, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix='.tmp-', dir=self.path)
+        try:
+            labels = {}
+            for name in FLOAT_COLUMNS:
+                values = created if name == 'created' else np.fromiter(
+                    (_nan(getattr(job, name)) for job in jobs), dtype=np.float64, count=len(jobs))
+                np.save(os.path.join(tmp, f'{name}.npy'), values)
+            for name in FLAG_COLUMNS:
+                np.save(os.path.join(tmp, f'{name}.npy'), np.fromiter(
+                    (bool(getattr(job, name)) for job in jobs), dtype=np.uint8, count=len(jobs)))
+            for name in LABEL_COLUMNS:
+                codes = {}
+                values = np.fromiter(
+                    (-1 if getattr(job, name) is None else codes.setdefault(getattr(job, name), len(codes))
+                     for job in jobs), dtype=np.int32, count=len(jobs))
+                labels[name] = list(codes)
+                np.save(os.path.join(tmp, f'{name}.npy'), values)
+            for name in TEXT_COLUMNS:
+                encoded = [_text(job, name).encode('utf-8') for job in jobs]
+                offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+                np.cumsum([len(value) for value in encoded], out=offsets[1:])
+                np.save(os.path.join(tmp, f'{name}.offsets.npy'), offsets)
+                with open(os.path.join(tmp, f'{name}.utf8'), 'wb') as f:
+                    f.write(b''.join(encoded))
+            dated = created[~np.isnan(created)]
+            meta = {
+                'format': FORMAT_VERSION,
+                'rows': len(jobs),
+                'fetched': fetched,
+                'search_term': search_term,
+                'location': location,
+                'countries': sorted(label for label in labels['country']),
+                'created_min': float(dated[0]) if len(dated) else None,
+                'created_max': float(dated[-1]) if len(dated) else None,
+                'labels': labels,
+            }
+            with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            # Sortable by fetch time; pid and sequence keep concurrent writers apart
+            stamp = time.strftime('%Y%m%dT%H%M%S', time.gmtime(fetched))
+            micros = int(fetched % 1 * 1e6)
+            name = f"{stamp}.{micros:06d}Z-{os.getpid()}-{next(_sequence):04d}"
+            path = os.path.join(self.path, name)
+            os.rename(tmp, path)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        segment = self._segments[name] = Segment(path)
+        return segment
+
+    # ----- Reading -----
+    def segments(self, start=None, end=None, countries=None, fetched_start=None, fetched_end=None):
+        """Segments in fetch order that may hold matching rows.
+
+        start/end bound ``created`` and countries the country, as in
+        Segment.select(); fetched_start/fetched_end bound the fetch time.
+        """
+        try:
+            names = sorted(name for name in os.listdir(self.path) if not name.startswith('.'))
+        except FileNotFoundError:
+            return []
+        selected = []
+        for name in names:
+            segment = self._segments.get(name)
+            if segment is None:
+                path = os.path.join(self.path, name)
+                if not os.path.isfile(os.path.join(path, 'meta.json')):
+                    continue
+                segment = self._segments[name] = Segment(path)
+            if fetched_start is not None and segment.fetched < fetched_start:
+                continue
+            if fetched_end is not None and segment.fetched >= fetched_end:
+                continue
+            if segment.overlaps(start, end, countries):
+                selected.append(segment)
+        return selected
+
+    def scan(self, start=None, end=None, countries=None, fetched_start=None, fetched_end=None):
+        """(segment, rows) for every segment with matching rows."""
+        for segment in self.segments(start, end, countries, fetched_start, fetched_end):
+            rows = segment.select(start, end, countries)
+            if (rows.stop - rows.start if isinstance(rows, slice) else len(rows)):
+                yield segment, rows
+
+    def read(self, columns=('created', 'salary_max', 'country'), start=None, end=None,
+             countries=None, fetched_start=None, fetched_end=None):
+        """{column: values} of the matching rows across segments.
+
+        Numeric columns come back as arrays; labels, text and area/skills
+        tuples as object arrays. Only the named columns are read.
+        """
+        parts = {name: [] for name in columns}
+        for segment, rows in self.scan(start, end, countries, fetched_start, fetched_end):
+            for name in columns:
+                values = segment.read(name, rows)
+                if not isinstance(values, np.ndarray):
+                    array = np.empty(len(values), dtype=object)
+                    array[:] = values
+                    values = array
+                parts[name].append(values)
+        return {name: np.concatenate(values) if values else np.empty(0)
+                for name, values in parts.items()}
+
+    def iter_jobs(self, start=None, end=None, countries=None, fetched_start=None, fetched_end=None,
+                  columns=COLUMNS):
+        """Matching rows as Job records (fields outside columns keep their defaults)."""
+        columns = [name for name in columns if name != FETCHED]
+        for segment, rows in self.scan(start, end, countries, fetched_start, fetched_end):
+            values = [segment.read(name, rows) for name in columns]
+            for row in zip(*values):
+                job = Job()
+                for name, value in zip(columns, row):
+                    if name in FLOAT_COLUMNS:
+                        value = None if value != value else float(value)
+                    elif name in FLAG_COLUMNS:
+                        value = bool(value)
+                    setattr(job, name, value)
+                if 'skills' in columns and job.score is None:
+                    # Never extracted, as opposed to no skills found
+                    job.skills = None
+                yield job
+
+    def __len__(self):
+        return sum(segment.rows for segment in self.segments())
+
+    def __repr__(self):
+        return f"SnapshotArchive({self.path!r})"
+
+
+def load_stats(archive, start=None, end=None, countries=None, by=FETCHED, stats=None):
+    """stats.MarketStats over archived rows, without building Job records.
+
+    by='fetched' dates each row by its snapshot, so start/end select
+    snapshots and a job counts once per snapshot it appears in: the
+    market as it stood on each fetch. by='created' dates rows by posting
+    and keeps only the newest snapshot of each job id.
+    """
+    from .stats import LABEL_COLUMNS as STATS_LABELS, SALARY_COLUMNS, MarketStats
+    stats = stats if stats is not None else MarketStats()
+    if by == FETCHED:
+        chunks = archive.scan(countries=countries, fetched_start=start, fetched_end=end)
+    elif by == 'created':
+        # Newest first, so the first sighting of an id is the one kept
+        chunks = reversed(list(archive.scan(start, end, countries)))
+        seen = set()
+    else:
+        raise ValueError(f"Unknown date {by!r}; expected 'fetched' or 'created'")
+    for segment, rows in chunks:
+        if by == 'created':
+            ids = segment.text('id').take(rows)
+            keep = [k for k, job_id in enumerate(ids) if not (job_id in seen or seen.add(job_id))]
+            if isinstance(rows, slice):
+                rows = np.arange(rows.start, rows.stop)
+            rows = rows[keep]
+            if not len(rows):
+                continue
+        values = {name: segment.column(name)[rows] for name in SALARY_COLUMNS}
+        values['created'] = segment.column(by)[rows]
+        labels = {name: (segment.column(name)[rows], segment.labels(name)) for name in STATS_LABELS}
+        stats.extend_columns(values, labels)
+    return stats
+
+
+def format_trends(stats, period='week', country=None):
+    """Table of postings and median salary per period of a MarketStats.
+
+    Salaries only compare within one currency, so without a country the
+    medians are plain numbers over every market.
+    """
+    lines = [f"{period.title():<12}{'Jobs':>9}  Median salary"]
+    for start, jobs, median in stats.time_series(period, country=country):
+        if country:
+            salary = format_salary(median, country)
+        else:
+            salary = f"{median:,.0f}" if median is not None else "N/A"
+        lines.append(f"{start:<12}{jobs:>9,}  {salary}")
+    return "\n".join(lines)
@@ -0,0 +1,234 @@
+"""
+Batch scheduler for running many searches from a query manifest.
+
+A manifest lists (search term, location) queries as JSON, NDJSON or CSV.
+Queries run concurrently on a worker pool, highest priority first, with
+every API request drawn from one shared RateLimiter so the pool as a
+whole stays inside the plan's quota. Each finished query is recorded in a
+checkpoint file, so a crashed or interrupted batch resumes where it left
+off, and per-query timings are reported at the end.
+
+Manifest entries accept ``what`` (or ``search_term``), ``where`` (or
+``location``), ``country``, ``max_results``, ``priority`` and ``id``.
+"""
+
+import csv
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .countries import DEFAULT_COUNTRY, get_country
+from .errors import AdzunaAPIError
+from .incremental_sync import search_key
+from .job_io import iter_jobs, open_text
+from .rate_limit import QuotaExhausted
+
+DEFAULT_MAX_RESULTS = 100
+
+
+class Query:
+    """One search in a batch manifest."""
+
+    def __init__(self, search_term, location="UK", country=DEFAULT_COUNTRY,
+                 max_results=DEFAULT_MAX_RESULTS, priority=0, query_id=None):
+        self.search_term = search_term
+        self.location = location
+        self.country = country
+        self.max_results = max_results
+        self.priority = priority
+        self.key = query_id or search_key(search_term, location, country)
+
+    @classmethod
+    def from_dict(cls, entry):
+        """Build a Query from a manifest entry (CSV values may be strings)."""
+        search_term = entry.get('what') or entry.get('search_term')
+        if not search_term:
+            raise ValueError(f"Manifest entry has no search term: {entry!r}")
+        country = get_country(entry.get('country') or DEFAULT_COUNTRY).code
+        # Like the CLI: "UK" by default for gb, otherwise the whole country
+        location = entry.get('where') or entry.get('location')
+        if not location:
+            location = "UK" if country == DEFAULT_COUNTRY else ""
+        return cls(
+            search_term,
+            location,
+            country,
+            int(entry.get('max_results') or DEFAULT_MAX_RESULTS),
+            int(entry.get('priority') or 0),
+            entry.get('id') or None,
+        )
+
+    def __repr__(self):
+        return f"Query({self.key!r}, priority={self.priority})"
+
+
+def load_manifest(path):
+    """Queries from a .json / .ndjson / .csv manifest (optionally .gz)."""
+    name = path[:-3] if path.endswith('.gz') else path
+    if name.endswith('.csv'):
+        with open_text(path, 'r') as f:
+            return [Query.from_dict(row) for row in csv.DictReader(f)]
+    return [Query.from_dict(entry) for entry in iter_jobs(path)]
+
+
+class Checkpoint:
+    """JSON file of finished query keys, rewritten atomically per update."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.done = {}
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.done = json.load(f).get('done', {})
+
+    def is_done(self, key):
+        return key in self.done
+
+    def mark_done(self, key, record):
+        with self._lock:
+            self.done[key] = record
+            if not self.path:
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'done': self.done}, f, indent=1)
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+
+class QueryResult:
+    """Outcome and timing of one query in a batch."""
+
+    def __init__(self, query, status, jobs=0, pages=0, seconds=0.0, error=None):
+        self.query = query
+        self.status = status  # 'done', 'skipped', 'failed' or 'cancelled'
+        self.jobs = jobs
+        self.pages = pages
+        self.seconds = seconds
+        self.error = error
+
+    def to_dict(self):
+        return {
+            'id': self.query.key,
+            'status': self.status,
+            'jobs': self.jobs,
+            'pages': self.pages,
+            'seconds': round(self.seconds, 3),
+            'error': self.error,
+        }
+
+    def __repr__(self):
+        return f"QueryResult({self.query.key!r}, {self.status}, jobs={self.jobs})"
+
+
+class BatchScheduler:
+    """Run queries concurrently through one (rate-limited) client.
+
+    Jobs are upserted into store if one is given. on_result(result) is
+    called from worker threads as each query finishes. A QuotaExhausted
+    error from the client's rate limiter cancels the rest of the batch;
+    unfinished queries stay out of the checkpoint and run on resume.
+    """
+
+    def __init__(self, client, store=None, max_workers=4, page_workers=1,
+                 checkpoint=None, use_cache=True, on_result=None, cancel_event=None):
+        self.client = client
+        self.store = store
+        self.max_workers = max_workers
+        self.page_workers = page_workers
+        self.checkpoint = checkpoint or Checkpoint(None)
+        self.use_cache = use_cache
+        self.on_result = on_result
+        self.cancel_event = cancel_event or threading.Event()
+
+    def run(self, queries):
+        """Run queries by descending priority; returns results in that order."""
+        ordered, seen = [], set()
+        for query in sorted(queries, key=lambda q: -q.priority):
+            if query.key not in seen:
+                seen.add(query.key)
+                ordered.append(query)
+
+        results = [None] * len(ordered)
+        pending = []
+        for i, query in enumerate(ordered):
+            if self.checkpoint.is_done(query.key):
+                record = self.checkpoint.done[query.key]
+                results[i] = QueryResult(query, 'skipped', record.get('jobs', 0),
+                                         record.get('pages', 0), record.get('seconds', 0.0))
+            else:
+                pending.append(i)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as pool:
+            # The pool starts work in submission order, i.e. by priority
+            futures = {i: pool.submit(self._run_query, ordered[i]) for i in pending}
+            for i, future in futures.items():
+                results[i] = future.result()
+        return results
+
+    def _run_query(self, query):
+        if self.cancel_event.is_set():
+            return self._finish(QueryResult(query, 'cancelled'))
+
+        pages = 0
+
+        def on_page(page_jobs, pages_done, total_pages):
+            nonlocal pages
+            pages = pages_done
+
+        start = time.perf_counter()
+        try:
+            jobs = self.client.search(
+                query.search_term, query.location, max_results=query.max_results,
+                max_workers=self.page_workers, country=query.country,
+                use_cache=self.use_cache, on_page=on_page, cancel_event=self.cancel_event)
+        except QuotaExhausted as e:
+            self.cancel_event.set()
+            return self._finish(QueryResult(query, 'failed', pages=pages,
+                                            seconds=time.perf_counter() - start, error=str(e)))
+        except AdzunaAPIError as e:
+            return self._finish(QueryResult(query, 'failed', pages=pages,
+                                            seconds=time.perf_counter() - start, error=str(e)))
+
+        if self.store is not None:
+            self.store.upsert_jobs(jobs)
+        seconds = time.perf_counter() - start
+        if self.cancel_event.is_set():
+            # The search may have stopped early; leave it for the resume
+            return self._finish(QueryResult(query, 'cancelled', len(jobs), pages, seconds))
+
+        result = QueryResult(query, 'done', len(jobs), pages, seconds)
+        self.checkpoint.mark_done(query.key, {
+            'jobs': result.jobs, 'pages': pages, 'seconds': round(seconds, 3),
+            'finished': time.time(),
+        })
+        return self._finish(result)
+
+    def _finish(self, result):
+        if self.on_result:
+            self.on_result(result)
+        return result
+
+
+def format_report(results):
+    """Plain-text per-query timing table with a totals line."""
+    width = max([len(r.query.key) for r in results] + [5])
+    lines = [f"{'query':<{width}} {'status':>9} {'jobs':>6} {'pages':>5} {'seconds':>8}"]
+    for r in results:
+        lines.append(f"{r.query.key:<{width}} {r.status:>9} {r.jobs:>6} {r.pages:>5} {r.seconds:>8.2f}")
+    ran = [r for r in results if r.status != 'skipped']
+    counts = {}
+    for r in results:
+        counts[r.status] = counts.get(r.status, 0) + 1
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    lines.append(f"{len(results)} queries ({summary}); {sum(r.jobs for r in ran)} jobs "
+                 f"in {sum(r.seconds for r in ran):.2f}s of query time")
+    return "\n".join(lines)
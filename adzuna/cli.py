@@ -0,0 +1,620 @@
+"""
+Command-line entry point: ``python -m adzuna <command>``.
+
+    python -m adzuna search python -l London
+    python -m adzuna paginate "data engineer" -c gb,us,de -o markets.csv
+    python -m adzuna paginate python -l UK --max-results 500 -o jobs.ndjson --store
+    python -m adzuna sync python -l UK -o new.ndjson
+    python -m adzuna export stored.csv --from 2024-01-01
+    python -m adzuna export scored.csv --skills --focus "python aws"
+    python -m adzuna dedupe --threshold 0.7
+    python -m adzuna stats --from 2024-01-01 --top 10
+    python -m adzuna export near.csv --near London --within 15 --min-salary 40000
+    python -m adzuna paginate python --max-results 1000 --archive
+    python -m adzuna trends --from 2024-01-01 -c gb --period week
+    python -m adzuna market "data engineer" -l London --json market.json
+    python -m adzuna batch queries.csv --per-minute 25 --per-day 250 --report timings.json
+    python -m adzuna watch queries.csv --every 15 -o deltas.ndjson
+
+Credentials come from --app-id/--api-key or ADZUNA_APP_ID/ADZUNA_API_KEY
+(a .env file is read). --country takes a comma-separated list; with more
+than one, the search fans out over those endpoints and the merged output
+is tagged by country. --near/--within, --bbox and --min/--max-salary
+narrow the jobs written by paginate, sync, export and stats, locally,
+through the same table model and grid index as the GUI's Results tab.
+
+Heavy modules are imported per command, so start-up stays fast; the
+option defaults below mirror their constants instead of importing them
+(test_cli checks they agree). Nothing here imports tkinter.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from .countries import DEFAULT_COUNTRY, format_salary, parse_countries
+from .job_record import as_job
+
+DEFAULT_SEARCH_TERM = "python"
+# Used when searching gb alone; other countries default to nationwide
+DEFAULT_LOCATION = "UK"
+
+# Option defaults, mirroring dedupe.DEFAULT_THRESHOLD, job_store.SORT_COLUMNS
+# and rate_limit.DEFAULT_PER_MINUTE/DEFAULT_PER_DAY without importing them
+DEDUPE_THRESHOLD = 0.6
+STORE_SORT_COLUMNS = ("company", "contract_type", "country", "created", "last_seen",
+                      "location", "salary_max", "salary_min", "title")
+PER_MINUTE = 25
+PER_DAY = 250
+
+
+def job_line(job):
+    """One tab-separated summary line for stdout (plus score and skills once extracted)."""
+    job = as_job(job)
+    fields = (job.created_date or "N/A", (job.country or "").upper(), job.title or "N/A",
+              job.company or "N/A", job.location or "N/A",
+              format_salary(job.salary_max, job.country), job.redirect_url)
+    if job.skills is not None:
+        fields += (str(job.score), ", ".join(job.skills))
+    return "\t".join(fields)
+
+
+def emit(jobs, output=None, quiet=False, columns=None):
+    """Write jobs to output (format by extension) or print them to stdout."""
+    if output:
+        from .job_io import DEFAULT_CSV_COLUMNS, export_jobs
+        count = export_jobs(jobs, output, columns or DEFAULT_CSV_COLUMNS)
+        log(f"Wrote {count} jobs to {output}", quiet)
+        return count
+    count = 0
+    for job in jobs:
+        print(job_line(job))
+        count += 1
+    return count
+
+
+def emit_results(args, jobs):
+    """emit() after --skills extraction, which streams big inputs through a process pool."""
+    if not args.skills:
+        return emit(jobs, args.output, args.quiet)
+    from .job_io import SKILL_CSV_COLUMNS
+    from .skills import PARALLEL_MIN, default_extractor, iter_enriched
+    focus = args.focus if args.focus is not None else getattr(args, "term", "")
+    workers = args.skill_workers
+    if workers is None and hasattr(jobs, "__len__") and len(jobs) < PARALLEL_MIN:
+        workers = 1
+    return emit(iter_enriched(jobs, default_extractor(focus), workers), args.output, args.quiet,
+                SKILL_CSV_COLUMNS)
+
+
+def select_jobs(args, jobs):
+    """Jobs within the --near/--within or --bbox area and salary range, in order.
+
+    Returns jobs unchanged without those options; ValueError for a place
+    that no job is located in.
+    """
+    if args.near is None and args.bbox is None and args.min_salary is None and args.max_salary is None:
+        return jobs
+    from .geo_index import GeoIndex, parse_box, to_km
+    from .table_model import KEY_FUNCTIONS, JobTableModel
+    model = JobTableModel([as_job(job) for job in jobs], {"Salary": KEY_FUNCTIONS["Salary"]},
+                          geo_index=GeoIndex())
+    if args.near is not None:
+        lat, lon = model.geo_index.locate(args.near)
+        model.filter_by_area(radius=(lat, lon, to_km(args.within, args.units)))
+    elif args.bbox is not None:
+        model.filter_by_area(box=parse_box(args.bbox))
+    model.filter_by_salary(args.min_salary, args.max_salary)
+    selected = list(model)
+    log(f"{len(selected):,} of {len(model.jobs):,} jobs in the area and salary range", args.quiet)
+    return selected
+
+
+def archive_jobs(args, jobs):
+    """Append jobs to the --archive snapshot archive as one segment, if asked to."""
+    if args.archive is None:
+        return
+    from .archive import SnapshotArchive
+    segment = SnapshotArchive(args.archive or None).append(jobs, args.term, args.location)
+    if segment is not None:
+        log(f"Archived {len(segment):,} jobs as {segment.path}", args.quiet)
+
+
+def log(message, quiet=False):
+    if not quiet:
+        print(message, file=sys.stderr)
+
+
+def open_store(args, dedupe=None):
+    from .job_store import JobStore, dedupe_enabled, default_store
+    if dedupe is None:
+        dedupe = not args.no_dedupe and dedupe_enabled()
+    return JobStore(args.db, dedupe) if args.db else default_store(dedupe)
+
+
+def make_client(args):
+    from .client import get_client
+    return get_client(args.app_id, args.api_key)
+
+
+# ----- Commands -----
+def cmd_search(args):
+    """First page of results and the total count."""
+    from .client import MAX_RESULTS_PER_PAGE
+    client = make_client(args)
+    results = []
+    for country in args.countries:
+        data = client.fetch_page(args.term, args.location, 1, min(args.limit, MAX_RESULTS_PER_PAGE),
+                                 country, use_cache=not args.no_cache)
+        where = f" in {args.location}" if args.location else ""
+        log(f"{country.upper()}: {data.get('count', 0):,} jobs found for '{args.term}'{where}",
+            args.quiet)
+        results.extend(data.get('results', []))
+    emit_results(args, results)
+    return 0
+
+
+def cmd_paginate(args):
+    """Fetch up to --max-results across pages, optionally storing them."""
+    client = make_client(args)
+    if len(args.countries) > 1:
+        def on_country_page(country, page_jobs, pages_done, total_pages):
+            log(f"{country.upper()} page {pages_done}/{total_pages}: {len(page_jobs)} jobs",
+                args.quiet)
+
+        result = client.search_countries(
+            args.countries, args.term, args.location, max_results=args.max_results,
+            max_workers=args.workers, use_cache=not args.no_cache, on_page=on_country_page)
+        for country, error in result.errors.items():
+            log(f"{country.upper()} failed: {error}")
+        jobs = result.jobs
+    else:
+        def on_page(page_jobs, pages_done, total_pages):
+            log(f"page {pages_done}/{total_pages}: {len(page_jobs)} jobs", args.quiet)
+
+        result = None
+        jobs = client.search(
+            args.term, args.location, max_results=args.max_results, max_workers=args.workers,
+            country=args.countries[0], use_cache=not args.no_cache, on_page=on_page)
+    if args.store:
+        store = open_store(args)
+        log(f"Stored {store.upsert_jobs(jobs)} jobs in {store.path}", args.quiet)
+        store.close()
+    archive_jobs(args, jobs)
+    try:
+        jobs = select_jobs(args, jobs)
+    except ValueError as e:
+        log(str(e))
+        return 2
+    emit_results(args, jobs)
+    return 1 if result is not None and result.errors else 0
+
+
+def cmd_sync(args):
+    """Fetch only postings newer than the last sync of this search."""
+    from .incremental_sync import sync_search
+    client = make_client(args)
+    store = open_store(args)
+    new_jobs = []
+    try:
+        # Each country keeps its own high-water mark
+        for country in args.countries:
+            result = sync_search(client, store, args.term, args.location, country,
+                                 max_results=args.max_results, max_days_old=args.max_days_old)
+            log(f"{country.upper()}: {len(result.new_jobs)} new jobs in "
+                f"{result.pages_fetched} pages", args.quiet)
+            if not result.complete:
+                log(f"{country.upper()}: stopped at --max-results before the last sync's "
+                    f"postings; run sync again for the rest", args.quiet)
+            new_jobs.extend(result.new_jobs)
+    finally:
+        store.close()
+    archive_jobs(args, new_jobs)
+    try:
+        new_jobs = select_jobs(args, new_jobs)
+    except ValueError as e:
+        log(str(e))
+        return 2
+    emit_results(args, new_jobs)
+    return 0
+
+
+def cmd_export(args):
+    """Export stored jobs, optionally limited to a posting date range."""
+    from .job_store import UNIQUE_ONLY, created_between
+    from .table_model import parse_day
+    try:
+        start = parse_day(args.date_from) if args.date_from else None
+        end = parse_day(args.date_to, end=True) if args.date_to else None
+    except ValueError:
+        log("Dates must be in YYYY-MM-DD format")
+        return 2
+    store = open_store(args, dedupe=False)
+    try:
+        where, params = created_between(start, end)
+        if not args.with_duplicates:
+            where = f"{where} AND {UNIQUE_ONLY}" if where else UNIQUE_ONLY
+        jobs = select_jobs(args, store.view(args.order_by, not args.ascending, where, params))
+        emit_results(args, jobs)
+    except ValueError as e:
+        log(str(e))
+        return 2
+    finally:
+        store.close()
+    return 0
+
+
+def cmd_dedupe(args):
+    """Flag near-duplicate postings among stored jobs not checked yet."""
+    from .dedupe import Deduplicator
+    store = open_store(args, dedupe=False)
+    try:
+        if args.rebuild:
+            store.reset_dedupe()
+        result = Deduplicator(store, args.threshold).backlog(
+            args.batch_size,
+            on_batch=lambda r: log(f"{r.checked} checked, {len(r.duplicates)} duplicates", args.quiet))
+        canonical = len({c for c, _ in result.duplicates.values()})
+        log(f"Checked {result.checked} jobs in {result.seconds:.1f}s: {len(result.duplicates)} "
+            f"near-duplicates of {canonical} postings", args.quiet)
+    finally:
+        store.close()
+    return 0
+
+
+def cmd_stats(args):
+    """Summarise stored jobs: salary percentiles, top locations/companies, postings per week."""
+    from .job_store import UNIQUE_ONLY, created_between
+    from .stats import MarketStats
+    from .table_model import parse_day
+    try:
+        start = parse_day(args.date_from) if args.date_from else None
+        end = parse_day(args.date_to, end=True) if args.date_to else None
+    except ValueError:
+        log("Dates must be in YYYY-MM-DD format")
+        return 2
+    store = open_store(args, dedupe=False)
+    try:
+        where, params = created_between(start, end)
+        if not args.with_duplicates:
+            where = f"{where} AND {UNIQUE_ONLY}" if where else UNIQUE_ONLY
+        stats = MarketStats(select_jobs(args, store.view(where=where, params=params)))
+    except ValueError as e:
+        log(str(e))
+        return 2
+    finally:
+        store.close()
+    print(stats.report(top=args.top))
+    return 0
+
+
+def cmd_market(args):
+    """Job count, salary bands, top companies, locations and salary history from Adzuna's aggregates."""
+    from .analytics import PARTS, MarketAnalytics
+    from .job_store import UNIQUE_ONLY
+    from .stats import MarketStats
+
+    def stored_stats():
+        # Only loaded if some part can't come from the API; covers the whole store
+        store = open_store(args, dedupe=False)
+        try:
+            return MarketStats(store.view(where=UNIQUE_ONLY))
+        finally:
+            store.close()
+
+    analytics = MarketAnalytics(make_client(args), stored_stats, args.top, args.months)
+    status = 0
+    for country in args.countries:
+        report = analytics.report(args.term, args.location, country, use_cache=not args.no_cache)
+        print(report.format(args.top))
+        if args.json:
+            path = args.json if len(args.countries) == 1 else f"{country}-{args.json}"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report.to_dict(), f, indent=2)
+        if len(report.sources) < len(PARTS):
+            status = 1
+    return status
+
+
+def cmd_trends(args):
+    """Postings and median salary per period from the snapshot archive."""
+    from .archive import SnapshotArchive, format_trends, load_stats
+    from .table_model import parse_day
+    try:
+        start = parse_day(args.date_from) if args.date_from else None
+        end = parse_day(args.date_to, end=True) if args.date_to else None
+    except ValueError:
+        log("Dates must be in YYYY-MM-DD format")
+        return 2
+    try:
+        countries = parse_countries(args.archive_country) if args.archive_country else None
+    except ValueError as e:
+        log(str(e))
+        return 2
+    archive = SnapshotArchive(args.archive_dir)
+    began = time.perf_counter()
+    stats = load_stats(archive, start, end, countries, args.by)
+    log(f"Read {len(stats):,} rows from {archive.path} in {time.perf_counter() - began:.2f}s",
+        args.quiet)
+    if not len(stats):
+        print("No archived jobs match")
+        return 1
+    country = countries[0] if countries and len(countries) == 1 else None
+    print(format_trends(stats, args.period, country))
+    print()
+    print(stats.report(top=args.top))
+    return 0
+
+
+def cmd_batch(args):
+    """Run every query in a manifest under the plan's rate limits."""
+    from .batch import BatchScheduler, Checkpoint, format_report, load_manifest
+    from .client import DEFAULT_POOL_SIZE, AdzunaClient
+    from .rate_limit import RateLimiter
+    from .response_cache import default_cache
+
+    queries = load_manifest(args.manifest)
+    limiter = RateLimiter(args.per_minute, args.per_day, max_wait=args.max_wait)
+    client = AdzunaClient(args.app_id, args.api_key, cache=default_cache(), rate_limiter=limiter,
+                          pool_size=max(DEFAULT_POOL_SIZE, args.workers * args.page_workers))
+    checkpoint = Checkpoint(args.checkpoint or args.manifest + ".checkpoint.json")
+
+    def on_result(result):
+        log(f"{result.status:>9} {result.query.key} ({result.jobs} jobs, {result.seconds:.2f}s)",
+            args.quiet)
+
+    store = open_store(args)
+    try:
+        scheduler = BatchScheduler(client, store, args.workers, args.page_workers, checkpoint,
+                                   use_cache=not args.no_cache, on_result=on_result)
+        results = scheduler.run(queries)
+    finally:
+        store.close()
+        client.close()
+
+    log(format_report(results), args.quiet)
+    stats = limiter.stats()
+    log(f"{stats['acquired']} API requests, {stats['waited']:.1f}s waiting on the rate limit",
+        args.quiet)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({"queries": [r.to_dict() for r in results], "rate_limit": stats}, f, indent=2)
+    return 1 if any(r.status in ("failed", "cancelled") for r in results) else 0
+
+
+def cmd_watch(args):
+    """Re-run saved searches every --every minutes and report new, changed and expired jobs."""
+    from .batch import load_manifest
+    from .client import AdzunaClient
+    from .rate_limit import RateLimiter
+    from .watch import DeltaLog, WatchState, Watcher
+
+    queries = load_manifest(args.manifest)
+    limiter = RateLimiter(args.per_minute, args.per_day, max_wait=args.max_wait)
+    # One client for the whole watch, so pooled connections are reused across cycles
+    client = AdzunaClient(args.app_id, args.api_key, rate_limiter=limiter)
+    write = DeltaLog(args.output) if args.output else None
+
+    def on_deltas(run):
+        if run.error:
+            log(f"{run.query.key}: {run.error}")
+            return
+        counts = run.counts()
+        log(f"{run.query.key}: {run.jobs} jobs, {counts['new']} new, {counts['changed']} changed, "
+            f"{counts['expired']} expired ({run.seconds:.2f}s)", args.quiet)
+        if write:
+            write(run)
+            return
+        for delta in run.deltas:
+            detail = job_line(delta.job) if delta.job is not None else delta.job_id
+            print(f"{delta.kind.upper()}\t{delta.search}\t{detail}", flush=True)
+
+    watcher = Watcher(client, queries, args.every * 60, args.jitter,
+                      WatchState(args.state or args.manifest + ".watch.json"), on_deltas,
+                      emit_initial=not args.skip_initial, page_workers=args.page_workers)
+    log(f"Watching {len(watcher.queries)} searches every {args.every:g} minutes", args.quiet)
+    try:
+        watcher.run(args.cycles)
+    finally:
+        watcher.stop()
+        client.close()
+    return 0
+
+
+# ----- Argument parsing -----
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m adzuna", description="Adzuna job scraper")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+    common.add_argument("--metrics", metavar="PATH",
+                        help="record stage timings and API counters; write them to PATH "
+                             "(.prom for Prometheus text, otherwise JSON)")
+
+    api = argparse.ArgumentParser(add_help=False)
+    api.add_argument("term", nargs="?", default=DEFAULT_SEARCH_TERM, help="search term")
+    api.add_argument("-l", "--location",
+                     help=f"default {DEFAULT_LOCATION!r} for gb alone, else the whole country")
+    api.add_argument("-c", "--country", default=DEFAULT_COUNTRY,
+                     help="Adzuna country code, or a comma-separated list to fan out")
+    api.add_argument("--app-id", default=os.getenv("ADZUNA_APP_ID"))
+    api.add_argument("--api-key", default=os.getenv("ADZUNA_API_KEY"))
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("-o", "--output", help=".json/.ndjson/.csv file (optionally .gz); "
+                                               "default prints to stdout")
+
+    skills = argparse.ArgumentParser(add_help=False)
+    skills.add_argument("--skills", action="store_true",
+                        help="extract skills and a relevance score per job (ADZUNA_SKILLS_FILE "
+                             "for a custom dictionary); adds Score/Category/Skills CSV columns")
+    skills.add_argument("--focus", help="skills that weigh most in the score (default: the search term)")
+    skills.add_argument("--skill-workers", type=int,
+                        help="extraction processes (default: one per CPU for 5000+ jobs)")
+
+    area = argparse.ArgumentParser(add_help=False)
+    where = area.add_mutually_exclusive_group()
+    where.add_argument("--near", metavar="PLACE|LAT,LON",
+                       help="only jobs within --within of a point, or of a place among the jobs")
+    where.add_argument("--bbox", metavar="S,W,N,E", help="only jobs inside a lat/lon box")
+    area.add_argument("--within", type=float, default=10, help="radius for --near (default 10)")
+    area.add_argument("--units", choices=("mi", "km"), default="mi", help="unit of --within")
+    area.add_argument("--min-salary", type=float, help="only jobs paying at least this (max salary)")
+    area.add_argument("--max-salary", type=float, help="only jobs paying at most this (max salary)")
+
+    archive = argparse.ArgumentParser(add_help=False)
+    archive.add_argument("--archive", nargs="?", const="", metavar="DIR",
+                         help="also append the jobs to a snapshot archive "
+                              "(default ADZUNA_ARCHIVE_DIR or adzuna_archive)")
+
+    db = argparse.ArgumentParser(add_help=False)
+    db.add_argument("--db", help="job store path (default ADZUNA_DB_PATH or adzuna_jobs.db)")
+    db.add_argument("--no-dedupe", action="store_true",
+                    help="don't flag near-duplicate postings as they are stored")
+
+    search = commands.add_parser("search", parents=[common, api, output, skills], help=cmd_search.__doc__)
+    search.add_argument("--limit", type=int, default=10, help="results to show (max 50)")
+    search.add_argument("--no-cache", action="store_true")
+    search.set_defaults(func=cmd_search, needs_api=True)
+
+    paginate = commands.add_parser("paginate", parents=[common, api, output, db, skills, area, archive], help=cmd_paginate.__doc__)
+    paginate.add_argument("--max-results", type=int, default=100)
+    paginate.add_argument("--workers", type=int, default=4, help="concurrent page requests")
+    paginate.add_argument("--no-cache", action="store_true")
+    paginate.add_argument("--store", action="store_true", help="also upsert into the job store")
+    paginate.set_defaults(func=cmd_paginate, needs_api=True)
+
+    sync = commands.add_parser("sync", parents=[common, api, output, db, skills, area, archive], help=cmd_sync.__doc__)
+    sync.add_argument("--max-results", type=int, default=1000)
+    sync.add_argument("--max-days-old", type=int, help="window for the first sync")
+    sync.set_defaults(func=cmd_sync, needs_api=True)
+
+    export = commands.add_parser("export", parents=[common, db, skills, area], help=cmd_export.__doc__)
+    export.add_argument("output", help=".json/.ndjson/.csv file (optionally .gz)")
+    export.add_argument("--from", dest="date_from", help="YYYY-MM-DD")
+    export.add_argument("--to", dest="date_to", help="YYYY-MM-DD (inclusive)")
+    export.add_argument("--order-by", choices=STORE_SORT_COLUMNS, default="created")
+    export.add_argument("--ascending", action="store_true")
+    export.add_argument("--with-duplicates", action="store_true",
+                        help="include postings flagged as near-duplicates")
+    export.set_defaults(func=cmd_export, needs_api=False)
+
+    dedupe = commands.add_parser("dedupe", parents=[common, db], help=cmd_dedupe.__doc__)
+    dedupe.add_argument("--threshold", type=float, default=DEDUPE_THRESHOLD,
+                        help="estimated Jaccard similarity that counts as a duplicate")
+    dedupe.add_argument("--batch-size", type=int, default=5000)
+    dedupe.add_argument("--rebuild", action="store_true",
+                        help="forget earlier results and check every stored job again")
+    dedupe.set_defaults(func=cmd_dedupe, needs_api=False)
+
+    market = commands.add_parser("market", parents=[common, api, db], help=cmd_market.__doc__)
+    market.add_argument("--top", type=int, default=10, help="companies and locations to list")
+    market.add_argument("--months", type=int, default=12, help="months of salary history")
+    market.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    market.add_argument("--no-cache", action="store_true")
+    market.set_defaults(func=cmd_market, needs_api=True)
+
+    stats = commands.add_parser("stats", parents=[common, db, area], help=cmd_stats.__doc__)
+    stats.add_argument("--from", dest="date_from", help="YYYY-MM-DD")
+    stats.add_argument("--to", dest="date_to", help="YYYY-MM-DD (inclusive)")
+    stats.add_argument("--top", type=int, default=5, help="locations and companies to list")
+    stats.add_argument("--with-duplicates", action="store_true",
+                       help="include postings flagged as near-duplicates")
+    stats.set_defaults(func=cmd_stats, needs_api=False)
+
+    trends = commands.add_parser("trends", parents=[common], help=cmd_trends.__doc__)
+    trends.add_argument("--archive", dest="archive_dir", metavar="DIR",
+                        help="snapshot archive (default ADZUNA_ARCHIVE_DIR or adzuna_archive)")
+    trends.add_argument("--from", dest="date_from", help="YYYY-MM-DD")
+    trends.add_argument("--to", dest="date_to", help="YYYY-MM-DD (inclusive)")
+    trends.add_argument("-c", "--country", dest="archive_country",
+                        help="only these countries (comma-separated); one also formats salaries")
+    trends.add_argument("--period", choices=("day", "week", "month"), default="week")
+    trends.add_argument("--by", choices=("fetched", "created"), default="fetched",
+                        help="date rows by snapshot (every snapshot counts) or by posting "
+                             "(newest snapshot of each job)")
+    trends.add_argument("--top", type=int, default=5, help="locations and companies to list")
+    trends.set_defaults(func=cmd_trends, needs_api=False)
+
+    batch = commands.add_parser("batch", parents=[common, db], help=cmd_batch.__doc__)
+    batch.add_argument("manifest", help=".json/.ndjson/.csv list of queries")
+    batch.add_argument("--app-id", default=os.getenv("ADZUNA_APP_ID"))
+    batch.add_argument("--api-key", default=os.getenv("ADZUNA_API_KEY"))
+    batch.add_argument("--workers", type=int, default=4, help="queries run concurrently")
+    batch.add_argument("--page-workers", type=int, default=1, help="concurrent pages per query")
+    batch.add_argument("--per-minute", type=int, default=PER_MINUTE,
+                       help="requests per minute (0 = unlimited)")
+    batch.add_argument("--per-day", type=int, default=PER_DAY,
+                       help="requests per day still available (0 = unlimited)")
+    batch.add_argument("--max-wait", type=float, default=300,
+                       help="stop instead of waiting longer than this for quota (seconds)")
+    batch.add_argument("--checkpoint", help="default <manifest>.checkpoint.json")
+    batch.add_argument("--report", help="write per-query timings as JSON")
+    batch.add_argument("--no-cache", action="store_true")
+    batch.set_defaults(func=cmd_batch, needs_api=True)
+
+    watch = commands.add_parser("watch", parents=[common], help=cmd_watch.__doc__)
+    watch.add_argument("manifest", help=".json/.ndjson/.csv list of saved searches (as for batch)")
+    watch.add_argument("--app-id", default=os.getenv("ADZUNA_APP_ID"))
+    watch.add_argument("--api-key", default=os.getenv("ADZUNA_API_KEY"))
+    watch.add_argument("--every", type=float, default=15, help="minutes between runs of a search")
+    watch.add_argument("--jitter", type=float, default=0.1,
+                       help="randomise each interval by up to this fraction")
+    watch.add_argument("-o", "--output",
+                       help="append deltas to this NDJSON file (default: print them)")
+    watch.add_argument("--state", help="last seen jobs per search (default <manifest>.watch.json)")
+    watch.add_argument("--skip-initial", action="store_true",
+                       help="don't report the first run of a search without saved state")
+    watch.add_argument("--cycles", type=int, help="stop after this many runs of each search")
+    watch.add_argument("--page-workers", type=int, default=1, help="concurrent pages per search")
+    watch.add_argument("--per-minute", type=int, default=PER_MINUTE,
+                       help="requests per minute (0 = unlimited)")
+    watch.add_argument("--per-day", type=int, default=PER_DAY,
+                       help="requests per day (0 = unlimited)")
+    watch.add_argument("--max-wait", type=float, default=300,
+                       help="skip a run instead of waiting longer than this for quota (seconds)")
+    watch.set_defaults(func=cmd_watch, needs_api=True)
+
+    return parser
+
+
+def main(argv=None):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.needs_api and not (args.app_id and args.api_key):
+        parser.error("API credentials missing: set ADZUNA_APP_ID/ADZUNA_API_KEY or pass --app-id/--api-key")
+    if hasattr(args, "country"):
+        try:
+            args.countries = parse_countries(args.country)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.location is None:
+            args.location = DEFAULT_LOCATION if args.countries == [DEFAULT_COUNTRY] else ""
+    if getattr(args, "bbox", None):
+        from .geo_index import parse_box
+        try:
+            parse_box(args.bbox)
+        except ValueError as e:
+            parser.error(str(e))
+
+    from .errors import AdzunaAPIError
+    from .metrics import METRICS
+    if args.metrics:
+        METRICS.enable()
+    try:
+        return args.func(args)
+    except AdzunaAPIError as e:
+        log(f"Adzuna API error: {e}")
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if args.metrics:
+            METRICS.write(args.metrics)
+            log(METRICS.report(), args.quiet)
@@ -0,0 +1,420 @@
+"""
+Adzuna API client shared by the GUIs and the command line.
+
+All requests go through one pooled ``requests.Session`` per set of
+credentials, so connections are kept alive between pages and searches.
+Idempotent GETs are retried with jittered exponential backoff, and
+``Retry-After`` is honoured on 429/503 responses.
+
+Paginated search asks the first page for the total ``count``, plans the
+remaining pages and fetches them concurrently with a bounded worker pool.
+Search pages can be served from an optional ResponseCache, and every
+request (retries included) can be gated by a shared RateLimiter.
+
+Every result is tagged with the ``country`` endpoint it came from, and
+search_countries fans one search out over several country endpoints in
+parallel, merging the results. fetch_aggregate reaches the statistics
+endpoints (histogram, top_companies, geodata, history) through the same
+cache, retries and rate limiter; see analytics.py.
+
+Search methods return Adzuna's result dicts by default, which is what the
+job store and the response cache keep. With ``as_jobs=True`` they return
+Job records instead. When no cache entry is involved, get_jobs decodes
+the response bytes straight into Jobs (json_codec.decode_page) without
+building the dict tree first.
+"""
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import json_codec
+from .countries import DEFAULT_COUNTRY, get_country
+from .errors import AdzunaAPIError  # noqa: F401 (re-exported)
+from .job_record import parse_results
+from .metrics import METRICS
+from .rate_limit import Cancelled
+from .response_cache import cache_key, default_cache
+
+API_BASE = "https://api.adzuna.com/v1/api/jobs"
+
+# Adzuna caps results_per_page at 50
+MAX_RESULTS_PER_PAGE = 50
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_POOL_SIZE = 10
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 15)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def search_url(country=DEFAULT_COUNTRY, page=1, api_base=API_BASE):
+    """Build the search endpoint URL for a country and page number."""
+    return f"{api_base}/{country}/search/{page}"
+
+
+def aggregate_url(country=DEFAULT_COUNTRY, endpoint="histogram", api_base=API_BASE):
+    """Build the URL of an aggregate endpoint (histogram, top_companies, geodata, history)."""
+    return f"{api_base}/{country}/{endpoint}"
+
+
+def plan_pages(total_count, max_results, results_per_page=MAX_RESULTS_PER_PAGE):
+    """Return the page numbers needed to collect up to max_results jobs."""
+    wanted = min(total_count, max_results)
+    if wanted <= 0:
+        return []
+    return list(range(1, math.ceil(wanted / results_per_page) + 1))
+
+
+def retry_after_seconds(response):
+    """Parse a Retry-After header (seconds or HTTP date), or return None."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def tag_country(data, country):
+    """Mark each result in a search response with its country endpoint."""
+    for result in data.get('results', []):
+        result.setdefault('country', country)
+    return data
+
+
+def record_response(response, seconds):
+    """Count a response and split its time into waiting and body transfer."""
+    METRICS.incr("api_responses_total", status=response.status_code)
+    # requests' elapsed runs from sending the request until the headers arrive
+    elapsed = getattr(response, "elapsed", None)
+    wait = min(elapsed.total_seconds(), seconds) if isinstance(elapsed, timedelta) else seconds
+    METRICS.observe("stage_seconds", wait, stage="http_wait")
+    METRICS.observe("stage_seconds", seconds - wait, stage="http_transfer")
+
+
+class FanOutResult:
+    """Merged outcome of one search across several countries."""
+
+    def __init__(self, jobs, counts, errors):
+        self.jobs = jobs
+        self.counts = counts
+        self.errors = errors
+
+    def __repr__(self):
+        return f"FanOutResult(jobs={len(self.jobs)}, counts={self.counts}, errors={list(self.errors)})"
+
+
+class AdzunaClient:
+    """Pooled, retrying client for the Adzuna jobs API."""
+
+    def __init__(self, app_id, api_key, pool_size=DEFAULT_POOL_SIZE,
+                 timeout=DEFAULT_TIMEOUT, max_retries=DEFAULT_MAX_RETRIES,
+                 backoff=DEFAULT_BACKOFF, cache=None, rate_limiter=None, api_base=API_BASE):
+        self.app_id = app_id
+        self.api_key = api_key
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        # Overridable so benchmarks can point at a local stand-in server
+        self.api_base = api_base
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def backoff_delay(self, attempt, response=None):
+        """Seconds to wait before retry number attempt (0-based)."""
+        retry_after = retry_after_seconds(response)
+        if retry_after is not None:
+            return min(retry_after, MAX_BACKOFF)
+        # Full jitter keeps concurrent workers from retrying in lockstep
+        return random.uniform(0, min(MAX_BACKOFF, self.backoff * (2 ** attempt)))
+
+    def get_json(self, url, params=None, cancel_event=None):
+        """GET a URL with credentials attached and return the decoded JSON.
+
+        Raises AdzunaAPIError once retries are exhausted or on a
+        non-retryable error response. Setting cancel_event interrupts a
+        rate limiter wait (see RateLimiter.acquire).
+        """
+        # Decode the raw bytes ourselves; requests' .json() goes via stdlib json
+        return self._get(url, params, json_codec.loads, lambda response: response.json(),
+                         cancel_event)
+
+    def get_jobs(self, url, country, params=None, cancel_event=None):
+        """GET a search page and decode it straight into {'count', 'results': [Job]}.
+
+        Each job without a ``country`` is tagged with country. Errors as get_json.
+        """
+        def from_dicts(response):
+            page = tag_country(response.json(), country)
+            return dict(page, results=parse_results(page.get('results', [])))
+
+        return self._get(url, params, lambda content: json_codec.decode_page(content, country),
+                         from_dicts, cancel_event)
+
+    def _get(self, url, params, decode, decode_response, cancel_event=None):
+        """GET with retries; decode(body bytes), or decode_response(response) if not bytes."""
+        params = dict(params or {}, app_id=self.app_id, app_key=self.api_key)
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(cancel_event)
+            METRICS.incr("api_requests_total")
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except requests.RequestException as e:
+                # Connection errors, timeouts, truncated or undecodable bodies, redirect loops
+                if last_attempt:
+                    raise AdzunaAPIError(f"Request failed: {e}") from e
+                METRICS.incr("api_retries_total")
+                time.sleep(self.backoff_delay(attempt))
+                continue
+            if METRICS.enabled:
+                record_response(response, time.perf_counter() - start)
+
+            if response.status_code in RETRY_STATUSES and not last_attempt:
+                METRICS.incr("api_retries_total")
+                time.sleep(self.backoff_delay(attempt, response))
+                continue
+
+            try:
+                response.raise_for_status()
+                with METRICS.timer("decode"):
+                    content = response.content
+                    if isinstance(content, bytes):
+                        return decode(content)
+                    return decode_response(response)
+            except requests.HTTPError as e:
+                raise AdzunaAPIError(f"HTTP {response.status_code}: {e}",
+                                     status_code=response.status_code) from e
+            except ValueError as e:
+                raise AdzunaAPIError(f"Invalid JSON response: {e}") from e
+
+    def fetch_page(self, search_term="python", location="UK", page=1,
+                   results_per_page=MAX_RESULTS_PER_PAGE, country=DEFAULT_COUNTRY,
+                   filters=None, use_cache=True, as_jobs=False, cancel_event=None):
+        """Fetch a single search page and return the decoded response.
+
+        filters are extra Adzuna query parameters (sort_by, max_days_old...).
+        With use_cache=False the cache is bypassed but still refreshed.
+        With as_jobs=True the response's results are Job records.
+        Setting cancel_event while waiting on the rate limiter raises Cancelled.
+        """
+        country = get_country(country).code
+        params = dict(filters or {})
+        params.update({
+            "what": search_term,
+            "results_per_page": results_per_page,
+        })
+        # A blank location searches the whole country
+        if location:
+            params["where"] = location
+
+        key = None
+        if self.cache is not None:
+            key = cache_key(country, search_term, location, page,
+                            dict(filters or {}, results_per_page=results_per_page))
+            if use_cache:
+                data = self.cache.get(key)
+                if data is not None:
+                    return self._page_result(tag_country(data, country), as_jobs)
+
+        url = search_url(country, page, self.api_base)
+        if as_jobs and key is None:
+            # Nothing to cache, so skip the dicts entirely
+            return self.get_jobs(url, country, params, cancel_event)
+        data = tag_country(self.get_json(url, params, cancel_event), country)
+        if key is not None:
+            self.cache.put(key, data)
+        return self._page_result(data, as_jobs)
+
+    @staticmethod
+    def _page_result(data, as_jobs):
+        """A decoded search page, with its results parsed into Jobs if as_jobs."""
+        if not as_jobs:
+            return data
+        return dict(data, results=parse_results(data.get('results', [])))
+
+    def fetch_aggregate(self, endpoint, country=DEFAULT_COUNTRY, params=None, use_cache=True):
+        """Fetch one aggregate endpoint and return the decoded response.
+
+        params are its Adzuna query parameters (what, where, months...).
+        Cached like search pages, keyed by endpoint instead of page number.
+        """
+        country = get_country(country).code
+        params = dict(params or {})
+        key = None
+        if self.cache is not None:
+            filters = {k: v for k, v in params.items() if k not in ("what", "where")}
+            key = cache_key(country, params.get("what"), params.get("where"), endpoint, filters)
+            if use_cache:
+                data = self.cache.get(key)
+                if data is not None:
+                    return data
+
+        data = self.get_json(aggregate_url(country, endpoint, self.api_base), params)
+        if key is not None:
+            self.cache.put(key, data)
+        return data
+
+    def search(self, search_term="python", location="UK", max_results=50,
+               results_per_page=MAX_RESULTS_PER_PAGE, max_workers=DEFAULT_MAX_WORKERS,
+               country=DEFAULT_COUNTRY, filters=None, use_cache=True,
+               on_page=None, cancel_event=None, as_jobs=False):
+        """Fetch up to max_results jobs across as many pages as needed.
+
+        Page 1 is fetched first to learn the total count; the rest of the
+        planned pages are fetched concurrently and merged back in page order.
+        Merging stops at the first short page or once max_results is reached.
+
+        on_page(page_jobs, pages_done, total_pages) is called for each page
+        in page order as soon as it and all earlier pages have arrived.
+        Setting cancel_event stops the search and returns the jobs so far.
+        With as_jobs=True the jobs are Job records instead of result dicts.
+        """
+        results_per_page = max(1, min(results_per_page, max_results, MAX_RESULTS_PER_PAGE))
+
+        def cancelled():
+            return cancel_event is not None and cancel_event.is_set()
+
+        try:
+            first = self.fetch_page(search_term, location, 1, results_per_page, country,
+                                    filters, use_cache, as_jobs, cancel_event)
+        except Cancelled:
+            return []
+        jobs = list(first.get('results', []))[:max_results]
+        total_count = first.get('count', len(jobs))
+
+        pages = plan_pages(total_count, max_results, results_per_page)[1:]
+        if len(jobs) < results_per_page:
+            pages = []
+        if on_page:
+            on_page(list(jobs), 1, len(pages) + 1)
+        if not pages or cancelled():
+            return jobs
+
+        workers = max(1, min(max_workers, self.pool_size, len(pages)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self.fetch_page, search_term, location,
+                            page, results_per_page, country, filters, use_cache, as_jobs,
+                            cancel_event)
+                for page in pages
+            ]
+            try:
+                # Walk futures in submission order so results stay in page order
+                for done, future in enumerate(futures, 2):
+                    if cancelled():
+                        break
+                    try:
+                        page_jobs = future.result().get('results', [])
+                    except Cancelled:
+                        break
+                    page_jobs = page_jobs[:max_results - len(jobs)]
+                    jobs.extend(page_jobs)
+                    if on_page:
+                        on_page(page_jobs, done, len(pages) + 1)
+                    if len(jobs) >= max_results or len(page_jobs) < results_per_page:
+                        break
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        return jobs
+
+    def search_countries(self, countries, search_term="python", location="", max_results=50,
+                         results_per_page=MAX_RESULTS_PER_PAGE, max_workers=DEFAULT_MAX_WORKERS,
+                         filters=None, use_cache=True, on_page=None, cancel_event=None,
+                         as_jobs=False):
+        """Run the same search against several country endpoints in parallel.
+
+        max_results applies per country. Jobs are merged in the order the
+        countries are given, each tagged with its ``country``. A country
+        that fails is reported in the result's errors rather than aborting
+        the others. on_page(country, page_jobs, pages_done, total_pages) is
+        called from worker threads.
+        """
+        countries = [get_country(code).code for code in countries]
+
+        def run(country):
+            page_callback = None
+            if on_page:
+                def page_callback(page_jobs, pages_done, total_pages):
+                    on_page(country, page_jobs, pages_done, total_pages)
+            # Countries run concurrently, so each fetches its own pages serially
+            return self.search(search_term, location, max_results, results_per_page,
+                               max_workers=1, country=country, filters=filters,
+                               use_cache=use_cache, on_page=page_callback,
+                               cancel_event=cancel_event, as_jobs=as_jobs)
+
+        jobs, counts, errors = [], {}, {}
+        workers = max(1, min(max_workers, self.pool_size, len(countries)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(country, pool.submit(run, country)) for country in countries]
+            for country, future in futures:
+                try:
+                    country_jobs = future.result()
+                except AdzunaAPIError as e:
+                    errors[country] = e
+                    continue
+                counts[country] = len(country_jobs)
+                jobs.extend(country_jobs)
+        return FanOutResult(jobs, counts, errors)
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(app_id, api_key, **kwargs):
+    """Return the shared client for a set of credentials and settings, creating it once.
+
+    kwargs are AdzunaClient options and part of the key, so callers asking
+    for different settings (max_retries, cache, rate_limiter...) get their
+    own client instead of whichever was created first. Unless a cache is
+    passed explicitly, the environment-configured response cache (see
+    response_cache.default_cache) is used.
+    """
+    key = (app_id, api_key, tuple(sorted(kwargs.items())))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            kwargs.setdefault("cache", default_cache())
+            client = AdzunaClient(app_id, api_key, **kwargs)
+            _clients[key] = client
+        return client
+
+
+def fetch_jobs_paginated(app_id, api_key, search_term="python", location="UK",
+                         max_results=50, results_per_page=MAX_RESULTS_PER_PAGE,
+                         max_workers=DEFAULT_MAX_WORKERS, country=DEFAULT_COUNTRY):
+    """Paginated search through the shared client for these credentials."""
+    return get_client(app_id, api_key).search(
+        search_term, location, max_results=max_results,
+        results_per_page=results_per_page, max_workers=max_workers, country=country,
+    )
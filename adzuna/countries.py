@@ -0,0 +1,82 @@
+"""
+Adzuna country endpoints with their currency and number formatting.
+
+Salaries come back in the local currency of the country endpoint that
+returned them, so results are tagged with their country code and
+formatted with that country's symbol, digit grouping and symbol order.
+Amounts are not converted between currencies.
+"""
+
+
+class Country:
+    """An Adzuna country endpoint and how to display its salaries."""
+
+    __slots__ = ('code', 'name', 'currency', 'symbol', 'thousands', 'pattern')
+
+    def __init__(self, code, name, currency, symbol, thousands=',', pattern='{symbol}{amount}'):
+        self.code = code
+        self.name = name
+        self.currency = currency
+        self.symbol = symbol
+        self.thousands = thousands
+        self.pattern = pattern
+
+    def format_amount(self, amount):
+        """Whole-unit amount in local style, e.g. '£55,000' or '55.000 €'."""
+        digits = f"{amount:,.0f}".replace(',', self.thousands)
+        return self.pattern.format(symbol=self.symbol, amount=digits)
+
+    def __repr__(self):
+        return f"Country({self.code!r}, {self.currency})"
+
+
+COUNTRIES = {country.code: country for country in (
+    Country('gb', 'United Kingdom', 'GBP', '£'),
+    Country('us', 'United States', 'USD', '$'),
+    Country('ca', 'Canada', 'CAD', 'C$'),
+    Country('au', 'Australia', 'AUD', 'A$'),
+    Country('nz', 'New Zealand', 'NZD', 'NZ$'),
+    Country('sg', 'Singapore', 'SGD', 'S$'),
+    Country('in', 'India', 'INR', '₹'),
+    Country('mx', 'Mexico', 'MXN', 'MX$'),
+    Country('za', 'South Africa', 'ZAR', 'R', ' ', '{symbol} {amount}'),
+    Country('br', 'Brazil', 'BRL', 'R$', '.', '{symbol} {amount}'),
+    Country('de', 'Germany', 'EUR', '€', '.', '{amount} {symbol}'),
+    Country('at', 'Austria', 'EUR', '€', '.', '{symbol} {amount}'),
+    Country('be', 'Belgium', 'EUR', '€', '.', '{amount} {symbol}'),
+    Country('es', 'Spain', 'EUR', '€', '.', '{amount} {symbol}'),
+    Country('fr', 'France', 'EUR', '€', ' ', '{amount} {symbol}'),
+    Country('it', 'Italy', 'EUR', '€', '.', '{amount} {symbol}'),
+    Country('nl', 'Netherlands', 'EUR', '€', '.', '{symbol} {amount}'),
+    Country('pl', 'Poland', 'PLN', 'zł', ' ', '{amount} {symbol}'),
+    Country('ch', 'Switzerland', 'CHF', 'CHF', '’', '{symbol} {amount}'),
+)}
+
+DEFAULT_COUNTRY = 'gb'
+
+
+def get_country(code):
+    """Country for an Adzuna code (case-insensitive); ValueError if unknown."""
+    country = COUNTRIES.get((code or '').strip().lower())
+    if country is None:
+        raise ValueError(f"Unknown Adzuna country {code!r}; expected one of "
+                         f"{', '.join(sorted(COUNTRIES))}")
+    return country
+
+
+def parse_countries(text):
+    """'gb, us,DE' -> ['gb', 'us', 'de'], validated and de-duplicated."""
+    codes = []
+    for part in (text or '').split(','):
+        if part.strip():
+            code = get_country(part).code
+            if code not in codes:
+                codes.append(code)
+    return codes or [DEFAULT_COUNTRY]
+
+
+def format_salary(amount, country=None):
+    """Salary in the given country's currency style, or 'N/A' if missing."""
+    if not amount:
+        return "N/A"
+    return COUNTRIES.get(country or DEFAULT_COUNTRY, COUNTRIES[DEFAULT_COUNTRY]).format_amount(amount)
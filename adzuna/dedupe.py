@@ -0,0 +1,210 @@
+"""
+Near-duplicate detection for stored postings with MinHash and LSH.
+
+Agencies repost the same role with slightly different titles and
+descriptions. Each posting's title and description are split into word
+shingles (3 consecutive tokens); the Jaccard similarity of two postings'
+shingle sets is estimated from compact MinHash signatures, and LSH
+banding puts postings whose signatures agree on a whole band into the
+same bucket, so only bucket-mates are ever compared instead of every
+pair.
+
+Signatures use one-permutation hashing: every shingle is hashed once
+and lands in one of NUM_PERM bins, each bin keeping its minimum; empty
+bins borrow from the next non-empty bin (rotation densification). That
+gives the same estimator as NUM_PERM independent permutations at the
+cost of one hash per shingle, which is what makes pure-Python signatures
+fast enough for a 200k-posting backlog.
+
+The first posting seen in a cluster is canonical; later ones get
+``duplicate_of`` set to its id in the job store. Signatures and bucket
+entries are stored alongside the jobs, so each new fetch is checked
+against everything stored before it without recomputing anything.
+"""
+
+import hashlib
+import operator
+import time
+import zlib
+from array import array
+from collections import defaultdict
+
+from .job_record import as_dict
+from .job_store import BATCH_SIZE, job_id
+from .text_index import tokenize
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+# Estimated Jaccard similarity at which postings count as duplicates
+DEFAULT_THRESHOLD = 0.6
+# Candidates compared per bucket; caps the cost of huge boilerplate buckets
+MAX_BUCKET_MEMBERS = 50
+
+_EMPTY = 1 << 64
+_MASK32 = 0xFFFFFFFF
+# Added per rotation step so borrowed values differ from the bin they came from
+_ROTATION = 0x9E3779B1
+
+
+def job_text(job):
+    """Title and description of a raw result dict."""
+    return f"{job.get('title') or ''} {job.get('description') or ''}"
+
+
+def shingle_hashes(text, size=SHINGLE_SIZE):
+    """Stable 64-bit hashes of the word shingles in text."""
+    tokens = tokenize(text)
+    if len(tokens) < size:
+        grams = [' '.join(tokens)] if tokens else []
+    else:
+        grams = {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    return [int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=8).digest(), 'little')
+            for g in grams]
+
+
+def signature(hashes, num_perm=NUM_PERM):
+    """MinHash signature (array of 32-bit ints) of shingle hashes, or None if empty."""
+    if not hashes:
+        return None
+    bins = [_EMPTY] * num_perm
+    for h in hashes:
+        slot = h % num_perm
+        value = h // num_perm
+        if value < bins[slot]:
+            bins[slot] = value
+    sig = array('I', bytes(4 * num_perm))
+    for i, value in enumerate(bins):
+        step = 0
+        while value == _EMPTY:
+            step += 1
+            value = bins[(i + step) % num_perm]
+        sig[i] = (value + step * _ROTATION) & _MASK32
+    return sig
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of two signatures."""
+    if not a or not b:
+        return 0.0
+    return sum(map(operator.eq, a, b)) / len(a)
+
+
+def band_keys(sig, bands=BANDS):
+    """One LSH bucket key per band: band number in the high bits, band hash in the low."""
+    rows = len(sig) // bands
+    return [(band << 32) | zlib.crc32(sig[band * rows:(band + 1) * rows].tobytes())
+            for band in range(bands)]
+
+
+class DedupeResult:
+    """Outcome of checking a set of postings."""
+
+    def __init__(self):
+        self.checked = 0
+        self.duplicates = {}  # duplicate id -> (canonical id, similarity)
+        self.seconds = 0.0
+
+    def merge(self, other):
+        self.checked += other.checked
+        self.duplicates.update(other.duplicates)
+        self.seconds += other.seconds
+
+    def __repr__(self):
+        return f"DedupeResult(checked={self.checked}, duplicates={len(self.duplicates)})"
+
+
+class Deduplicator:
+    """Flags near-duplicate postings in a JobStore as they are stored."""
+
+    def __init__(self, store, threshold=DEFAULT_THRESHOLD):
+        self.store = store
+        self.threshold = threshold
+
+    def process(self, jobs):
+        """Check stored jobs (Jobs or raw dicts) not seen before against the store.
+
+        Jobs must already be upserted; those with a signature are skipped,
+        so a re-fetched posting keeps its original verdict. Signatures are
+        computed outside the store's dedupe_lock; looking up, matching and
+        saving them happen under it, so two near-duplicates stored from
+        different threads can't both end up canonical.
+        """
+        start = time.perf_counter()
+        result = DedupeResult()
+        entries = {}
+        for job in jobs:
+            job = as_dict(job)
+            id_ = job_id(job)
+            if id_ and id_ not in entries:
+                entries[id_] = job
+        for id_ in self.store.signed_ids(entries):
+            del entries[id_]
+        if not entries:
+            return result
+
+        signed = []
+        for id_, job in entries.items():
+            sig = signature(shingle_hashes(job_text(job)))
+            signed.append((id_, sig, band_keys(sig) if sig is not None else ()))
+
+        with self.store.dedupe_lock:
+            # Another thread may have signed some of them meanwhile
+            done = self.store.signed_ids(entries)
+            if done:
+                signed = [entry for entry in signed if entry[0] not in done]
+            self._match(signed, result)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _match(self, signed, result):
+        """Match (id, signature, band keys) against the store and save them (under dedupe_lock)."""
+        members = self.store.bucket_members({key for _, _, keys in signed for key in keys})
+        stored = self.store.signatures({other for ids in members.values()
+                                        for other in ids[:MAX_BUCKET_MEMBERS]})
+        local_buckets = defaultdict(list)
+        local = {}
+        duplicates = []
+        for id_, sig, keys in signed:
+            best, best_score = None, 0.0
+            seen = set()
+            for key in keys:
+                bucket = members.get(key, [])[:MAX_BUCKET_MEMBERS] + local_buckets[key][:MAX_BUCKET_MEMBERS]
+                for other in bucket:
+                    if other in seen:
+                        continue
+                    seen.add(other)
+                    other_sig = local[other][0] if other in local else stored.get(other, (None,))[0]
+                    score = similarity(sig, other_sig)
+                    if score > best_score:
+                        best, best_score = other, score
+            canonical = None
+            if best is not None and best_score >= self.threshold:
+                canonical = (local[best][1] if best in local else stored[best][1]) or best
+                duplicates.append((canonical, id_))
+                result.duplicates[id_] = (canonical, best_score)
+            local[id_] = (sig, canonical)
+            for key in keys:
+                local_buckets[key].append(id_)
+
+        self.store.save_dedupe(
+            [(id_, sig.tobytes() if sig is not None else b'') for id_, sig, _ in signed],
+            [(key, id_) for id_, _, keys in signed for key in keys],
+            duplicates)
+        result.checked = len(signed)
+
+    def backlog(self, batch_size=BATCH_SIZE, on_batch=None, cancel_event=None):
+        """Check every stored job without a signature, oldest first.
+
+        on_batch(result_so_far) is called after each batch.
+        """
+        total = DedupeResult()
+        while not (cancel_event is not None and cancel_event.is_set()):
+            jobs = self.store.unsigned_jobs(batch_size)
+            if not jobs:
+                break
+            total.merge(self.process(jobs))
+            if on_batch is not None:
+                on_batch(total)
+        return total
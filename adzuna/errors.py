@@ -0,0 +1,9 @@
+"""Exceptions shared across the adzuna package (kept free of heavy imports)."""
+
+
+class AdzunaAPIError(Exception):
+    """Raised when a request to the Adzuna API fails after all retries."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
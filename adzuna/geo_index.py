@@ -0,0 +1,221 @@
+"""
+Grid index over job coordinates for radius and bounding-box filters.
+
+Adzuna results carry ``latitude``/``longitude``. GeoIndex buckets job
+positions (indices in load order, as in text_index.TextIndex) into
+CELL_DEGREES-wide latitude/longitude cells as jobs are added. A query
+only visits the cells overlapping its area: cells entirely inside a
+radius are taken whole, and only jobs in boundary cells have their
+great-circle distance computed. Jobs without coordinates never match.
+
+A query's centre may be "lat,lon" or a place name; names are resolved
+against the loaded jobs themselves (the centroid of jobs whose location
+or area matches), so no geocoding service is needed.
+"""
+
+import math
+from array import array
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_MILE = 1.609344
+# About 11 km north-south; small enough that most of a city-sized radius is whole cells
+CELL_DEGREES = 0.1
+# Longitude cells around the globe
+_LON_CELLS = round(360 / CELL_DEGREES)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km between two points in degrees."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def to_km(distance, unit='mi'):
+    """Distance in km from miles ('mi') or km ('km')."""
+    if unit == 'mi':
+        return distance * KM_PER_MILE
+    if unit == 'km':
+        return distance
+    raise ValueError(f"Unknown distance unit {unit!r}; expected 'mi' or 'km'")
+
+
+def parse_box(text):
+    """'south,west,north,east' (degrees) -> tuple of floats; ValueError if malformed."""
+    try:
+        south, west, north, east = (float(part) for part in text.split(','))
+    except ValueError:
+        raise ValueError(f"Bounding box must be south,west,north,east: {text!r}") from None
+    if not (-90 <= south <= north <= 90 and -180 <= west <= 180 and -180 <= east <= 180):
+        raise ValueError(f"Bounding box out of range: {text!r}")
+    return south, west, north, east
+
+
+def _cell_row(lat):
+    return math.floor(lat / CELL_DEGREES)
+
+
+def _cell_column(lon):
+    return math.floor(lon / CELL_DEGREES) % _LON_CELLS
+
+
+class GeoIndex:
+    """(lat cell, lon cell) -> job positions, for the given jobs' coordinates."""
+
+    def __init__(self, jobs=()):
+        self.cells = {}
+        self.latitudes = array('d')
+        self.longitudes = array('d')
+        self.size = 0
+        self._places = None
+        self._jobs = []
+        self.add(jobs)
+
+    def add(self, jobs):
+        """Index jobs as the next positions in load order."""
+        cells = self.cells
+        position = self.size
+        for job in jobs:
+            lat, lon = job.latitude, job.longitude
+            if lat is None or lon is None or not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                lat = lon = math.nan
+            else:
+                key = (_cell_row(lat), _cell_column(lon))
+                cell = cells.get(key)
+                if cell is None:
+                    cells[key] = [position]
+                else:
+                    cell.append(position)
+            self.latitudes.append(lat)
+            self.longitudes.append(lon)
+            self._jobs.append(job)
+            position += 1
+        if position != self.size:
+            self.size = position
+            self._places = None
+
+    def clear(self):
+        self.cells = {}
+        self.latitudes = array('d')
+        self.longitudes = array('d')
+        self.size = 0
+        self._places = None
+        self._jobs = []
+
+    def __len__(self):
+        return self.size
+
+    # ----- Places -----
+    def places(self):
+        """Casefolded location/area name -> (mean lat, mean lon) of its jobs (lazy)."""
+        if self._places is None:
+            sums = {}
+            for job, lat, lon in zip(self._jobs, self.latitudes, self.longitudes):
+                if math.isnan(lat):
+                    continue
+                names = {name.casefold() for name in (job.location, *job.area) if name}
+                for name in names:
+                    total = sums.get(name)
+                    if total is None:
+                        sums[name] = [lat, lon, 1]
+                    else:
+                        total[0] += lat
+                        total[1] += lon
+                        total[2] += 1
+            self._places = {name: (lat / n, lon / n) for name, (lat, lon, n) in sums.items()}
+        return self._places
+
+    def locate(self, text):
+        """(lat, lon) for 'lat,lon' or a place name among the loaded jobs.
+
+        Raises ValueError if text is neither.
+        """
+        parts = text.split(',')
+        if len(parts) == 2:
+            try:
+                lat, lon = float(parts[0]), float(parts[1])
+            except ValueError:
+                pass
+            else:
+                if -90 <= lat <= 90 and -180 <= lon <= 180:
+                    return lat, lon
+                raise ValueError(f"Coordinates out of range: {text!r}")
+        point = self.places().get(text.strip().casefold())
+        if point is None:
+            raise ValueError(f"No loaded job is located in {text.strip()!r}")
+        return point
+
+    # ----- Queries -----
+    def _cells_in(self, south, north, west, east):
+        """Cell keys overlapping a box; west > east wraps across the antimeridian."""
+        rows = range(_cell_row(max(-90.0, south)), _cell_row(min(90.0, north)) + 1)
+        if east - west >= 360 - CELL_DEGREES:
+            columns = range(_LON_CELLS)
+        else:
+            # Columns are modular, so walk east from west's column to east's
+            first = _cell_column(west)
+            span = (_cell_column(east) - first) % _LON_CELLS
+            columns = [(first + step) % _LON_CELLS for step in range(span + 1)]
+        cells = self.cells
+        if len(rows) * len(columns) > len(cells):
+            # A wide area: cheaper to check the occupied cells than to probe every one
+            columns = set(columns)
+            for key in list(cells):
+                if key[0] in rows and key[1] in columns:
+                    yield key
+            return
+        for row in rows:
+            for column in columns:
+                key = (row, column)
+                if key in cells:
+                    yield key
+
+    def within_box(self, south, west, north, east):
+        """Ascending positions inside a box (degrees; west > east crosses 180)."""
+        lats, lons = self.latitudes, self.longitudes
+        wraps = west > east
+        matches = []
+        for key in self._cells_in(south, north, west, east):
+            for i in self.cells[key]:
+                lon = lons[i]
+                if south <= lats[i] <= north and ((lon >= west or lon <= east) if wraps
+                                                  else west <= lon <= east):
+                    matches.append(i)
+        matches.sort()
+        return matches
+
+    def within_radius(self, lat, lon, radius_km):
+        """Ascending positions within radius_km of (lat, lon)."""
+        dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+        south, north = lat - dlat, lat + dlat
+        if south <= -90 or north >= 90:
+            west, east = -180.0, 180.0
+        else:
+            # Widest longitude span of the circle, at its poleward edge
+            dlon = math.degrees(radius_km / (EARTH_RADIUS_KM * math.cos(math.radians(
+                max(abs(south), abs(north))))))
+            west, east = lon - dlon, lon + dlon
+            if dlon >= 180:
+                west, east = -180.0, 180.0
+            else:
+                west = west + 360 if west < -180 else west
+                east = east - 360 if east > 180 else east
+        lats, lons = self.latitudes, self.longitudes
+        matches = []
+        for key in self._cells_in(south, north, west, east):
+            members = self.cells[key]
+            row, column = key
+            cell_south, cell_west = row * CELL_DEGREES, column * CELL_DEGREES
+            corners = ((cell_south, cell_west), (cell_south, cell_west + CELL_DEGREES),
+                       (cell_south + CELL_DEGREES, cell_west),
+                       (cell_south + CELL_DEGREES, cell_west + CELL_DEGREES))
+            if all(haversine_km(lat, lon, a, b) <= radius_km for a, b in corners):
+                matches.extend(members)
+                continue
+            for i in members:
+                if haversine_km(lat, lon, lats[i], lons[i]) <= radius_km:
+                    matches.append(i)
+        matches.sort()
+        return matches
@@ -0,0 +1,142 @@
+"""
+Incremental sync: only pull postings that are new since the last run.
+
+Searches are requested newest-first (``sort_by=date``) and limited with
+``max_days_old`` derived from the previous run's high-water mark. Pages
+are walked in order and paging stops at the first posting older than the
+mark (or one already seen at the mark), so a recurring search usually
+costs one or two API calls instead of the whole result set.
+
+The mark only moves once a walk is complete: it reached the previous
+mark or ran out of results. A walk cut short by ``max_results`` or
+``cancel_event`` keeps the old mark and records the ids it fetched as
+already seen, so the next run skips them and resumes the walk down to
+the mark instead of leaving a gap. A first run (no mark yet) counts as
+complete when ``max_results`` stops it, since the cap, like
+``max_days_old``, is what bounds the initial backfill.
+"""
+
+import math
+import time
+from datetime import datetime, timezone
+
+from .client import DEFAULT_COUNTRY, MAX_RESULTS_PER_PAGE
+from .job_store import job_id
+from .rate_limit import Cancelled
+from .response_cache import normalize
+
+
+class SyncResult:
+    """Outcome of one incremental sync."""
+
+    def __init__(self, new_jobs, pages_fetched, reached_known, complete=True):
+        self.new_jobs = new_jobs
+        self.pages_fetched = pages_fetched
+        self.reached_known = reached_known
+        # False if max_results or cancel_event stopped the walk above the mark
+        self.complete = complete
+
+    def __repr__(self):
+        return (f"SyncResult(new={len(self.new_jobs)}, pages={self.pages_fetched}, "
+                f"reached_known={self.reached_known}, complete={self.complete})")
+
+
+def search_key(search_term, location, country=DEFAULT_COUNTRY):
+    """Identity of a recurring search for its sync state."""
+    return "|".join(str(normalize(part)) for part in (country, search_term, location))
+
+
+def days_since(created):
+    """Whole days (rounded up, at least 1) since an Adzuna ``created`` stamp."""
+    try:
+        then = datetime.fromisoformat(created.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    if then.tzinfo is None:
+        then = then.replace(tzinfo=timezone.utc)
+    age = time.time() - then.timestamp()
+    return max(1, math.ceil(age / 86400))
+
+
+def sync_search(client, store, search_term="python", location="UK",
+                country=DEFAULT_COUNTRY, max_results=1000, max_days_old=None,
+                results_per_page=MAX_RESULTS_PER_PAGE, on_page=None, cancel_event=None):
+    """Fetch postings newer than the last sync of this search and store them.
+
+    max_days_old bounds the very first run; later runs derive it from the
+    stored high-water mark. on_page(new_jobs, pages_done) is called per page.
+    """
+    key = search_key(search_term, location, country)
+    state = store.get_sync_state(key)
+    high_water, edge_ids = state if state else (None, set())
+
+    filters = {"sort_by": "date"}
+    window = days_since(high_water) if high_water else max_days_old
+    if window:
+        filters["max_days_old"] = window
+
+    new_jobs = []
+    # (created, id) of every posting above the mark, including ones skipped as seen
+    walked = []
+    pages_fetched = 0
+    reached_known = False
+    exhausted = cancelled = False
+    page = 1
+    results_per_page = max(1, min(results_per_page, MAX_RESULTS_PER_PAGE))
+
+    while len(new_jobs) < max_results:
+        if cancel_event is not None and cancel_event.is_set():
+            cancelled = True
+            break
+        # The cache would hide postings that appeared since it was filled
+        try:
+            data = client.fetch_page(search_term, location, page, results_per_page, country,
+                                     filters, use_cache=False, cancel_event=cancel_event)
+        except Cancelled:
+            cancelled = True
+            break
+        pages_fetched += 1
+        page_jobs = data.get('results', [])
+
+        fresh = []
+        room = max_results - len(new_jobs)
+        full = False
+        for job in page_jobs:
+            created = job.get('created') or ''
+            if high_water and created < high_water:
+                reached_known = True
+                break
+            # Ties at the mark and postings an interrupted run already fetched
+            if job_id(job) not in edge_ids:
+                if len(fresh) == room:
+                    full = True
+                    break
+                fresh.append(job)
+            walked.append((created, job_id(job)))
+
+        new_jobs.extend(fresh)
+        store.upsert_jobs(fresh)
+        if on_page:
+            on_page(fresh, pages_fetched)
+
+        if full:
+            break
+        if reached_known or len(page_jobs) < results_per_page:
+            exhausted = not reached_known
+            break
+        page += 1
+
+    complete = reached_known or exhausted or (high_water is None and not cancelled)
+    if not complete:
+        # Resume point: keep the mark, remember what was fetched above it
+        if new_jobs:
+            store.set_sync_state(key, high_water, edge_ids | {job_id(job) for job in new_jobs})
+    elif walked:
+        newest = max(created for created, _ in walked)
+        if not high_water or newest > high_water:
+            high_water = newest
+            edge_ids = set()
+        edge_ids |= {i for created, i in walked if created == high_water}
+        store.set_sync_state(key, high_water, edge_ids)
+
+    return SyncResult(new_jobs, pages_fetched, reached_known, complete)
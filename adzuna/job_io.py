@@ -0,0 +1,221 @@
+"""
+Streaming export and import of job lists.
+
+Writers emit one job at a time, so saving never builds the whole output
+in memory; readers parse incrementally and yield jobs one by one. Any
+path ending in ``.gz`` is transparently gzip-compressed.
+
+Writers accept Job records or raw result dicts; readers yield raw dicts.
+Formats are chosen by extension: ``.json`` (a JSON array, as written by
+the original save_to_json), ``.ndjson`` / ``.jsonl`` (one job per line)
+and ``.csv`` (projected onto the results table columns).
+"""
+
+import csv
+import gzip
+import json
+
+from . import json_codec
+from .job_record import as_dict, as_job
+from .metrics import METRICS
+
+READ_CHUNK = 1 << 16
+
+
+def _blank(value):
+    return '' if value is None else value
+
+
+# CSV column -> value extractor over a job_record.Job; mirrors the results table
+CSV_COLUMNS = {
+    'Date': lambda job: job.created_date,
+    'Title': lambda job: job.title,
+    'Company': lambda job: _blank(job.company),
+    'Location': lambda job: _blank(job.location),
+    'Country': lambda job: _blank(job.country),
+    'Currency': lambda job: job.currency,
+    'Type': lambda job: _blank(job.contract_type),
+    'Salary Min': lambda job: _blank(job.salary_min),
+    'Salary Max': lambda job: _blank(job.salary_max),
+    'Category': lambda job: _blank(job.category),
+    'Skills': lambda job: ', '.join(job.skills or ()),
+    'Score': lambda job: _blank(job.score),
+    'Link': lambda job: job.redirect_url,
+}
+DEFAULT_CSV_COLUMNS = ('Date', 'Title', 'Company', 'Location', 'Type', 'Salary Max', 'Link')
+# With skill extraction (skills.py)
+SKILL_CSV_COLUMNS = ('Date', 'Score', 'Category', 'Title', 'Company', 'Location', 'Type',
+                     'Salary Max', 'Skills', 'Link')
+
+
+def open_text(path, mode):
+    """Open a text file for 'r' or 'w', gzip-compressed if it ends in .gz."""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='')
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def file_format(path):
+    """'json', 'ndjson' or 'csv' from a file name."""
+    name = path[:-3] if path.endswith('.gz') else path
+    if name.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if name.endswith('.csv'):
+        return 'csv'
+    return 'json'
+
+
+# ----- Writers -----
+def write_json(jobs, path, indent=4):
+    """Write jobs as a JSON array, one element at a time. Returns the count."""
+    count = 0
+    separator = ',\n' if indent is not None else ', '
+    pad = ' ' * indent if indent else ''
+    with open_text(path, 'w') as f:
+        f.write('[')
+        for job in jobs:
+            text = json.dumps(as_dict(job), ensure_ascii=False, indent=indent)
+            if pad:
+                # Nest the element one level in, matching json.dump(list, indent=...)
+                text = pad + text.replace('\n', '\n' + pad)
+            f.write((separator if count else ('\n' if indent is not None else '')) + text)
+            count += 1
+        f.write('\n]' if count and indent is not None else ']')
+    return count
+
+
+def write_ndjson(jobs, path):
+    """Write one compact JSON job per line. Returns the count."""
+    count = 0
+    with open_text(path, 'w') as f:
+        for job in jobs:
+            f.write(json_codec.dumps(as_dict(job)))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def write_csv(jobs, path, columns=DEFAULT_CSV_COLUMNS):
+    """Write the given table columns as CSV rows. Returns the count."""
+    extractors = [CSV_COLUMNS[column] for column in columns]
+    count = 0
+    with open_text(path, 'w') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for job in jobs:
+            job = as_job(job)
+            writer.writerow([extract(job) for extract in extractors])
+            count += 1
+    return count
+
+
+def export_jobs(jobs, path, columns=DEFAULT_CSV_COLUMNS):
+    """Write jobs in the format implied by path. Returns the count."""
+    fmt = file_format(path)
+    with METRICS.timer("export"):
+        if fmt == 'ndjson':
+            return write_ndjson(jobs, path)
+        if fmt == 'csv':
+            return write_csv(jobs, path, columns)
+        return write_json(jobs, path)
+
+
+# ----- Readers -----
+def iter_ndjson(path):
+    """Yield jobs from an NDJSON file, skipping blank lines."""
+    with open_text(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json_codec.loads(line)
+
+
+def iter_json_array(f):
+    """Yield elements of a top-level JSON array from a text stream.
+
+    Only one chunk plus the element being decoded is held in memory.
+    A top-level object is decoded whole; its 'results' list (an Adzuna
+    response) or the object itself is yielded.
+    """
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buf, pos, eof
+        chunk = f.read(READ_CHUNK)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def skip_ws():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    skip_ws()
+    if pos >= len(buf):
+        return
+    if buf[pos] == '{':
+        data = json_codec.loads(buf[pos:] + f.read())
+        yield from data.get('results', [data]) if isinstance(data, dict) else data
+        return
+    if buf[pos] != '[':
+        raise ValueError("Expected a JSON array of jobs")
+    pos += 1
+
+    first = True
+    while True:
+        skip_ws()
+        if pos >= len(buf):
+            raise ValueError("Unterminated JSON array")
+        if buf[pos] == ']':
+            return
+        if not first:
+            if buf[pos] != ',':
+                raise ValueError(f"Expected ',' in JSON array, got {buf[pos]!r}")
+            pos += 1
+            skip_ws()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            # An element ending exactly at the buffer edge may be a truncated number
+            if end == len(buf) and not eof:
+                fill()
+                continue
+            break
+        pos = end
+        first = False
+        yield item
+
+
+def iter_jobs(path):
+    """Yield jobs from a .json / .ndjson file (optionally .gz)."""
+    if file_format(path) == 'ndjson':
+        yield from iter_ndjson(path)
+        return
+    with open_text(path, 'r') as f:
+        yield from iter_json_array(f)
+
+
+def iter_batches(jobs, size=1000):
+    """Group an iterable of jobs into lists of up to size."""
+    batch = []
+    for job in jobs:
+        batch.append(job)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
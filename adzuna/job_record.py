@@ -0,0 +1,194 @@
+"""
+Compact job record parsed once from an Adzuna result.
+
+Raw API results are nested dicts (``company``, ``location``, ``category``)
+that every layer used to re-walk on each render. Job flattens them into
+a ``__slots__`` object at ingestion: dates become POSIX timestamps,
+salaries floats, and strings that repeat across postings (company,
+location, contract type, category) are interned so 200k postings share
+a few thousand string objects. The raw payload is only kept on request.
+``country`` is the Adzuna endpoint a result came from (see countries.py),
+which also fixes the currency of its salaries. ``skills`` and ``score``
+are filled in by skills.py and kept through JSON/NDJSON round trips.
+"""
+
+import sys
+from datetime import datetime, timezone
+
+from .countries import COUNTRIES
+from .metrics import METRICS
+
+
+def parse_created(value):
+    """Adzuna ``created`` stamp -> POSIX timestamp, or None if absent/invalid."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (TypeError, ValueError, AttributeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _float(value):
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _object(value):
+    # company/location/category are objects, but a malformed result may not be
+    return value if isinstance(value, dict) else {}
+
+
+def _display_name(value):
+    return _object(value).get('display_name')
+
+
+class Job:
+    """One job posting. Build with Job.from_api(result)."""
+
+    __slots__ = (
+        'id', 'title', 'description', 'created', 'redirect_url',
+        'salary_min', 'salary_max', 'salary_is_predicted',
+        'contract_type', 'contract_time', 'company', 'location', 'area',
+        'category', 'category_tag', 'latitude', 'longitude', 'country',
+        'skills', 'score', '_raw',
+    )
+
+    def __init__(self, id='', title='', description='', created=None, redirect_url='',
+                 salary_min=None, salary_max=None, salary_is_predicted=False,
+                 contract_type=None, contract_time=None, company=None, location=None,
+                 area=(), category=None, category_tag=None, latitude=None, longitude=None,
+                 country=None, skills=None, score=None, raw=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.created = created
+        self.redirect_url = redirect_url
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.salary_is_predicted = salary_is_predicted
+        self.contract_type = contract_type
+        self.contract_time = contract_time
+        self.company = company
+        self.location = location
+        self.area = area
+        self.category = category
+        self.category_tag = category_tag
+        self.latitude = latitude
+        self.longitude = longitude
+        self.country = country
+        # Filled by skills.py; None until extracted
+        self.skills = skills
+        self.score = score
+        self._raw = raw
+
+    @classmethod
+    def from_api(cls, result, keep_raw=False):
+        """Parse one Adzuna search result dict."""
+        location = _object(result.get('location'))
+        category = _object(result.get('category'))
+        return cls(
+            id=str(result.get('id') or result.get('redirect_url') or ''),
+            title=result.get('title') or '',
+            description=result.get('description') or '',
+            created=parse_created(result.get('created')),
+            redirect_url=result.get('redirect_url') or '',
+            salary_min=_float(result.get('salary_min')),
+            salary_max=_float(result.get('salary_max')),
+            salary_is_predicted=str(result.get('salary_is_predicted', '0')) == '1',
+            contract_type=_intern(result.get('contract_type')),
+            contract_time=_intern(result.get('contract_time')),
+            company=_intern(_display_name(result.get('company'))),
+            location=_intern(_display_name(location)),
+            area=tuple(_intern(a) for a in location.get('area') or ()),
+            category=_intern(category.get('label')),
+            category_tag=_intern(category.get('tag')),
+            latitude=_float(result.get('latitude')),
+            longitude=_float(result.get('longitude')),
+            country=_intern(result.get('country')),
+            skills=tuple(result['skills']) if result.get('skills') is not None else None,
+            score=result.get('score'),
+            raw=result if keep_raw else None,
+        )
+
+    @property
+    def created_iso(self):
+        """``created`` in Adzuna's format, or '' if unknown."""
+        if self.created is None:
+            return ''
+        return datetime.fromtimestamp(self.created, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    @property
+    def created_date(self):
+        """``created`` as YYYY-MM-DD, or '' if unknown."""
+        return self.created_iso[:10]
+
+    @property
+    def currency(self):
+        """ISO currency of the salaries, from the country ('' if unknown)."""
+        country = COUNTRIES.get(self.country)
+        return country.currency if country else ''
+
+    @property
+    def raw(self):
+        """The original result if kept, else an equivalent rebuilt dict."""
+        return self._raw if self._raw is not None else self.to_dict()
+
+    def to_dict(self):
+        """Adzuna-shaped dict (the fields Job keeps)."""
+        result = {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'created': self.created_iso,
+            'redirect_url': self.redirect_url,
+            'salary_is_predicted': '1' if self.salary_is_predicted else '0',
+        }
+        optional = {
+            'salary_min': self.salary_min,
+            'salary_max': self.salary_max,
+            'contract_type': self.contract_type,
+            'contract_time': self.contract_time,
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'country': self.country,
+            'score': self.score,
+        }
+        result.update((k, v) for k, v in optional.items() if v is not None)
+        if self.company is not None:
+            result['company'] = {'display_name': self.company}
+        if self.location is not None or self.area:
+            result['location'] = {'display_name': self.location, 'area': list(self.area)}
+        if self.category is not None or self.category_tag is not None:
+            result['category'] = {'label': self.category, 'tag': self.category_tag}
+        if self.skills is not None:
+            result['skills'] = list(self.skills)
+        return result
+
+    def __repr__(self):
+        return f"Job(id={self.id!r}, title={self.title!r}, company={self.company!r})"
+
+
+def as_job(job):
+    """Job for either a Job or a raw result dict."""
+    return job if isinstance(job, Job) else Job.from_api(job)
+
+
+def as_dict(job):
+    """Raw-shaped dict for either a Job or a raw result dict."""
+    return job.raw if isinstance(job, Job) else job
+
+
+def parse_results(results, keep_raw=False):
+    """Parse a list of raw results into Jobs."""
+    with METRICS.timer("normalize"):
+        return [Job.from_api(result, keep_raw) for result in results]
@@ -0,0 +1,396 @@
+"""
+Local SQLite store for fetched jobs.
+
+Jobs are upserted by Adzuna id, keeping first-seen / last-seen times, so
+repeated searches accumulate a deduplicated history across sessions. The
+database runs in WAL mode so the GUI can read while a fetch is writing,
+and bulk writes are batched into one transaction per chunk.
+
+StoreView exposes a query as a lazily paged sequence of Job records,
+which is what the results table binds to instead of a list of every row.
+
+Opened with dedupe=True, every upsert also runs the near-duplicate check
+in dedupe.py; ``duplicate_of`` links a repost to its canonical posting
+and UNIQUE_ONLY filters the reposts out of a query.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from . import json_codec
+from .job_record import Job, as_dict
+from .metrics import METRICS
+
+DEFAULT_DB_PATH = "adzuna_jobs.db"
+BATCH_SIZE = 5000
+
+# Columns the results table can sort a StoreView by
+SORT_COLUMNS = {
+    "created": "created",
+    "salary_max": "salary_max",
+    "salary_min": "salary_min",
+    "company": "company COLLATE NOCASE",
+    "location": "location COLLATE NOCASE",
+    "country": "country",
+    "title": "title COLLATE NOCASE",
+    "contract_type": "contract_type COLLATE NOCASE",
+    "last_seen": "last_seen",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            TEXT PRIMARY KEY,
+    title         TEXT,
+    company       TEXT,
+    location      TEXT,
+    contract_type TEXT,
+    salary_min    REAL,
+    salary_max    REAL,
+    created       TEXT,
+    redirect_url  TEXT,
+    country       TEXT,
+    raw           TEXT NOT NULL,
+    first_seen    REAL NOT NULL,
+    last_seen     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created);
+CREATE INDEX IF NOT EXISTS idx_jobs_salary_max ON jobs(salary_max);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs(location COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS sync_state (
+    search_key  TEXT PRIMARY KEY,
+    high_water  TEXT,
+    edge_ids    TEXT NOT NULL,
+    last_run    REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS minhash (
+    id          TEXT PRIMARY KEY,
+    signature   BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    bucket      INTEGER NOT NULL,
+    id          TEXT NOT NULL,
+    PRIMARY KEY (bucket, id)
+) WITHOUT ROWID;
+"""
+
+# Columns added after the first release: (name, type) for ALTER TABLE
+ADDED_COLUMNS = (
+    ("country", "TEXT"),
+    ("duplicate_of", "TEXT"),
+)
+
+# Indexes on added columns, created once the columns exist
+ADDED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_jobs_duplicate_of ON jobs(duplicate_of);
+"""
+
+# Where clause for canonical postings only (no flagged reposts)
+UNIQUE_ONLY = "duplicate_of IS NULL"
+
+UPSERT = """
+INSERT INTO jobs (id, title, company, location, contract_type, salary_min, salary_max,
+                  created, redirect_url, country, raw, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    contract_type = excluded.contract_type,
+    salary_min = excluded.salary_min,
+    salary_max = excluded.salary_max,
+    created = excluded.created,
+    redirect_url = excluded.redirect_url,
+    country = excluded.country,
+    raw = excluded.raw,
+    last_seen = excluded.last_seen
+"""
+
+
+def job_id(job):
+    """Adzuna id of a job, falling back to its URL for odd payloads."""
+    return str(job.get('id') or job.get('redirect_url') or '')
+
+
+def job_to_row(job, now):
+    """Flatten an Adzuna job dict into an UPSERT parameter tuple."""
+    return (
+        job_id(job),
+        job.get('title'),
+        (job.get('company') or {}).get('display_name'),
+        (job.get('location') or {}).get('display_name'),
+        job.get('contract_type'),
+        job.get('salary_min'),
+        job.get('salary_max'),
+        job.get('created'),
+        job.get('redirect_url'),
+        job.get('country'),
+        json_codec.dumps(job),
+        now,
+        now,
+    )
+
+
+def created_between(start=None, end=None):
+    """(where, params) for start <= created < end (timestamps, None = open)."""
+    where, params = [], []
+    for bound, op in ((start, ">="), (end, "<")):
+        if bound is not None:
+            where.append(f"created {op} ?")
+            params.append(datetime.fromtimestamp(bound, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    return " AND ".join(where), tuple(params)
+
+
+class JobStore:
+    """SQLite-backed, deduplicated job history."""
+
+    def __init__(self, path=DEFAULT_DB_PATH, dedupe=False):
+        self.path = path
+        self._lock = threading.RLock()
+        # Serializes near-duplicate checks (signature lookup, match, save) across
+        # threads; taken before _lock, and never held by plain reads and writes
+        self.dedupe_lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._add_missing_columns()
+        self.conn.commit()
+        self.deduplicator = None
+        if dedupe:
+            from .dedupe import Deduplicator
+            self.deduplicator = Deduplicator(self)
+
+    def _add_missing_columns(self):
+        """Bring a database created by an older version up to SCHEMA."""
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        for name, sql_type in ADDED_COLUMNS:
+            if name not in existing:
+                self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {sql_type}")
+        self.conn.executescript(ADDED_INDEXES)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def upsert_jobs(self, jobs, batch_size=BATCH_SIZE):
+        """Insert or update jobs (Jobs or raw dicts) by id. Returns rows written."""
+        now = time.time()
+        written = 0
+        batch, dicts = [], []
+        for job in jobs:
+            job = as_dict(job)
+            if not job_id(job):
+                continue
+            batch.append(job_to_row(job, now))
+            dicts.append(job)
+            if len(batch) >= batch_size:
+                written += self._write(batch, dicts)
+                batch, dicts = [], []
+        if batch:
+            written += self._write(batch, dicts)
+        return written
+
+    def _write(self, rows, jobs):
+        with METRICS.timer("store"), self._lock, self.conn:
+            self.conn.executemany(UPSERT, rows)
+        METRICS.incr("jobs_stored_total", len(rows))
+        if self.deduplicator is not None:
+            with METRICS.timer("dedupe"):
+                self.deduplicator.process(jobs)
+        return len(rows)
+
+    def count(self, where="", params=()):
+        """Number of stored jobs, optionally filtered by a SQL where clause."""
+        sql = "SELECT COUNT(*) FROM jobs" + (f" WHERE {where}" if where else "")
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()[0]
+
+    def query(self, offset=0, limit=200, order_by="created", descending=True,
+              where="", params=()):
+        """One page of stored jobs as Adzuna-shaped dicts."""
+        order = SORT_COLUMNS[order_by]
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            "SELECT raw FROM jobs"
+            + (f" WHERE {where}" if where else "")
+            + f" ORDER BY {order} {direction}, id LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self.conn.execute(sql, tuple(params) + (limit, offset)).fetchall()
+        return [json_codec.loads(raw) for (raw,) in rows]
+
+    def get_seen(self, ids):
+        """Map id -> (first_seen, last_seen) for the given ids that are stored."""
+        ids = list(ids)
+        seen = {}
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                for row in self.conn.execute(
+                        f"SELECT id, first_seen, last_seen FROM jobs WHERE id IN ({marks})", chunk):
+                    seen[row[0]] = (row[1], row[2])
+        return seen
+
+    def get_sync_state(self, search_key):
+        """(high_water, edge_ids) recorded for an incremental search, or None.
+
+        high_water is the newest ``created`` seen; edge_ids are the ids
+        created at exactly that instant, which the next run must not
+        mistake for new postings.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT high_water, edge_ids FROM sync_state WHERE search_key = ?",
+                (search_key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], set(json.loads(row[1]))
+
+    def set_sync_state(self, search_key, high_water, edge_ids):
+        """Record the high-water mark for an incremental search."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state (search_key, high_water, edge_ids, last_run) "
+                "VALUES (?, ?, ?, ?)",
+                (search_key, high_water, json.dumps(sorted(edge_ids)), time.time()))
+
+    # ----- Near-duplicate bookkeeping (see dedupe.py) -----
+    def _chunked(self, sql, values, chunk=500):
+        """Run sql (with a {marks} placeholder) over values in IN-list chunks."""
+        values = list(values)
+        rows = []
+        with self._lock:
+            for i in range(0, len(values), chunk):
+                part = values[i:i + chunk]
+                rows.extend(self.conn.execute(sql.format(marks=",".join("?" * len(part))), part))
+        return rows
+
+    def signed_ids(self, ids):
+        """The given ids that already have a MinHash signature."""
+        return {row[0] for row in self._chunked("SELECT id FROM minhash WHERE id IN ({marks})", ids)}
+
+    def unsigned_jobs(self, limit=BATCH_SIZE):
+        """Up to limit stored jobs without a signature, first seen first, as dicts."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT raw FROM jobs WHERE NOT EXISTS (SELECT 1 FROM minhash m WHERE m.id = jobs.id) "
+                "ORDER BY first_seen, rowid LIMIT ?", (limit,)).fetchall()
+        return [json_codec.loads(raw) for (raw,) in rows]
+
+    def bucket_members(self, buckets):
+        """Map LSH bucket -> ids stored in it, for the given buckets."""
+        members = {}
+        for bucket, id_ in self._chunked("SELECT bucket, id FROM lsh_buckets WHERE bucket IN ({marks})",
+                                         buckets):
+            members.setdefault(bucket, []).append(id_)
+        return members
+
+    def signatures(self, ids):
+        """Map id -> (signature array, duplicate_of) for the given ids."""
+        return {id_: (array('I', blob), duplicate_of) for id_, blob, duplicate_of in self._chunked(
+            "SELECT m.id, m.signature, j.duplicate_of FROM minhash m JOIN jobs j ON j.id = m.id "
+            "WHERE m.id IN ({marks})", ids)}
+
+    def save_dedupe(self, signatures, buckets, duplicates):
+        """Record (id, signature) and (bucket, id) rows and (canonical, id) links."""
+        with self._lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO minhash (id, signature) VALUES (?, ?)",
+                                  signatures)
+            self.conn.executemany("INSERT OR IGNORE INTO lsh_buckets (bucket, id) VALUES (?, ?)",
+                                  buckets)
+            self.conn.executemany("UPDATE jobs SET duplicate_of = ? WHERE id = ?", duplicates)
+
+    def duplicate_ids(self, ids):
+        """The given ids that are flagged as reposts of another posting."""
+        return {row[0] for row in self._chunked(
+            "SELECT id FROM jobs WHERE duplicate_of IS NOT NULL AND id IN ({marks})", ids)}
+
+    def duplicates_of(self, canonical_id):
+        """Ids flagged as reposts of canonical_id."""
+        with self._lock:
+            return [row[0] for row in self.conn.execute(
+                "SELECT id FROM jobs WHERE duplicate_of = ? ORDER BY first_seen, id", (canonical_id,))]
+
+    def reset_dedupe(self):
+        """Forget all signatures and duplicate links (e.g. to re-run with a new threshold)."""
+        with self.dedupe_lock, self._lock, self.conn:
+            self.conn.execute("DELETE FROM minhash")
+            self.conn.execute("DELETE FROM lsh_buckets")
+            self.conn.execute("UPDATE jobs SET duplicate_of = NULL WHERE duplicate_of IS NOT NULL")
+
+    def view(self, order_by="created", descending=True, where="", params=()):
+        """Paged, read-only sequence over a query for the results table."""
+        return StoreView(self, order_by, descending, where, params)
+
+
+class StoreView:
+    """Sequence of Jobs over a JobStore query, loaded a page at a time."""
+
+    PAGE_SIZE = 200
+    MAX_PAGES = 16
+
+    def __init__(self, store, order_by="created", descending=True, where="", params=()):
+        self.store = store
+        self.order_by = order_by
+        self.descending = descending
+        self.where = where
+        self.params = params
+        self._len = None
+        self._pages = OrderedDict()
+
+    def invalidate(self):
+        """Forget cached pages and count after the store changed."""
+        self._len = None
+        self._pages.clear()
+
+    def __len__(self):
+        if self._len is None:
+            self._len = self.store.count(self.where, self.params)
+        return self._len
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        page_no, pos = divmod(index, self.PAGE_SIZE)
+        page = self._pages.get(page_no)
+        if page is None:
+            page = [Job.from_api(result) for result in self.store.query(
+                page_no * self.PAGE_SIZE, self.PAGE_SIZE,
+                self.order_by, self.descending, self.where, self.params)]
+            self._pages[page_no] = page
+            if len(self._pages) > self.MAX_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_no)
+        return page[pos]
+
+    def __iter__(self):
+        for start in range(0, len(self), self.PAGE_SIZE):
+            for result in self.store.query(start, self.PAGE_SIZE, self.order_by,
+                                           self.descending, self.where, self.params):
+                yield Job.from_api(result)
+
+
+def dedupe_enabled():
+    """Whether stores flag near-duplicates on upsert (ADZUNA_DEDUPE, default on)."""
+    return os.getenv("ADZUNA_DEDUPE", "1") not in ("", "0")
+
+
+def default_store(dedupe=None):
+    """Job store at ADZUNA_DB_PATH (default adzuna_jobs.db).
+
+    dedupe=None follows dedupe_enabled().
+    """
+    if dedupe is None:
+        dedupe = dedupe_enabled()
+    return JobStore(os.path.expanduser(os.getenv("ADZUNA_DB_PATH", DEFAULT_DB_PATH)), dedupe)
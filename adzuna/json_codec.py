@@ -0,0 +1,212 @@
+"""
+JSON encoding and decoding with an optional fast backend.
+
+API pages, cache entries, stored jobs and NDJSON files all go through
+this module. It uses msgspec or orjson when installed (first found wins)
+and the stdlib json module otherwise; set ADZUNA_JSON_BACKEND to
+msgspec, orjson or json to choose. Every backend takes raw bytes or str,
+returns the same Python values and raises ValueError on invalid input,
+so callers never depend on which one is active. Neither package is a
+requirement.
+
+decode_page() parses a search response straight into Job records; the
+client uses it for ``as_jobs`` fetches (AdzunaClient.get_jobs). With
+msgspec the results are decoded into typed structs, skipping the
+intermediate dict tree and every field Job doesn't keep.
+"""
+
+import json
+import os
+from typing import List, Optional
+
+from .job_record import Job, parse_created, parse_results, _float, _intern
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional
+    msgspec = None
+
+BACKENDS = ("msgspec", "orjson", "json")
+
+
+# ----- stdlib -----
+def _json_loads(data):
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# ----- orjson -----
+def _orjson_loads(data):
+    return orjson.loads(data)
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+# ----- msgspec -----
+if msgspec is not None:
+    _msgspec_decoder = msgspec.json.Decoder()
+    _msgspec_encoder = msgspec.json.Encoder()
+
+    def _msgspec_loads(data):
+        try:
+            return _msgspec_decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def _msgspec_dumps(obj):
+        return _msgspec_encoder.encode(obj).decode("utf-8")
+
+    # Only the fields Job keeps; anything else in a result is skipped unparsed
+    class _Named(msgspec.Struct):
+        display_name: object = None
+
+    class _Location(msgspec.Struct):
+        display_name: object = None
+        area: Optional[list] = None
+
+    class _Category(msgspec.Struct):
+        label: object = None
+        tag: object = None
+
+    class _Result(msgspec.Struct):
+        id: object = None
+        title: object = None
+        description: object = None
+        created: object = None
+        redirect_url: object = None
+        salary_min: object = None
+        salary_max: object = None
+        salary_is_predicted: object = "0"
+        contract_type: object = None
+        contract_time: object = None
+        company: Optional[_Named] = None
+        location: Optional[_Location] = None
+        category: Optional[_Category] = None
+        latitude: object = None
+        longitude: object = None
+        country: object = None
+
+    class _Page(msgspec.Struct):
+        count: object = None
+        results: List[_Result] = []
+
+    _page_decoder = msgspec.json.Decoder(_Page)
+
+
+def _job_from_struct(result, country):
+    """Job from a decoded _Result; mirrors Job.from_api."""
+    location = result.location
+    category = result.category
+    company = result.company
+    return Job(
+        id=str(result.id or result.redirect_url or ''),
+        title=result.title or '',
+        description=result.description or '',
+        created=parse_created(result.created),
+        redirect_url=result.redirect_url or '',
+        salary_min=_float(result.salary_min),
+        salary_max=_float(result.salary_max),
+        salary_is_predicted=str(result.salary_is_predicted) == '1',
+        contract_type=_intern(result.contract_type),
+        contract_time=_intern(result.contract_time),
+        company=_intern(company.display_name) if company is not None else None,
+        location=_intern(location.display_name) if location is not None else None,
+        area=tuple(_intern(a) for a in location.area or ()) if location is not None else (),
+        category=_intern(category.label) if category is not None else None,
+        category_tag=_intern(category.tag) if category is not None else None,
+        latitude=_float(result.latitude),
+        longitude=_float(result.longitude),
+        country=_intern(result.country or country),
+    )
+
+
+_IMPLEMENTATIONS = {
+    "orjson": (orjson, lambda: (_orjson_loads, _orjson_dumps)),
+    "msgspec": (msgspec, lambda: (_msgspec_loads, _msgspec_dumps)),
+    "json": (json, lambda: (_json_loads, _json_dumps)),
+}
+
+BACKEND = None
+_loads = _dumps = None
+
+
+def available_backends():
+    """Backends importable here, fastest first."""
+    return [name for name in BACKENDS if _IMPLEMENTATIONS[name][0] is not None]
+
+
+def set_backend(name=None):
+    """Switch backend; None picks ADZUNA_JSON_BACKEND or the fastest available.
+
+    Raises ValueError for an unknown or uninstalled backend.
+    """
+    global BACKEND, _loads, _dumps
+    name = (name or os.getenv("ADZUNA_JSON_BACKEND", "") or available_backends()[0]).lower()
+    if name not in _IMPLEMENTATIONS:
+        raise ValueError(f"Unknown JSON backend {name!r}; expected one of {', '.join(BACKENDS)}")
+    module, functions = _IMPLEMENTATIONS[name]
+    if module is None:
+        raise ValueError(f"JSON backend {name!r} is not installed")
+    _loads, _dumps = functions()
+    BACKEND = name
+    return name
+
+
+def loads(data):
+    """Decode JSON from bytes or str; ValueError if invalid."""
+    return _loads(data)
+
+
+def dumps(obj):
+    """Compact JSON text, non-ASCII characters kept as-is."""
+    return _dumps(obj)
+
+
+def decode_page(data, country=None):
+    """{'count': total, 'results': [Job]} from a raw search response (bytes or str).
+
+    country tags every job that has none, as AdzunaClient does for its responses.
+    """
+    page = None
+    if BACKEND == "msgspec":
+        try:
+            page = _page_decoder.decode(data)
+        except msgspec.ValidationError:
+            # Valid JSON the typed structs reject (e.g. "company": "Acme");
+            # decode untyped and let Job.from_api skip the odd fields
+            pass
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    if page is not None:
+        count, jobs = page.count, [_job_from_struct(result, country) for result in page.results]
+    else:
+        page = _loads(data)
+        results = page.get("results") or []
+        if country:
+            for result in results:
+                result.setdefault("country", country)
+        count, jobs = page.get("count"), parse_results(results)
+    # Like the dict response, no count key when the API sent none
+    return {"results": jobs} if count is None else {"count": count, "results": jobs}
+
+
+def decode_jobs(data, country=None):
+    """Jobs from a raw search response (bytes or str); see decode_page."""
+    return decode_page(data, country)["results"]
+
+
+try:
+    set_backend()
+except ValueError:
+    # Bad ADZUNA_JSON_BACKEND: don't fail the import over a speed setting
+    set_backend(available_backends()[0])
@@ -0,0 +1,267 @@
+"""
+Lightweight in-process metrics for the fetch pipeline.
+
+Hot paths call METRICS.incr(...) for counters and wrap stages in
+``with METRICS.timer('decode'):``. When metrics are disabled (the
+default) both return immediately, so instrumentation costs one attribute
+check per call. Enable with ADZUNA_METRICS=1, METRICS.enable() or the
+CLI's --metrics option.
+
+Stage timers feed one histogram, ``stage_seconds{stage=...}``:
+
+- ``http_wait``: connect, TLS and server time until response headers
+- ``http_transfer``: reading the response body
+- ``decode``: JSON decoding
+- ``normalize``: parsing results into Job records
+- ``enrich``: skill extraction and scoring
+- ``store``: SQLite upserts
+- ``dedupe``: near-duplicate checks on stored jobs
+- ``render``: pushing rows into the results table
+- ``export``: writing export files
+
+Snapshots export as JSON or the Prometheus text exposition format.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+STAGES = ("http_wait", "http_transfer", "decode", "normalize", "enrich", "store", "dedupe",
+          "render", "export")
+
+# Histogram upper bounds in seconds (Prometheus "le" buckets)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+                   2.5, 5.0, 10.0)
+
+HELP = {
+    "api_requests_total": "HTTP requests sent to the Adzuna API (each counts against quota)",
+    "api_responses_total": "Adzuna API responses by HTTP status",
+    "api_retries_total": "Requests retried after a connection error, 429 or 5xx",
+    "cache_hits_total": "Search pages served from the response cache",
+    "cache_misses_total": "Search pages not found in the response cache",
+    "jobs_stored_total": "Jobs upserted into the job store",
+    "rate_limit_wait_seconds_total": "Seconds spent waiting on the rate limiter",
+    "stage_seconds": "Time spent per pipeline stage",
+}
+
+
+class _NullTimer:
+    """Shared no-op context manager handed out while metrics are disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ('metrics', 'stage', 'start')
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe("stage_seconds", time.perf_counter() - self.start, stage=self.stage)
+        return False
+
+
+class _Histogram:
+    __slots__ = ('counts', 'total', 'count', 'max')
+
+    def __init__(self, buckets):
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+def _key(name, labels):
+    # Label values are strings in the exposition format; also keeps keys sortable
+    return (name, tuple(sorted((k, str(v)) for k, v in labels.items()))) if labels else (name, ())
+
+
+def _label_text(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+
+class Metrics:
+    """Thread-safe counters and stage-time histograms."""
+
+    def __init__(self, enabled=False, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self.started = time.time()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+    # ----- Recording -----
+    def incr(self, name, value=1, **labels):
+        """Add value to a counter."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """Record one duration in a histogram."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        # Linear scan: 14 buckets is cheaper than bisect's call overhead
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                index = i
+                break
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.counts[index] += 1
+            histogram.total += seconds
+            histogram.count += 1
+            if seconds > histogram.max:
+                histogram.max = seconds
+
+    def timer(self, stage):
+        """Context manager timing a pipeline stage (no-op while disabled)."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, stage)
+
+    # ----- Reading -----
+    def counter(self, name, **labels):
+        """Current value of a counter; without labels, summed over all labels."""
+        with self._lock:
+            if labels:
+                return self._counters.get(_key(name, labels), 0)
+            return sum(v for (n, _), v in self._counters.items() if n == name)
+
+    def stage(self, stage):
+        """(count, total seconds) recorded for a stage."""
+        with self._lock:
+            histogram = self._histograms.get(_key("stage_seconds", {"stage": stage}))
+            return (histogram.count, histogram.total) if histogram else (0, 0.0)
+
+    def snapshot(self):
+        """Counters and histogram summaries as plain data."""
+        with self._lock:
+            counters = [{"name": n, "labels": dict(labels), "value": v}
+                        for (n, labels), v in sorted(self._counters.items())]
+            histograms = [{
+                "name": n, "labels": dict(labels), "count": h.count,
+                "sum": round(h.total, 6), "max": round(h.max, 6),
+                "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], h.counts)),
+            } for (n, labels), h in sorted(self._histograms.items())]
+        return {"started": self.started, "timestamp": time.time(),
+                "counters": counters, "histograms": histograms}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix="adzuna_"):
+        """Prometheus text exposition format (cumulative histogram buckets)."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((k, (list(h.counts), h.total, h.count))
+                                for k, h in self._histograms.items())
+        lines = []
+        described = set()
+
+        def describe(name, kind):
+            if name not in described:
+                described.add(name)
+                if name in HELP:
+                    lines.append(f"# HELP {prefix}{name} {HELP[name]}")
+                lines.append(f"# TYPE {prefix}{name} {kind}")
+
+        for (name, labels), value in counters:
+            describe(name, "counter")
+            lines.append(f"{prefix}{name}{_label_text(labels)} {value}")
+        for (name, labels), (counts, total, count) in histograms:
+            describe(name, "histogram")
+            cumulative = 0
+            for bound, n in zip(list(self.buckets) + ["+Inf"], counts):
+                cumulative += n
+                lines.append(f"{prefix}{name}_bucket{_label_text(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{prefix}{name}_sum{_label_text(labels)} {total:.6f}")
+            lines.append(f"{prefix}{name}_count{_label_text(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write a snapshot atomically: Prometheus text for .prom/.txt, else JSON."""
+        text = self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_json()
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def report(self):
+        """Multi-line plain-text report: counters, then per-stage times."""
+        hits = self.counter("cache_hits_total")
+        misses = self.counter("cache_misses_total")
+        lines = [
+            f"API requests: {self.counter('api_requests_total')}  "
+            f"retries: {self.counter('api_retries_total')}  "
+            f"rate-limit wait: {self.counter('rate_limit_wait_seconds_total'):.1f}s",
+            f"Cache: {hits} hits / {misses} misses"
+            + (f" ({hits / (hits + misses):.0%})" if hits + misses else ""),
+            f"Jobs stored: {self.counter('jobs_stored_total')}",
+            "",
+            f"{'stage':<14} {'count':>7} {'total ms':>10} {'mean ms':>9}",
+        ]
+        for stage in STAGES:
+            count, total = self.stage(stage)
+            if count:
+                lines.append(f"{stage:<14} {count:>7} {total * 1000:>10.1f} {total * 1000 / count:>9.2f}")
+        return "\n".join(lines)
+
+    def summary(self):
+        """One-line summary for a status bar."""
+        hits = self.counter("cache_hits_total")
+        misses = self.counter("cache_misses_total")
+        parts = [f"API calls {self.counter('api_requests_total')}",
+                 f"retries {self.counter('api_retries_total')}"]
+        if hits + misses:
+            parts.append(f"cache {hits / (hits + misses):.0%}")
+        for stage in ("http_wait", "decode", "normalize", "store", "render"):
+            count, total = self.stage(stage)
+            if count:
+                parts.append(f"{stage} {total * 1000:.0f}ms")
+        return " | ".join(parts)
+
+
+METRICS = Metrics(enabled=os.getenv("ADZUNA_METRICS", "") not in ("", "0"))
@@ -0,0 +1,116 @@
+"""
+Token-bucket rate limiting for Adzuna API calls.
+
+Adzuna plans cap requests per minute and per day. RateLimiter holds one
+bucket per window and hands out a token only when every bucket has one,
+so any number of worker threads sharing a limiter stay inside the quota.
+Buckets start full, which allows a burst up to each window's capacity.
+
+Quota is tracked in-process only: a restarted batch starts with full
+buckets, so set the per-day figure to what is left for the day.
+"""
+
+import threading
+import time
+
+from .errors import AdzunaAPIError
+from .metrics import METRICS
+
+# Adzuna's default developer plan
+DEFAULT_PER_MINUTE = 25
+DEFAULT_PER_DAY = 250
+
+
+class QuotaExhausted(AdzunaAPIError):
+    """Raised when a token would not be available within max_wait seconds."""
+
+    def __init__(self, message, wait):
+        super().__init__(message)
+        self.wait = wait
+
+
+class Cancelled(AdzunaAPIError):
+    """Raised when the caller's cancel_event is set while waiting for a token."""
+
+
+class TokenBucket:
+    """capacity tokens, refilled continuously at capacity/period per second.
+
+    Not thread-safe on its own; RateLimiter serializes access.
+    """
+
+    def __init__(self, capacity, period, clock=time.monotonic):
+        self.capacity = float(capacity)
+        self.rate = capacity / period
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, tokens=1):
+        """Seconds until tokens are available (0 if they are now)."""
+        self._refill()
+        missing = tokens - self.tokens
+        return max(0.0, missing / self.rate)
+
+    def take(self, tokens=1):
+        self._refill()
+        self.tokens -= tokens
+
+
+class RateLimiter:
+    """Thread-safe limiter over per-minute and per-day token buckets.
+
+    acquire() blocks until a request is allowed. If the wait would exceed
+    max_wait seconds (e.g. the daily quota is spent) it raises
+    QuotaExhausted instead of sleeping for hours; if cancel_event is set
+    while waiting it raises Cancelled.
+    """
+
+    def __init__(self, per_minute=DEFAULT_PER_MINUTE, per_day=DEFAULT_PER_DAY,
+                 max_wait=None, clock=time.monotonic, sleep=time.sleep):
+        self.buckets = []
+        if per_minute:
+            self.buckets.append(TokenBucket(per_minute, 60, clock))
+        if per_day:
+            self.buckets.append(TokenBucket(per_day, 86400, clock))
+        self.max_wait = max_wait
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited = 0.0
+
+    def acquire(self, cancel_event=None):
+        """Take one token from every bucket, waiting as needed.
+
+        Returns the seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = max((bucket.wait_time() for bucket in self.buckets), default=0.0)
+                if wait <= 0:
+                    for bucket in self.buckets:
+                        bucket.take()
+                    self.acquired += 1
+                    self.waited += waited
+                    if waited:
+                        METRICS.incr("rate_limit_wait_seconds_total", waited)
+                    return waited
+            if self.max_wait is not None and waited + wait > self.max_wait:
+                raise QuotaExhausted(f"Rate limit quota exhausted; next request in {wait:.0f}s", wait)
+            if cancel_event is not None and cancel_event.is_set():
+                raise Cancelled("Cancelled while waiting for rate limit")
+            # Wake in short steps so cancellation stays responsive
+            step = min(wait, 1.0)
+            self.sleep(step)
+            waited += step
+
+    def stats(self):
+        """Tokens handed out and total seconds callers spent waiting."""
+        with self._lock:
+            return {"acquired": self.acquired, "waited": round(self.waited, 3)}
@@ -0,0 +1,188 @@
+"""
+Persistent on-disk cache for Adzuna API responses.
+
+Each response is stored gzip-compressed in its own file, named by a hash
+of the normalized request (country, what, where, page, filters). Entries
+older than the TTL are treated as misses. When the cache grows past
+max_bytes the least recently used files are evicted - a hit touches the
+file's mtime, so mtime doubles as the LRU clock.
+
+Writes go to a temporary file that is atomically renamed into place, so
+any number of readers (threads or processes) can share one directory.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from . import json_codec
+from .metrics import METRICS
+
+DEFAULT_TTL = 3600
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Check the directory size after this many writes rather than on every put
+EVICT_EVERY = 50
+
+
+def normalize(value):
+    """Normalize a key component so trivially different searches collide."""
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    return value
+
+
+def cache_key(country, what, where, page, filters=None):
+    """Stable hash for a search request."""
+    key = {
+        "country": normalize(country),
+        "what": normalize(what),
+        "where": normalize(where),
+        "page": page,
+        "filters": {k: normalize(v) for k, v in sorted((filters or {}).items())},
+    }
+    # stdlib json on purpose: keys must not change with the JSON backend
+    blob = json.dumps(key, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Directory of gzip-compressed JSON responses with TTL and LRU eviction."""
+
+    def __init__(self, directory, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json.gz")
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        METRICS.incr("cache_hits_total" if hit else "cache_misses_total")
+
+    def get(self, key):
+        """Return the cached response for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rb") as f:
+                entry = json_codec.loads(f.read())
+        except FileNotFoundError:
+            self._count(False)
+            return None
+        except (OSError, EOFError, ValueError):
+            entry = None
+        if not isinstance(entry, dict):
+            # Unreadable or not one of our entries: drop it and refetch
+            self._remove(path)
+            self._count(False)
+            return None
+
+        if time.time() - entry.get("stored", 0) > self.ttl:
+            self._count(False)
+            return None
+
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        self._count(True)
+        return entry.get("data")
+
+    def put(self, key, data):
+        """Store a response for key."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = json_codec.dumps({"stored": time.time(), "data": data})
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(payload.encode("utf-8"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        with self._lock:
+            self._writes += 1
+            due = self._writes % EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def _entries(self):
+        """(mtime, size, path) for every cache file."""
+        entries = []
+        for dirpath, _, filenames in os.walk(self.directory):
+            for name in filenames:
+                if not name.endswith(".json.gz"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict(self):
+        """Delete least recently used entries until under max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """Delete every cached response."""
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    def size_bytes(self):
+        """Total size of cached files on disk."""
+        return sum(size for _, size, _ in self._entries())
+
+    def stats(self):
+        """Hit/miss counters for this process."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def default_cache():
+    """Cache configured from the environment, or None if disabled.
+
+    Set ADZUNA_CACHE_DIR to enable; ADZUNA_CACHE_TTL (seconds) and
+    ADZUNA_CACHE_MAX_MB tune it.
+    """
+    directory = os.getenv("ADZUNA_CACHE_DIR")
+    if not directory:
+        return None
+    ttl = int(os.getenv("ADZUNA_CACHE_TTL", DEFAULT_TTL))
+    max_bytes = int(float(os.getenv("ADZUNA_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 1024 / 1024)) * 1024 * 1024)
+    return ResponseCache(os.path.expanduser(directory), ttl=ttl, max_bytes=max_bytes)
@@ -0,0 +1,395 @@
+"""
+Skill extraction and relevance scoring for job postings.
+
+Skills come from a dictionary of names with optional aliases (built in,
+or a text file named by ADZUNA_SKILLS_FILE; see load_skills). Every name
+and alias is tokenized and added to one Aho-Corasick automaton over
+tokens, so a description is matched against the whole dictionary in a
+single left-to-right pass: the cost depends on the text length, not on
+the number of skills. Matching is casefolded and whole-token, so "java"
+doesn't fire inside "javascript" and multi-word skills ("machine
+learning") match as a phrase. Ambiguous short words ("go", "r") are left
+out of the defaults; list them as phrases ("golang", "r programming").
+
+A posting's score (0-100) grows with the number of skills found; skills
+in the title count TITLE_WEIGHT times, and skills of the search itself
+(``focus``) count FOCUS_WEIGHT times, so postings about what was searched
+for rank first.
+
+enrich() fills Job.skills and Job.score in place. iter_enriched() does
+the same for a stream of jobs across a process pool, for big backlogs.
+"""
+
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .job_record import as_job
+from .metrics import METRICS
+
+# Like text_index.TOKEN_RE, plus a leading dot so ".net" and "node.js" stay apart
+TOKEN_RE = re.compile(r"\.?\w[\w+#]*")
+
+TITLE_WEIGHT = 3
+FOCUS_WEIGHT = 4
+# Weighted skill count that scores 50
+SCORE_HALF = 6
+
+# Jobs per task sent to a worker process
+CHUNK_SIZE = 500
+# Below this many jobs a process pool costs more than it saves
+PARALLEL_MIN = 5000
+
+DEFAULT_SKILLS = """
+# Languages
+Python: python3
+Java
+JavaScript: js, ecmascript
+TypeScript
+C++: cpp
+C#: csharp
+.NET: dotnet, asp.net
+Golang: go lang
+Rust
+Ruby
+PHP
+Scala
+Kotlin
+Swift
+Objective-C
+R programming: r studio, rstudio
+MATLAB
+Perl
+Bash: shell scripting
+PowerShell
+SQL
+PL/SQL
+T-SQL
+VBA
+COBOL
+Fortran
+Haskell
+Elixir
+Erlang
+Clojure
+Dart
+Lua
+Julia
+Groovy
+Solidity
+# Web
+HTML: html5
+CSS: css3
+React: react.js, reactjs
+Angular: angularjs
+Vue: vue.js, vuejs
+Svelte
+Next.js: nextjs
+Node.js: nodejs, node
+Express.js: expressjs
+Django
+Flask
+FastAPI
+Spring Boot: spring framework
+Ruby on Rails: rails
+Laravel
+Symfony
+GraphQL
+REST API: restful
+jQuery
+Redux
+Webpack
+Tailwind
+Bootstrap
+WordPress
+# Data
+Pandas
+NumPy
+SciPy
+scikit-learn: sklearn
+TensorFlow
+PyTorch
+Keras
+Spark: apache spark, pyspark
+Hadoop
+Kafka: apache kafka
+Airflow: apache airflow
+dbt
+Snowflake
+Databricks
+Tableau
+Power BI: powerbi
+Looker
+Excel
+Machine learning: ml
+Deep learning
+NLP: natural language processing
+Computer vision
+Data science
+Data engineering
+Statistics
+ETL
+LLM: large language models
+# Databases
+PostgreSQL: postgres
+MySQL
+SQL Server: mssql
+Oracle
+MongoDB
+Redis
+Elasticsearch
+Cassandra
+DynamoDB
+SQLite
+Neo4j
+BigQuery
+Redshift
+# Cloud and DevOps
+AWS: amazon web services
+Azure: microsoft azure
+GCP: google cloud, google cloud platform
+Docker
+Kubernetes: k8s
+Terraform
+Ansible
+Puppet
+Jenkins
+GitHub Actions
+GitLab
+CI/CD: ci cd, continuous integration, continuous delivery
+Git
+Linux
+Unix
+Nginx
+Prometheus
+Grafana
+Serverless
+AWS Lambda
+Microservices
+DevOps
+SRE: site reliability
+# Practices and tools
+Agile
+Scrum
+Kanban
+TDD: test driven development
+Jira
+Confluence
+Selenium
+Cypress
+Jest
+pytest
+JUnit
+OOP: object oriented
+Design patterns
+# Other
+Android
+iOS
+Unity
+Unreal
+SAP
+Salesforce
+ServiceNow
+Figma
+Photoshop
+Blockchain
+Cybersecurity: cyber security
+Penetration testing
+Networking
+Embedded
+FPGA
+Verilog
+VHDL
+"""
+
+
+def tokenize(text):
+    """Casefolded skill tokens of text (none for empty text or None)."""
+    return TOKEN_RE.findall(text.casefold()) if text else []
+
+
+def parse_skills(lines):
+    """Skill names and aliases from 'Name' / 'Name: alias, alias' lines.
+
+    Returns [(name, (alias, ...)), ...]; blank lines and # comments are skipped.
+    """
+    skills = []
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        name, _, aliases = line.partition(':')
+        skills.append((name.strip(), tuple(a.strip() for a in aliases.split(',') if a.strip())))
+    return skills
+
+
+def load_skills(path=None):
+    """Skill dictionary from a text file, or the built-in one if path is None."""
+    if path is None:
+        return parse_skills(DEFAULT_SKILLS.splitlines())
+    with open(os.path.expanduser(path), encoding='utf-8') as f:
+        return parse_skills(f)
+
+
+class SkillMatcher:
+    """Token-level Aho-Corasick automaton over skill names and aliases."""
+
+    def __init__(self, skills):
+        self.names = [name for name, _ in skills]
+        goto = [{}]
+        outputs = [set()]
+        for index, (name, aliases) in enumerate(skills):
+            for pattern in (name,) + tuple(aliases):
+                state = 0
+                for token in tokenize(pattern):
+                    next_state = goto[state].get(token)
+                    if next_state is None:
+                        next_state = goto[state][token] = len(goto)
+                        goto.append({})
+                        outputs.append(set())
+                    state = next_state
+                if state:
+                    outputs[state].add(index)
+
+        # Breadth-first failure links; each state also reports its suffixes' matches
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in goto[state].items():
+                queue.append(child)
+                target = fail[state]
+                while target and token not in goto[target]:
+                    target = fail[target]
+                fail[child] = goto[target].get(token, 0)
+                outputs[child] |= outputs[fail[child]]
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(sorted(out)) for out in outputs]
+
+    def __len__(self):
+        return len(self.names)
+
+    def find(self, text):
+        """Indices of the skills in text, in order of first appearance."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        root = goto[0]
+        found = {}
+        state = 0
+        for token in tokenize(text):
+            if state:
+                next_state = goto[state].get(token)
+                while next_state is None and state:
+                    state = fail[state]
+                    next_state = goto[state].get(token)
+                state = next_state or 0
+            else:
+                # Most tokens start no skill at all
+                state = root.get(token, 0)
+            if state and outputs[state]:
+                for index in outputs[state]:
+                    found[index] = None
+        return list(found)
+
+
+class SkillExtractor:
+    """Finds skills in postings and scores them."""
+
+    def __init__(self, skills=None, focus=()):
+        self.skills = skills if skills is not None else load_skills()
+        self.matcher = SkillMatcher(self.skills)
+        self.focus = frozenset(focus)
+
+    def focus_on(self, text):
+        """Weight the skills mentioned in text (e.g. the search term)."""
+        self.focus = frozenset(self.matcher.find(text))
+        return [self.matcher.names[i] for i in sorted(self.focus)]
+
+    def extract(self, title, description):
+        """(skill names, score) for one posting."""
+        in_title = self.matcher.find(title)
+        found = dict.fromkeys(in_title)
+        found.update(dict.fromkeys(self.matcher.find(description)))
+        focus = self.focus
+        weight = 0
+        for index in found:
+            weight += (TITLE_WEIGHT if index in in_title else 1) * (FOCUS_WEIGHT if index in focus else 1)
+        score = round(100 * weight / (weight + SCORE_HALF))
+        return tuple(self.matcher.names[i] for i in found), score
+
+    def enrich(self, jobs):
+        """Set skills and score on Job records, in place; returns jobs."""
+        with METRICS.timer("enrich"):
+            for job in jobs:
+                job.skills, job.score = self.extract(job.title, job.description)
+        return jobs
+
+
+# ----- Process pool -----
+_worker_extractor = None
+
+
+def _init_worker(skills, focus):
+    global _worker_extractor
+    _worker_extractor = SkillExtractor(skills, focus)
+
+
+def _extract_chunk(texts):
+    extract = _worker_extractor.extract
+    return [extract(title, description) for title, description in texts]
+
+
+def iter_enriched(jobs, extractor=None, workers=None, chunk_size=CHUNK_SIZE):
+    """Yield jobs (Jobs or raw dicts) as enriched Job records, in order.
+
+    Chunks of chunk_size are extracted in a pool of worker processes
+    (default: one per CPU), with a bounded number of chunks in flight so
+    memory stays flat on any backlog. workers=1 extracts in-process.
+    """
+    extractor = extractor or SkillExtractor()
+    workers = workers or os.cpu_count() or 1
+    jobs = (as_job(job) for job in jobs)
+    if workers == 1:
+        while True:
+            chunk = list(islice(jobs, chunk_size))
+            if not chunk:
+                return
+            yield from extractor.enrich(chunk)
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(extractor.skills, extractor.focus)) as pool:
+        pending = deque()
+        while True:
+            chunk = list(islice(jobs, chunk_size))
+            if chunk:
+                texts = [(job.title, job.description) for job in chunk]
+                pending.append((chunk, pool.submit(_extract_chunk, texts)))
+            if pending and (not chunk or len(pending) >= 2 * workers):
+                done, future = pending.popleft()
+                with METRICS.timer("enrich"):
+                    results = future.result()
+                for job, (skills, score) in zip(done, results):
+                    job.skills, job.score = skills, score
+                    yield job
+            if not chunk and not pending:
+                return
+
+
+def enrich(jobs, extractor=None, workers=None):
+    """Enrich a list of Job records in place, in parallel when it is large."""
+    if workers is None:
+        workers = 1 if len(jobs) < PARALLEL_MIN else os.cpu_count() or 1
+    if workers == 1:
+        return (extractor or SkillExtractor()).enrich(jobs)
+    for _ in iter_enriched(jobs, extractor, workers):
+        pass
+    return jobs
+
+
+def default_extractor(focus_text=''):
+    """SkillExtractor over ADZUNA_SKILLS_FILE (or the built-in skills)."""
+    extractor = SkillExtractor(load_skills(os.getenv('ADZUNA_SKILLS_FILE') or None))
+    if focus_text:
+        extractor.focus_on(focus_text)
+    return extractor
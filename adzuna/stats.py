@@ -0,0 +1,256 @@
+"""
+Vectorized salary and market statistics over loaded jobs.
+
+MarketStats holds the fields the dashboards aggregate as NumPy columns:
+salary_min and salary_max (float64, NaN when missing), created (POSIX
+seconds, NaN when missing) and location, company and country as integer
+codes into per-column label lists (-1 when missing). Columns grow by
+doubling as pages arrive, so extend() only touches the new jobs, and
+percentiles, histograms, per-location/per-company aggregates and time
+series are a few array operations each instead of a loop over Jobs.
+
+Salaries are in the currency of each job's country (see countries.py);
+pass country= to keep markets apart. Group medians come from one
+lexsort of (group, salary) rather than a sort per group.
+"""
+
+import numpy as np
+
+from .countries import format_salary
+
+SALARY_COLUMNS = ('salary_min', 'salary_max')
+LABEL_COLUMNS = ('location', 'company', 'country')
+PERCENTILES = (10, 25, 50, 75, 90)
+INITIAL_CAPACITY = 1024
+DAY = 86400
+# Time-series bucket -> numpy datetime64 unit (weeks are Monday-aligned days)
+PERIODS = {'day': 'D', 'week': 'D', 'month': 'M'}
+GROUP_TITLES = {'location': 'Top locations', 'company': 'Top companies'}
+
+
+class _Labels:
+    """Value <-> integer code for one label column."""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, value):
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _nan(value):
+    return value if value is not None else np.nan
+
+
+class MarketStats:
+    """Salary, location, company and date columns for a growing list of jobs."""
+
+    def __init__(self, jobs=()):
+        self.clear()
+        self.extend(jobs)
+
+    # ----- Loading -----
+    def clear(self):
+        self.size = 0
+        self.labels = {name: _Labels() for name in LABEL_COLUMNS}
+        self._data = {name: np.empty(INITIAL_CAPACITY) for name in SALARY_COLUMNS + ('created',)}
+        self._data.update((name, np.empty(INITIAL_CAPACITY, dtype=np.int32)) for name in LABEL_COLUMNS)
+
+    def load(self, jobs):
+        """Replace the contents with jobs."""
+        self.clear()
+        self.extend(jobs)
+
+    def extend(self, jobs):
+        """Append Job records (a page at a time, as they are fetched)."""
+        jobs = list(jobs)
+        if not jobs:
+            return
+        start, end = self.size, self.size + len(jobs)
+        self._reserve(end)
+        data = self._data
+        for name in SALARY_COLUMNS + ('created',):
+            data[name][start:end] = np.fromiter(
+                (_nan(getattr(job, name)) for job in jobs), dtype=np.float64, count=len(jobs))
+        for name in LABEL_COLUMNS:
+            encode = self.labels[name].encode
+            data[name][start:end] = np.fromiter(
+                (encode(getattr(job, name)) for job in jobs), dtype=np.int32, count=len(jobs))
+        self.size = end
+
+    def extend_columns(self, values, labels=None):
+        """Append rows given as arrays rather than Jobs (see archive.load_stats).
+
+        values maps salary_min, salary_max and created to float arrays (NaN
+        when missing); labels maps label columns to (codes, label list)
+        pairs, codes -1 when missing. Columns left out are missing.
+        """
+        labels = labels or {}
+        sizes = {len(array) for array in values.values()}
+        sizes.update(len(codes) for codes, _ in labels.values())
+        if len(sizes) != 1:
+            raise ValueError("Columns must all have the same length")
+        count = sizes.pop()
+        if not count:
+            return
+        start, end = self.size, self.size + count
+        self._reserve(end)
+        data = self._data
+        for name in SALARY_COLUMNS + ('created',):
+            data[name][start:end] = values[name] if name in values else np.nan
+        for name in LABEL_COLUMNS:
+            if name in labels:
+                codes, names = labels[name]
+                encode = self.labels[name].encode
+                # Trailing -1 so that missing (-1) codes stay missing
+                recode = np.array([encode(value) for value in names] + [-1], dtype=np.int32)
+                data[name][start:end] = recode[codes]
+            else:
+                data[name][start:end] = -1
+        self.size = end
+
+    def _reserve(self, size):
+        capacity = len(self._data['created'])
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name, column in self._data.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self._data[name] = grown
+
+    def column(self, name):
+        """Read-only view of a column over the loaded jobs."""
+        view = self._data[name][:self.size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self):
+        return self.size
+
+    # ----- Selection -----
+    def mask(self, country=None, start=None, end=None):
+        """Boolean row mask for country and start <= created < end (None = all)."""
+        mask = np.ones(self.size, dtype=bool)
+        if country is not None:
+            mask &= self.column('country') == self.labels['country'].codes.get(country, -2)
+        if start is not None or end is not None:
+            created = self.column('created')
+            if start is not None:
+                mask &= created >= start
+            if end is not None:
+                mask &= created < end
+        return mask
+
+    def salaries(self, which='salary_max', country=None, start=None, end=None):
+        """Known salaries of the selected jobs (float array)."""
+        values = self.column(which)
+        selected = values[self.mask(country, start, end)]
+        return selected[~np.isnan(selected)]
+
+    # ----- Aggregates -----
+    def percentiles(self, qs=PERCENTILES, which='salary_max', country=None, start=None, end=None):
+        """{q: salary} for each percentile q, or {} if no salaries are known."""
+        values = self.salaries(which, country, start, end)
+        if not len(values):
+            return {}
+        return dict(zip(qs, np.percentile(values, qs).tolist()))
+
+    def histogram(self, bins=20, which='salary_max', country=None, start=None, end=None):
+        """(counts, bin edges) of known salaries."""
+        return np.histogram(self.salaries(which, country, start, end), bins=bins)
+
+    def group(self, by='location', which='salary_max', country=None, top=10):
+        """Largest groups as (label, jobs, jobs with salary, median salary) rows.
+
+        Median salary is None for groups without any known salary.
+        """
+        codes = self.column(by)
+        mask = self.mask(country) & (codes >= 0)
+        codes = codes[mask]
+        if not len(codes):
+            return []
+        labels = self.labels[by].values
+        counts = np.bincount(codes, minlength=len(labels))
+        medians, salaried = _group_medians(codes, self.column(which)[mask], len(labels))
+        order = np.argsort(-counts, kind='stable')[:top]
+        return [(labels[i], int(counts[i]), int(salaried[i]),
+                 float(medians[i]) if salaried[i] else None)
+                for i in order if counts[i]]
+
+    def time_series(self, period='day', which='salary_max', country=None, start=None, end=None):
+        """Postings per period as (period start 'YYYY-MM-DD', jobs, median salary) rows.
+
+        period is day, week (ISO, from Monday) or month; undated jobs are left out.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period {period!r}; expected one of {', '.join(PERIODS)}")
+        created = self.column('created')
+        mask = self.mask(country, start, end) & ~np.isnan(created)
+        if not mask.any():
+            return []
+        days = np.floor(created[mask] / DAY).astype('int64')
+        if period == 'week':
+            # Epoch day 0 was a Thursday
+            days -= (days + 3) % 7
+        buckets = days.astype('datetime64[D]').astype(f'datetime64[{PERIODS[period]}]')
+        keys, codes = np.unique(buckets, return_inverse=True)
+        counts = np.bincount(codes, minlength=len(keys))
+        medians, salaried = _group_medians(codes, self.column(which)[mask], len(keys))
+        return [(str(key.astype('datetime64[D]')), int(count),
+                 float(median) if n else None)
+                for key, count, median, n in zip(keys, counts, medians, salaried)]
+
+    # ----- Reporting -----
+    def report(self, top=5, which='salary_max'):
+        """Multi-line text summary for the Tools tab."""
+        if not self.size:
+            return "No jobs loaded"
+        salaried = int(np.count_nonzero(~np.isnan(self.column(which))))
+        lines = [f"Total Jobs Loaded: {self.size:,} ({salaried:,} with salary)"]
+        countries = self.group('country', which, top=top)
+        for country, jobs, _, _ in countries:
+            pct = self.percentiles(which=which, country=country)
+            if pct:
+                spread = "  ".join(f"p{q} {format_salary(v, country)}" for q, v in pct.items())
+                lines.append(f"{country.upper():<4}{jobs:>8,} jobs  {spread}")
+        # Medians only mean something within one currency
+        single = countries[0][0] if len(self.labels['country'].values) == 1 else None
+        for by in ('location', 'company'):
+            rows = self.group(by, which, country=single, top=top)
+            if rows:
+                lines.append(f"{GROUP_TITLES[by]}:")
+                for label, jobs, _, median in rows:
+                    salary = f"  median {format_salary(median, single)}" if single and median else ""
+                    lines.append(f"  {label[:40]:<40}{jobs:>7,}{salary}")
+        series = self.time_series('week', which)
+        if series:
+            lines.append("Postings per week: " + ", ".join(
+                f"{week[5:]} {jobs:,}" for week, jobs, _ in series[-6:]))
+        return "\n".join(lines)
+
+
+def _group_medians(codes, values, groups):
+    """(median, count) of the non-NaN values per group code, as arrays of length groups."""
+    known = ~np.isnan(values)
+    codes, values = codes[known], values[known]
+    salaried = np.bincount(codes, minlength=groups)
+    medians = np.full(groups, np.nan)
+    if not len(values):
+        return medians, salaried
+    order = np.lexsort((values, codes))
+    ordered = values[order]
+    starts = np.concatenate(([0], np.cumsum(salaried)[:-1]))
+    present = salaried > 0
+    lo = starts[present] + (salaried[present] - 1) // 2
+    hi = starts[present] + salaried[present] // 2
+    medians[present] = (ordered[lo] + ordered[hi]) / 2
+    return medians, salaried
@@ -0,0 +1,257 @@
+"""
+Sort and filter engine for the results tables.
+
+JobTableModel wraps the in-memory list of Job records and precomputes one
+key array per sortable column as jobs are loaded (timestamps, numeric
+salaries, casefolded strings), so a sort never re-derives a key. Each
+column's ascending permutation is cached; sorting the other way is just
+the reversed permutation. Date ranges are resolved by bisecting a sorted
+timestamp index. Given a text_index.TextIndex, the model keeps it in step
+with the loaded jobs and can narrow the view to a text query; matches are
+shown in the current sort order and combine with the date range.
+Likewise a geo_index.GeoIndex enables radius and bounding-box filters,
+and salary ranges bisect the sorted Salary keys; all filters combine.
+
+The model is itself a sequence of the currently visible jobs, in display
+order, so it can be bound directly to a VirtualTable.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+
+MISSING_DATE = float('-inf')
+MISSING_NUMBER = float('-inf')
+
+
+def parse_day(text, end=False):
+    """'YYYY-MM-DD' -> timestamp of the start (or end) of that UTC day."""
+    day = datetime.strptime(text.strip(), "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    return day.timestamp() + (86400 if end else 0)
+
+
+def _number(value):
+    return value if value is not None else MISSING_NUMBER
+
+
+def _text(value):
+    return value.casefold() if isinstance(value, str) else ''
+
+
+# Column name -> key function over a job_record.Job
+KEY_FUNCTIONS = {
+    'Date': lambda job: job.created if job.created is not None else MISSING_DATE,
+    'Title': lambda job: _text(job.title),
+    'Company': lambda job: _text(job.company),
+    'Location': lambda job: _text(job.location),
+    'Country': lambda job: _text(job.country),
+    'Type': lambda job: _text(job.contract_type),
+    'Salary': lambda job: _number(job.salary_max),
+    'Score': lambda job: _number(job.score),
+    'Category': lambda job: _text(job.category),
+    'Skills': lambda job: len(job.skills or ()),
+}
+
+
+class JobTableModel:
+    """Sortable, date-filterable view over a list of jobs."""
+
+    def __init__(self, jobs=None, key_functions=KEY_FUNCTIONS, text_index=None, geo_index=None):
+        self.key_functions = key_functions
+        self.text_index = text_index
+        self.geo_index = geo_index
+        self.jobs = []
+        self.keys = {column: [] for column in key_functions}
+        self.sort_column = None
+        self.sort_reverse = False
+        self.date_range = None
+        self.query = ''
+        self.area = None
+        self.salary_range = None
+        self._view = None
+        self._permutations = {}
+        self._sorted_keys = {}
+        if jobs is not None:
+            self.load(jobs)
+
+    # ----- Loading -----
+    def load(self, jobs):
+        """Replace the model contents (the list is adopted, not copied)."""
+        self.jobs = jobs
+        self.keys = {column: [fn(job) for job in jobs]
+                     for column, fn in self.key_functions.items()}
+        if self.text_index is not None:
+            self.text_index.clear()
+            self.text_index.add(jobs)
+        if self.geo_index is not None:
+            self.geo_index.clear()
+            self.geo_index.add(jobs)
+        self._invalidate()
+
+    def extend(self, jobs):
+        """Append jobs, computing their keys once."""
+        for column, fn in self.key_functions.items():
+            self.keys[column].extend(fn(job) for job in jobs)
+        if self.text_index is not None:
+            self.text_index.add(jobs)
+        if self.geo_index is not None:
+            self.geo_index.add(jobs)
+        self.jobs.extend(jobs)
+        self._invalidate()
+
+    def clear(self):
+        self.load([])
+
+    def _invalidate(self):
+        self._permutations.clear()
+        self._sorted_keys.clear()
+        self._view = None
+
+    # ----- Sorting -----
+    def permutation(self, column):
+        """Indices of all jobs in ascending column order (cached)."""
+        perm = self._permutations.get(column)
+        if perm is None:
+            keys = self.keys[column]
+            perm = sorted(range(len(keys)), key=keys.__getitem__)
+            self._permutations[column] = perm
+        return perm
+
+    def sort(self, column, reverse=None):
+        """Sort by column; reverse=None toggles when re-sorting the same column."""
+        if reverse is None:
+            reverse = not self.sort_reverse if column == self.sort_column else False
+        self.sort_column = column
+        self.sort_reverse = reverse
+        self._view = None
+
+    # ----- Date filtering -----
+    def sorted_keys(self, column):
+        """(ascending keys, job indices) of a column, for bisecting ranges (cached)."""
+        index = self._sorted_keys.get(column)
+        if index is None:
+            perm = self.permutation(column)
+            keys = self.keys[column]
+            index = self._sorted_keys[column] = ([keys[i] for i in perm], perm)
+        return index
+
+    def date_index(self):
+        """(sorted timestamps, job indices) for bisecting date ranges."""
+        return self.sorted_keys('Date')
+
+    def indices_between(self, start=None, end=None):
+        """Job indices with start <= created < end (timestamps, None = open)."""
+        stamps, perm = self.date_index()
+        lo = bisect_left(stamps, start) if start is not None else bisect_right(stamps, MISSING_DATE)
+        hi = bisect_left(stamps, end) if end is not None else len(stamps)
+        return perm[lo:hi]
+
+    def filter_by_date(self, start=None, end=None):
+        """Show only jobs created in [start, end); both None clears the filter."""
+        self.date_range = None if start is None and end is None else (start, end)
+        self._view = None
+
+    # ----- Text search -----
+    def filter_by_text(self, query):
+        """Show only jobs matching a text_index query; '' clears the filter."""
+        if query.strip() and self.text_index is None:
+            raise ValueError("Text search needs a model built with a text_index")
+        self.query = query.strip()
+        self._view = None
+
+    def text_matches(self):
+        """Ascending job indices matching the query, or None if unfiltered."""
+        return self.text_index.search(self.query) if self.query else None
+
+    # ----- Salary filtering -----
+    def filter_by_salary(self, minimum=None, maximum=None):
+        """Show only jobs with minimum <= salary_max <= maximum; both None clears."""
+        self.salary_range = None if minimum is None and maximum is None else (minimum, maximum)
+        self._view = None
+
+    def salary_matches(self):
+        """Job indices in the salary range (salary order), or None if unfiltered."""
+        if self.salary_range is None:
+            return None
+        minimum, maximum = self.salary_range
+        salaries, perm = self.sorted_keys('Salary')
+        lo = bisect_left(salaries, minimum) if minimum is not None else bisect_right(salaries, MISSING_NUMBER)
+        hi = bisect_right(salaries, maximum) if maximum is not None else len(salaries)
+        return perm[lo:hi]
+
+    # ----- Area filtering -----
+    def filter_by_area(self, radius=None, box=None):
+        """Show only jobs near a point or inside a box; both None clears.
+
+        radius is (lat, lon, km); box is (south, west, north, east) in degrees.
+        """
+        if radius is not None and box is not None:
+            raise ValueError("Filter by a radius or a box, not both")
+        if (radius or box) and self.geo_index is None:
+            raise ValueError("Area filters need a model built with a geo_index")
+        self.area = ('radius', radius) if radius else ('box', box) if box else None
+        self._view = None
+
+    def area_matches(self):
+        """Ascending job indices in the area, or None if unfiltered."""
+        if self.area is None:
+            return None
+        kind, args = self.area
+        if kind == 'radius':
+            return self.geo_index.within_radius(*args)
+        return self.geo_index.within_box(*args)
+
+    # ----- Visible rows -----
+    def view(self):
+        """Job indices currently visible, in display order."""
+        if self._view is None:
+            self._view = self._build_view()
+        return self._view
+
+    def _mask(self, indices):
+        mask = bytearray(len(self.jobs))
+        for i in indices:
+            mask[i] = 1
+        return mask
+
+    def _build_view(self):
+        filters = [matches for matches in (self.text_matches(), self.area_matches(),
+                                           self.salary_matches())
+                   if matches is not None]
+        if self.sort_column is None and self.date_range is None and not filters:
+            return range(len(self.jobs))
+
+        selected = None
+        if self.date_range is not None:
+            selected = self.indices_between(*self.date_range)
+            if self.sort_column == 'Date':
+                # The date index is already in date order; unsorted views fall
+                # through to load order like every other filter
+                for matches in filters:
+                    mask = self._mask(matches)
+                    selected = [i for i in selected if mask[i]]
+                return selected[::-1] if self.sort_reverse else selected
+        for matches in filters:
+            if selected is None:
+                selected = matches
+            else:
+                mask = self._mask(matches)
+                selected = [i for i in selected if mask[i]]
+        if self.sort_column is None:
+            # Load order
+            return sorted(selected)
+
+        order = self.permutation(self.sort_column)
+        if selected is not None:
+            mask = self._mask(selected)
+            order = [i for i in order if mask[i]]
+        return order[::-1] if self.sort_reverse else order
+
+    def __len__(self):
+        return len(self.view())
+
+    def __getitem__(self, index):
+        return self.jobs[self.view()[index]]
+
+    def __iter__(self):
+        jobs = self.jobs
+        return (jobs[i] for i in self.view())
@@ -0,0 +1,138 @@
+"""
+In-memory inverted index for filtering loaded jobs as you type.
+
+Title, company, location and description are split into casefolded
+tokens as jobs are added; each token maps to the ascending list of job
+positions containing it. A query is a list of terms that must all match
+(``AND`` is implied and may be written out); a term prefixed with ``-``
+or preceded by ``NOT`` excludes jobs. Every term is a prefix, so
+``pyth`` matches "python" and "Python3": the prefix range is found by
+bisecting the sorted vocabulary, never by scanning jobs.
+
+Positions are the jobs' indices in load order, so results line up with
+JobTableModel's key arrays and can be sorted by its permutations.
+"""
+
+import re
+from bisect import bisect_left
+
+# Words plus trailing + or # so "C++" and "C#" stay searchable
+TOKEN_RE = re.compile(r"\w[\w+#]*")
+
+FIELDS = ('title', 'company', 'location', 'description')
+
+# Prefix -> match set entries kept between adds (one per keystroke)
+TERM_CACHE_SIZE = 256
+
+
+def tokenize(text):
+    """Casefolded tokens of text (none for empty text or None)."""
+    return TOKEN_RE.findall(text.casefold()) if text else []
+
+
+def parse_query(query):
+    """'python -senior NOT java' -> (['python'], ['senior', 'java'])."""
+    include, exclude = [], []
+    negate = False
+    for word in query.split():
+        if word == 'AND':
+            continue
+        if word == 'NOT':
+            negate = True
+            continue
+        if word.startswith('-') and len(word) > 1:
+            negate = True
+            word = word[1:]
+        # "node.js" is two tokens; each must match
+        (exclude if negate else include).extend(tokenize(word))
+        negate = False
+    return include, exclude
+
+
+class TextIndex:
+    """Token -> job positions over the given Job attributes."""
+
+    def __init__(self, jobs=(), fields=FIELDS):
+        self.fields = fields
+        self.postings = {}
+        self.size = 0
+        self._vocabulary = None
+        self._term_cache = {}
+        self.add(jobs)
+
+    def add(self, jobs):
+        """Index jobs as the next positions in load order."""
+        postings = self.postings
+        fields = self.fields
+        position = self.size
+        for job in jobs:
+            tokens = set()
+            for field in fields:
+                value = getattr(job, field)
+                if value:
+                    tokens.update(TOKEN_RE.findall(value.casefold()))
+            for token in tokens:
+                posting = postings.get(token)
+                if posting is None:
+                    postings[token] = [position]
+                else:
+                    posting.append(position)
+            position += 1
+        if position != self.size:
+            self.size = position
+            self._vocabulary = None
+            self._term_cache.clear()
+
+    def clear(self):
+        self.postings = {}
+        self.size = 0
+        self._vocabulary = None
+        self._term_cache.clear()
+
+    def vocabulary(self):
+        """All tokens, sorted (rebuilt lazily after adds)."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        return self._vocabulary
+
+    def prefix_tokens(self, prefix):
+        """Tokens starting with prefix."""
+        vocabulary = self.vocabulary()
+        tokens = []
+        for i in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            token = vocabulary[i]
+            if not token.startswith(prefix):
+                break
+            tokens.append(token)
+        return tokens
+
+    def term(self, prefix):
+        """Set of positions with a token starting with prefix (cached until the next add)."""
+        matches = self._term_cache.get(prefix)
+        if matches is None:
+            tokens = self.prefix_tokens(prefix)
+            if len(tokens) == 1:
+                matches = set(self.postings[tokens[0]])
+            else:
+                matches = set()
+                for token in tokens:
+                    matches.update(self.postings[token])
+            if len(self._term_cache) >= TERM_CACHE_SIZE:
+                self._term_cache.clear()
+            self._term_cache[prefix] = matches
+        return matches
+
+    def search(self, query):
+        """Ascending positions matching query, or None if it has no terms."""
+        include, exclude = parse_query(query)
+        if not include and not exclude:
+            return None
+        if include:
+            # Intersect smallest first so later steps shrink fastest
+            sets = sorted((self.term(t) for t in include), key=len)
+            matches = sets[0].intersection(*sets[1:])
+        else:
+            matches = set(range(self.size))
+        for t in exclude:
+            matches.difference_update(self.term(t))
+        return sorted(matches)
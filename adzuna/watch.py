@@ -0,0 +1,248 @@
+"""
+Watch mode: re-run saved searches on a schedule and report only changes.
+
+Saved searches are batch.Query entries (the same JSON/NDJSON/CSV
+manifests ``batch`` reads). Watcher re-runs each one every ``interval``
+seconds, give or take ``jitter`` (a fraction of the interval) so that
+searches don't fire in lockstep, through a single AdzunaClient whose
+pooled connections stay open between cycles. Responses are never served
+from the response cache, since a watch is only useful with fresh data,
+and are decoded straight into Job records (``as_jobs``).
+
+Each run is diffed against the previous one for that search, by job id
+and a content hash of the fields a reader would notice changing
+(content_hash). Only the differences are emitted, as Delta records:
+
+- ``new``: a job id not seen in the previous run
+- ``changed``: a known id whose content hash differs
+- ``expired``: a known id missing from this run, i.e. gone from the
+  search's first ``max_results`` results
+
+WatchState keeps one {id: hash} map per search, replaced on every run, so
+memory is bounded by the searches' max_results however long the watch
+runs; between runs the thread just waits on an Event. The state can be
+saved to a JSON file, so a restarted watch carries on without reporting
+everything as new again. A failed run reports nothing and leaves the
+state alone, so an outage doesn't look like every job expiring.
+"""
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+
+from . import json_codec
+from .errors import AdzunaAPIError
+from .job_record import as_job
+
+DEFAULT_INTERVAL = 15 * 60
+DEFAULT_JITTER = 0.1
+DELTA_KINDS = ("new", "changed", "expired")
+# Job fields whose change makes a posting "changed"
+HASHED_FIELDS = ('title', 'description', 'company', 'location', 'salary_min', 'salary_max',
+                 'contract_type', 'contract_time', 'category', 'redirect_url')
+
+
+def content_hash(job):
+    """64-bit hash of a job's visible content (see HASHED_FIELDS)."""
+    text = '\x1f'.join('' if getattr(job, name) is None else str(getattr(job, name))
+                       for name in HASHED_FIELDS)
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class Delta:
+    """One new, changed or expired job of a saved search."""
+
+    def __init__(self, kind, search, job_id, job=None, at=None):
+        self.kind = kind
+        self.search = search
+        self.job_id = job_id
+        # None for expired jobs, which are only known by id
+        self.job = job
+        self.at = time.time() if at is None else at
+
+    def to_dict(self):
+        return {
+            'event': self.kind,
+            'search': self.search,
+            'id': self.job_id,
+            'at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.at)),
+            'job': self.job.to_dict() if self.job is not None else None,
+        }
+
+    def __repr__(self):
+        return f"Delta({self.kind!r}, {self.search!r}, {self.job_id!r})"
+
+
+class WatchState:
+    """Last run's {job id: content hash} per saved search, optionally saved to a file."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.searches = {}
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.searches = json.load(f).get('searches', {})
+
+    def __contains__(self, key):
+        return key in self.searches
+
+    def diff(self, key, jobs, at=None):
+        """Deltas of jobs against the previous run of search key, which jobs then replace."""
+        previous = self.searches.get(key, {})
+        current = {}
+        deltas = []
+        for job in jobs:
+            digest = content_hash(job)
+            if job.id in current:
+                continue
+            current[job.id] = digest
+            before = previous.get(job.id)
+            if before is None:
+                deltas.append(Delta('new', key, job.id, job, at))
+            elif before != digest:
+                deltas.append(Delta('changed', key, job.id, job, at))
+        deltas.extend(Delta('expired', key, job_id, None, at)
+                      for job_id in previous if job_id not in current)
+        self.searches[key] = current
+        return deltas
+
+    def save(self):
+        """Rewrite the state file atomically (no-op without a path)."""
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'searches': self.searches}, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+class DeltaLog:
+    """Appends deltas to an NDJSON file, one object per line; usable as on_deltas."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, run):
+        if not run.deltas:
+            return
+        # Opened per run, so no descriptor is held while idle and the file can be rotated
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for delta in run.deltas:
+                f.write(json_codec.dumps(delta.to_dict()))
+                f.write('\n')
+
+
+class WatchRun:
+    """Outcome of one run of a saved search."""
+
+    def __init__(self, query, deltas=(), jobs=0, seconds=0.0, error=None):
+        self.query = query
+        self.deltas = list(deltas)
+        self.jobs = jobs
+        self.seconds = seconds
+        self.error = error
+
+    def counts(self):
+        """{kind: number of deltas} for every kind."""
+        counts = dict.fromkeys(DELTA_KINDS, 0)
+        for delta in self.deltas:
+            counts[delta.kind] += 1
+        return counts
+
+    def __repr__(self):
+        return f"WatchRun({self.query.key!r}, {self.counts()}, error={self.error!r})"
+
+
+class Watcher:
+    """Re-run saved searches every interval seconds (± jitter) and emit their deltas.
+
+    on_deltas(run) is called with each WatchRun, including runs without
+    deltas or with an error, from the thread calling run(). With
+    emit_initial=False the first run of a search without saved state
+    only records a baseline.
+    """
+
+    def __init__(self, client, queries, interval=DEFAULT_INTERVAL, jitter=DEFAULT_JITTER,
+                 state=None, on_deltas=None, emit_initial=True, page_workers=1,
+                 stop_event=None, rng=None, clock=time.monotonic):
+        self.client = client
+        self.queries = list({query.key: query for query in queries}.values())
+        self.interval = interval
+        self.jitter = jitter
+        self.state = state or WatchState()
+        self.on_deltas = on_deltas
+        self.emit_initial = emit_initial
+        self.page_workers = page_workers
+        self.stop_event = stop_event or threading.Event()
+        self.rng = rng or random.Random()
+        self.clock = clock
+        self.due = {}
+
+    def next_delay(self):
+        """Seconds until a search's next run: the interval, jittered."""
+        return self.interval * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    def check(self, query):
+        """Run one saved search now, diff it and emit the run."""
+        start = time.perf_counter()
+        try:
+            jobs = self.client.search(
+                query.search_term, query.location, max_results=query.max_results,
+                max_workers=self.page_workers, country=query.country, use_cache=False,
+                cancel_event=self.stop_event, as_jobs=True)
+        except AdzunaAPIError as e:
+            run = WatchRun(query, seconds=time.perf_counter() - start, error=str(e))
+        else:
+            if self.stop_event.is_set():
+                # Possibly cut short; diffing it would report false expiries
+                return WatchRun(query, seconds=time.perf_counter() - start, error="stopped")
+            baseline = not self.emit_initial and query.key not in self.state
+            deltas = self.state.diff(query.key, [as_job(job) for job in jobs])
+            self.state.save()
+            run = WatchRun(query, () if baseline else deltas, len(jobs),
+                           time.perf_counter() - start)
+        if self.on_deltas:
+            self.on_deltas(run)
+        return run
+
+    def run_due(self):
+        """Run every search that is due; returns their WatchRuns."""
+        runs = []
+        for query in self.queries:
+            if self.stop_event.is_set():
+                break
+            if self.due.get(query.key, 0) <= self.clock():
+                runs.append(self.check(query))
+                self.due[query.key] = self.clock() + self.next_delay()
+        return runs
+
+    def run(self, cycles=None):
+        """Watch until stop() (or for cycles runs of each search); returns the run count."""
+        if not self.queries:
+            return 0
+        # First runs are spread over the jitter window instead of all at once
+        now = self.clock()
+        for query in self.queries:
+            self.due.setdefault(query.key, now + self.rng.uniform(0, self.jitter * self.interval))
+        runs = 0
+        while not self.stop_event.is_set():
+            runs += len(self.run_due())
+            if cycles is not None and runs >= cycles * len(self.queries):
+                break
+            wait = min(self.due.values()) - self.clock()
+            if wait > 0:
+                # Blocks without polling; stop() wakes it at once
+                self.stop_event.wait(wait)
+        return runs
+
+    def stop(self):
+        self.stop_event.set()
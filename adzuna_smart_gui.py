@@ -6,12 +6,30 @@ Combines: run_gui.sh launch pattern + AdzunaApiScraper + smart_ai_job_system GUI
 
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog, StringVar, IntVar
-import requests
 import os
-import json
 from datetime import datetime
 from dotenv import load_dotenv
 import webbrowser
+import queue
+import threading
+
+from adzuna.analytics import MarketAnalytics
+from adzuna.archive import SnapshotArchive, format_trends, load_stats
+from adzuna.client import get_client
+from adzuna.countries import DEFAULT_COUNTRY, format_salary, parse_countries
+from adzuna.job_store import UNIQUE_ONLY, created_between, default_store, job_id
+from adzuna.incremental_sync import sync_search
+from adzuna.table_model import JobTableModel, parse_day
+from adzuna.text_index import TextIndex
+from adzuna.geo_index import GeoIndex, parse_box, to_km
+from adzuna.job_io import export_jobs, iter_batches, iter_jobs
+from adzuna.job_record import parse_results
+from adzuna.metrics import METRICS
+from adzuna.skills import default_extractor
+from adzuna.stats import MarketStats
+from adzuna.batch import load_manifest
+from adzuna.watch import Watcher
+from virtual_table import VirtualTable
 
 load_dotenv()
 
@@ -19,6 +37,50 @@ load_dotenv()
 current_jobs = []
 sort_reverse = False
 
+# How often (ms) the UI drains the fetch queue
+QUEUE_POLL_MS = 50
+
+# Rows moved into the table per drain; with more queued the next drain runs at once
+ROWS_PER_TICK = 2000
+
+# How often (ms) the metrics panel and status bar summary refresh
+METRICS_REFRESH_MS = 1000
+
+# How often (ms) the Statistics panel checks for newly loaded jobs
+STATS_REFRESH_MS = 1000
+
+# Pause (ms) after the last keystroke before the search box filters
+SEARCH_DEBOUNCE_MS = 150
+
+# How often (ms) the UI picks up watch mode deltas while a watch runs
+WATCH_POLL_MS = 1000
+
+# Results table column -> job_io CSV column
+CSV_EXPORT_COLUMNS = {
+    'Date': 'Date',
+    'Score': 'Score',
+    'Category': 'Category',
+    'Title': 'Title',
+    'Company': 'Company',
+    'Location': 'Location',
+    'Country': 'Country',
+    'Type': 'Type',
+    'Salary': 'Salary Max',
+    'Skills': 'Skills',
+    'Link': 'Link',
+}
+
+# Results table column -> JobStore sort column, for the stored-jobs view
+STORE_SORT_COLUMNS = {
+    'Date': 'created',
+    'Title': 'title',
+    'Company': 'company',
+    'Location': 'location',
+    'Country': 'country',
+    'Type': 'contract_type',
+    'Salary': 'salary_max',
+}
+
 
 class AdzunaJobScraperGUI:
     """Smart Adzuna Job Scraper with tabbed interface"""
@@ -29,11 +91,49 @@ class AdzunaJobScraperGUI:
         self.root.geometry("1600x950")
         
         self.current_jobs = []
+        # Sort/filter engine; adopts current_jobs and is what the table shows.
+        # Its text index grows with every page, so the search box never rescans jobs
+        self.table_model = JobTableModel(self.current_jobs, text_index=TextIndex(),
+                                         geo_index=GeoIndex())
+        self.search_after_id = None
+        # NumPy columns behind the Tools tab statistics, extended page by page
+        self.market_stats = MarketStats()
+        self.stats_size = None
+        # Skills and relevance score for every fetched job (ADZUNA_SKILLS_FILE)
+        self.skill_extractor = default_extractor()
         self.selected_job_id = None
         self.processing = False
         
+        # Background fetch state: worker thread -> fetch_queue -> UI
+        self.fetch_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.fetch_generation = 0
+        self.background_action = 'Fetched'
+        # Client of the last API fetch, for its cache stats
+        self.fetch_client = None
+        
+        # Every fetched job is upserted into the local SQLite history, which
+        # flags reposts of stored postings as near-duplicates (dedupe.py)
+        self.store = default_store()
+        self.stored_view = None
+        self.hide_duplicates = True
+        
+        # Each fetch can be kept as a columnar snapshot for salary trends (archive.py)
+        self.archive = SnapshotArchive()
+        
+        # Watch mode: saved searches re-run on a worker thread; (watcher, kind, payload)
+        # comes back here. results_watcher is the watch the Results tab is showing, if any.
+        self.watcher = None
+        self.results_watcher = None
+        self.watch_queue = queue.Queue()
+        
+        # Stage timings and API counters for the Tools tab and status bar
+        METRICS.enable()
+        
         self.setup_ui()
         self.check_credentials()
+        self.refresh_metrics()
+        self.refresh_statistics()
     
     def setup_ui(self):
         """Create tabbed interface"""
@@ -57,11 +157,13 @@ class AdzunaJobScraperGUI:
         self.setup_results_tab()
         self.setup_tools_tab()
         
-        # Status bar
+        # Status bar: fetch status on the left, live metrics summary on the right
+        status_frame = ttk.Frame(self.root, relief=tk.SUNKEN)
+        status_frame.pack(side='bottom', fill='x')
         self.status_var = tk.StringVar(value="Ready")
-        status_bar = ttk.Label(self.root, textvariable=self.status_var,
-                               relief=tk.SUNKEN, anchor=tk.W)
-        status_bar.pack(side='bottom', fill='x')
+        ttk.Label(status_frame, textvariable=self.status_var, anchor=tk.W).pack(side='left', fill='x', expand=True)
+        self.metrics_var = tk.StringVar(value="")
+        ttk.Label(status_frame, textvariable=self.metrics_var, anchor=tk.E).pack(side='right', padx=5)
     
     def setup_search_tab(self):
         """Setup job search tab"""
@@ -94,14 +196,42 @@ class AdzunaJobScraperGUI:
         self.max_results_var = IntVar(value=50)
         ttk.Spinbox(control_frame, from_=10, to=500, textvariable=self.max_results_var, width=10).grid(row=2, column=1, sticky='w', padx=5, pady=5)
         
+        # Countries: several (comma-separated) fan out in parallel
+        ttk.Label(control_frame, text="Countries:").grid(row=3, column=0, sticky='e', padx=5, pady=5)
+        self.countries_entry = ttk.Entry(control_frame, width=30)
+        self.countries_entry.grid(row=3, column=1, sticky='w', padx=5, pady=5)
+        self.countries_entry.insert(0, DEFAULT_COUNTRY)
+        ttk.Label(control_frame, text="e.g. gb,us,de").grid(row=3, column=2, sticky='w', padx=5, pady=5)
+        
+        # Incremental mode: newest-first, stop at the last run's high-water mark
+        self.incremental_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="🔄 Only new since last sync",
+                        variable=self.incremental_var).grid(row=4, column=1, sticky='w', padx=5, pady=5)
+        self.archive_var = tk.BooleanVar(value=bool(os.getenv("ADZUNA_ARCHIVE_DIR")))
+        ttk.Checkbutton(control_frame, text="🗄️ Archive each fetch for trends",
+                        variable=self.archive_var).grid(row=5, column=1, sticky='w', padx=5, pady=5)
+        
         # Buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill='x', pady=10)
         
-        ttk.Button(button_frame, text="🚀 Fetch Jobs", command=self.fetch_jobs).pack(side='left', padx=5)
+        self.fetch_button = ttk.Button(button_frame, text="🚀 Fetch Jobs", command=self.fetch_jobs)
+        self.fetch_button.pack(side='left', padx=5)
+        self.cancel_button = ttk.Button(button_frame, text="⛔ Cancel", command=self.cancel_fetch,
+                                        state='disabled')
+        self.cancel_button.pack(side='left', padx=5)
         ttk.Button(button_frame, text="💾 Save Results", command=self.save_to_json).pack(side='left', padx=5)
         ttk.Button(button_frame, text="📊 Refresh", command=self.refresh_results).pack(side='left', padx=5)
         
+        # Progress (pages done / total)
+        progress_frame = ttk.Frame(main_frame)
+        progress_frame.pack(fill='x', pady=5)
+        
+        self.progress = ttk.Progressbar(progress_frame, mode='determinate', maximum=1)
+        self.progress.pack(side='left', fill='x', expand=True, padx=5)
+        self.progress_var = tk.StringVar(value="")
+        ttk.Label(progress_frame, textvariable=self.progress_var, width=20).pack(side='left', padx=5)
+        
         # Info section
         info_frame = ttk.LabelFrame(main_frame, text="Status", padding="10")
         info_frame.pack(fill='both', expand=True, pady=10)
@@ -120,37 +250,104 @@ class AdzunaJobScraperGUI:
         main_frame = ttk.Frame(self.results_tab, padding="10")
         main_frame.pack(fill='both', expand=True)
         
+        # View toggle: this session's fetch, or everything in the job store
+        view_frame = ttk.Frame(main_frame)
+        view_frame.pack(fill='x', pady=(0, 5))
+        self.show_stored_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(view_frame, text="📚 Show all stored jobs", variable=self.show_stored_var,
+                        command=self.show_results_model).pack(side='left', padx=5)
+        self.stored_count_var = tk.StringVar(value="")
+        ttk.Label(view_frame, textvariable=self.stored_count_var).pack(side='left', padx=5)
+        self.hide_duplicates_var = tk.BooleanVar(value=self.hide_duplicates)
+        ttk.Checkbutton(view_frame, text="Hide near-duplicates", variable=self.hide_duplicates_var,
+                        command=self.toggle_duplicates).pack(side='left', padx=5)
+        
+        # Filter-as-you-type over title, company, location and description
+        ttk.Label(view_frame, text="🔎 Search:").pack(side='left', padx=(15, 0))
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(view_frame, textvariable=self.search_var, width=30)
+        search_entry.pack(side='left', padx=5)
+        self.search_var.trace_add('write', self.schedule_text_filter)
+        ttk.Label(view_frame, text="(prefixes; -word or NOT word to exclude)",
+                  foreground='gray').pack(side='left')
+        
+        # Date range filter (YYYY-MM-DD, either end may be blank)
+        ttk.Button(view_frame, text="Reset", command=self.reset_date_filter).pack(side='right', padx=5)
+        ttk.Button(view_frame, text="Filter", command=self.filter_by_date).pack(side='right', padx=5)
+        self.date_to_entry = ttk.Entry(view_frame, width=12)
+        self.date_to_entry.pack(side='right', padx=5)
+        ttk.Label(view_frame, text="To:").pack(side='right')
+        self.date_from_entry = ttk.Entry(view_frame, width=12)
+        self.date_from_entry.pack(side='right', padx=5)
+        ttk.Label(view_frame, text="From:").pack(side='right')
+        
+        # Area and salary filters over this session's jobs (see adzuna/geo_index.py)
+        area_frame = ttk.Frame(main_frame)
+        area_frame.pack(fill='x', pady=(0, 5))
+        ttk.Label(area_frame, text="📍 Near:").pack(side='left', padx=5)
+        self.near_entry = ttk.Entry(area_frame, width=24)
+        self.near_entry.pack(side='left', padx=5)
+        ttk.Label(area_frame, text="Within (mi):").pack(side='left')
+        self.within_entry = ttk.Entry(area_frame, width=6)
+        self.within_entry.insert(0, "10")
+        self.within_entry.pack(side='left', padx=5)
+        ttk.Label(area_frame, text="or box S,W,N,E:").pack(side='left', padx=(10, 0))
+        self.bbox_entry = ttk.Entry(area_frame, width=24)
+        self.bbox_entry.pack(side='left', padx=5)
+        ttk.Label(area_frame, text="Salary:").pack(side='left', padx=(10, 0))
+        self.min_salary_entry = ttk.Entry(area_frame, width=9)
+        self.min_salary_entry.pack(side='left', padx=5)
+        ttk.Label(area_frame, text="to").pack(side='left')
+        self.max_salary_entry = ttk.Entry(area_frame, width=9)
+        self.max_salary_entry.pack(side='left', padx=5)
+        ttk.Button(area_frame, text="Filter", command=self.filter_by_area).pack(side='left', padx=5)
+        ttk.Button(area_frame, text="Reset", command=self.reset_area_filter).pack(side='left', padx=5)
+        ttk.Label(area_frame, text="(place name from the results, or lat,lon)",
+                  foreground='gray').pack(side='left')
+        
         # Results table
         table_frame = ttk.Frame(main_frame)
         table_frame.pack(fill='both', expand=True)
         
-        tree_scroll = ttk.Scrollbar(table_frame)
-        tree_scroll.pack(side='right', fill='y')
-        
-        self.tree = ttk.Treeview(table_frame, yscrollcommand=tree_scroll.set, selectmode='browse')
-        self.tree.pack(side='left', fill='both', expand=True)
-        tree_scroll.config(command=self.tree.yview)
-        
-        # Define columns
-        self.tree['columns'] = ('Date', 'Title', 'Company', 'Location', 'Type', 'Salary', 'Link')
+        # Only on-screen rows exist as Treeview items; see virtual_table.py
+        self.tree = VirtualTable(
+            table_frame,
+            ('Date', 'Score', 'Category', 'Title', 'Company', 'Location', 'Country', 'Type',
+             'Salary', 'Skills', 'Link'),
+            lambda idx, job: (str(idx + 1), self._job_row(self._scored(job))),
+        )
+        self.tree.pack(fill='both', expand=True)
         
         self.tree.column('#0', width=50, minwidth=50)
         self.tree.column('Date', width=70, minwidth=60)
+        self.tree.column('Score', width=50, minwidth=40)
+        self.tree.column('Category', width=120, minwidth=80)
         self.tree.column('Title', width=250, minwidth=200)
         self.tree.column('Company', width=150, minwidth=100)
         self.tree.column('Location', width=150, minwidth=100)
+        self.tree.column('Country', width=60, minwidth=50)
         self.tree.column('Type', width=100, minwidth=80)
         self.tree.column('Salary', width=100, minwidth=80)
+        self.tree.column('Skills', width=250, minwidth=100)
         self.tree.column('Link', width=0, stretch=False)
         
-        # Headings
+        # Headings (click to sort)
         self.tree.heading('#0', text='#', anchor=tk.W)
-        self.tree.heading('Date', text='Date', anchor=tk.W)
-        self.tree.heading('Title', text='Job Title', anchor=tk.W)
-        self.tree.heading('Company', text='Company', anchor=tk.W)
-        self.tree.heading('Location', text='Location', anchor=tk.W)
-        self.tree.heading('Type', text='Type', anchor=tk.W)
-        self.tree.heading('Salary', text='Salary', anchor=tk.W)
+        self.column_titles = {
+            'Date': 'Date',
+            'Score': 'Score',
+            'Category': 'Category',
+            'Title': 'Job Title',
+            'Company': 'Company',
+            'Location': 'Location',
+            'Country': 'Country',
+            'Type': 'Type',
+            'Salary': 'Salary',
+            'Skills': 'Skills',
+        }
+        for col, text in self.column_titles.items():
+            self.tree.heading(col, text=text, anchor=tk.W,
+                              command=lambda c=col: self.sort_by(c))
         
         # Add horizontal scrollbar
         hsb = ttk.Scrollbar(main_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
@@ -179,7 +376,58 @@ class AdzunaJobScraperGUI:
         stats_frame = ttk.LabelFrame(main_frame, text="Statistics", padding="10")
         stats_frame.pack(fill='x', pady=10)
         
-        ttk.Label(stats_frame, text=f"Total Jobs Loaded: {len(self.current_jobs)}").pack(pady=5)
+        self.stats_text = tk.Text(stats_frame, height=12, width=80, font=("Courier", 10))
+        self.stats_text.pack(fill='both', expand=True, pady=5)
+        self.stats_text.config(state='disabled')
+        
+        # Market: Adzuna's aggregate endpoints for the search tab's query,
+        # a few requests instead of downloading every posting
+        market_frame = ttk.LabelFrame(main_frame, text="Market (Adzuna aggregates)", padding="10")
+        market_frame.pack(fill='x', pady=10)
+        
+        self.market_button = ttk.Button(market_frame, text="📈 Load market stats for current search",
+                                        command=self.load_market_stats)
+        self.market_button.pack(anchor='w', padx=5)
+        self.trends_button = ttk.Button(market_frame, text="📉 Weekly trends from the snapshot archive",
+                                        command=self.load_archive_trends)
+        self.trends_button.pack(anchor='w', padx=5, pady=(5, 0))
+        self.market_text = tk.Text(market_frame, height=12, width=80, font=("Courier", 10))
+        self.market_text.pack(fill='both', expand=True, pady=5)
+        self.market_text.config(state='disabled')
+        
+        # Watch: re-run saved searches (a batch manifest) and feed their deltas to Results
+        watch_frame = ttk.LabelFrame(main_frame, text="Watch saved searches", padding="10")
+        watch_frame.pack(fill='x', pady=10)
+        
+        ttk.Label(watch_frame, text="Searches file:").pack(side='left', padx=5)
+        self.watch_manifest_entry = ttk.Entry(watch_frame, width=40)
+        self.watch_manifest_entry.pack(side='left', padx=5)
+        ttk.Button(watch_frame, text="Browse...", command=self.browse_watch_manifest).pack(side='left')
+        ttk.Label(watch_frame, text="Every (min):").pack(side='left', padx=(10, 0))
+        self.watch_every_entry = ttk.Entry(watch_frame, width=6)
+        self.watch_every_entry.insert(0, "15")
+        self.watch_every_entry.pack(side='left', padx=5)
+        self.watch_button = ttk.Button(watch_frame, text="👀 Start watch", command=self.toggle_watch)
+        self.watch_button.pack(side='left', padx=5)
+        self.watch_status_var = tk.StringVar(value="")
+        ttk.Label(watch_frame, textvariable=self.watch_status_var).pack(side='left', padx=5)
+        
+        # Metrics: per-stage timings and API counters, refreshed live
+        metrics_frame = ttk.LabelFrame(main_frame, text="Metrics", padding="10")
+        metrics_frame.pack(fill='both', expand=True, pady=10)
+        
+        metrics_buttons = ttk.Frame(metrics_frame)
+        metrics_buttons.pack(fill='x')
+        self.metrics_enabled_var = tk.BooleanVar(value=METRICS.enabled)
+        ttk.Checkbutton(metrics_buttons, text="Collect metrics", variable=self.metrics_enabled_var,
+                        command=self.toggle_metrics).pack(side='left', padx=5)
+        ttk.Button(metrics_buttons, text="Export Prometheus", command=lambda: self.export_metrics('.prom')).pack(side='left', padx=5)
+        ttk.Button(metrics_buttons, text="Export JSON", command=lambda: self.export_metrics('.json')).pack(side='left', padx=5)
+        ttk.Button(metrics_buttons, text="Reset", command=METRICS.reset).pack(side='left', padx=5)
+        
+        self.metrics_text = tk.Text(metrics_frame, height=14, width=80, font=("Courier", 10))
+        self.metrics_text.pack(fill='both', expand=True, pady=5)
+        self.metrics_text.config(state='disabled')
     
     def check_credentials(self):
         """Check if API credentials are available"""
@@ -198,11 +446,24 @@ class AdzunaJobScraperGUI:
         self.info_text.insert(tk.END, f"[{timestamp}] {message}\n")
         self.info_text.see(tk.END)
     
-    def fetch_jobs(self):
-        """Fetch jobs from Adzuna API"""
+    def fetch_jobs(self, use_cache=True):
+        """Start fetching jobs from Adzuna API on a background thread"""
+        if self.processing:
+            return
+        
+        try:
+            countries = parse_countries(self.countries_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        
         search_term = self.search_entry.get() or "python"
-        location = self.location_entry.get() or "UK"
+        # A blank location searches nationwide, except the original gb default
+        location = self.location_entry.get().strip()
+        if not location and countries == [DEFAULT_COUNTRY]:
+            location = "UK"
         max_results = self.max_results_var.get()
+        incremental = self.incremental_var.get()
         
         app_id = os.getenv("ADZUNA_APP_ID")
         api_key = os.getenv("ADZUNA_API_KEY")
@@ -211,97 +472,688 @@ class AdzunaJobScraperGUI:
             messagebox.showerror("Error", "API credentials not found")
             return
         
-        self.log_message(f"Fetching jobs for '{search_term}' in {location}...")
+        mode = "new jobs" if incremental else "jobs"
+        where = f" in {location}" if location else ""
+        self.log_message(f"Fetching {mode} for '{search_term}'{where} ({', '.join(countries).upper()})...")
         self.status_var.set("Fetching jobs...")
         
+        self.current_jobs = []
+        self.results_watcher = None
+        self.table_model.load(self.current_jobs)
+        self.market_stats.clear()
+        self.show_results_model()
+        self.progress_var.set("Page 0/?")
+        # Skills named in the search weigh most in the Score column
+        self.skill_extractor.focus_on(search_term)
+        self.fetch_client = get_client(app_id, api_key)
+        self._start_background('Fetched', self._fetch_worker, self.fetch_client,
+                               search_term, location, countries, max_results, use_cache, incremental)
+    
+    def _start_background(self, action, target, *args):
+        """Run target(generation, cancel_event, *args) on a worker thread
+        
+        The worker reports through fetch_queue; action names the outcome
+        in the log ("Fetched", "Imported").
+        """
+        self.progress.config(value=0, maximum=1)
+        
+        # A new generation makes the drain loop ignore anything a
+        # previous (cancelled) worker may still put on the queue
+        self.fetch_generation += 1
+        self.cancel_event = threading.Event()
+        self.background_action = action
+        self.processing = True
+        self.fetch_button.config(state='disabled')
+        self.cancel_button.config(state='normal')
+        
+        worker = threading.Thread(
+            target=target,
+            args=(self.fetch_generation, self.cancel_event) + args,
+            daemon=True,
+        )
+        worker.start()
+        self.root.after(QUEUE_POLL_MS, self._drain_fetch_queue, self.fetch_generation)
+    
+    def _fetch_worker(self, generation, cancel_event, client,
+                      search_term, location, countries, max_results, use_cache, incremental):
+        """Run the search off the main thread, pushing pages to the queue"""
+        def on_page(page_jobs, pages_done, total_pages):
+            self.store.upsert_jobs(page_jobs)
+            page_jobs = self._without_duplicates(page_jobs)
+            # Parse and score Job records here, off the UI thread
+            self.fetch_queue.put((generation, 'page', (self._enriched(page_jobs), pages_done, total_pages)))
+        
+        # Fan-out: sum page progress over the countries running in parallel
+        progress = {}
+        progress_lock = threading.Lock()
+        
+        def on_country_page(country, page_jobs, pages_done, total_pages):
+            self.store.upsert_jobs(page_jobs)
+            page_jobs = self._without_duplicates(page_jobs)
+            with progress_lock:
+                progress[country] = (pages_done, total_pages)
+                done = sum(d for d, _ in progress.values())
+                total = sum(t for _, t in progress.values()) + len(countries) - len(progress)
+            self.fetch_queue.put((generation, 'page', (self._enriched(page_jobs), done, total)))
+        
+        def on_sync_page(new_jobs, pages_done):
+            # sync_search stores jobs itself; the page total isn't known up front
+            new_jobs = self._without_duplicates(new_jobs)
+            self.fetch_queue.put((generation, 'page', (self._enriched(new_jobs), pages_done, pages_done)))
+        
         try:
-            url = f"https://api.adzuna.com/v1/api/jobs/gb/search/1?app_id={app_id}&app_key={api_key}&what={search_term}&where={location}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            jobs = data.get('results', [])
-            
-            if not jobs:
-                messagebox.showinfo("Info", "No jobs found")
-                self.log_message("No jobs found for this search")
-                return
-            
-            self.current_jobs = jobs[:max_results]
-            
-            # Clear and populate results table
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
-            for idx, job in enumerate(self.current_jobs, 1):
-                date_str = job.get('created', datetime.now().isoformat())[:10]
-                title = job.get('title', 'N/A')
-                company = job.get('company', {}).get('display_name', 'N/A')
-                location_name = job.get('location', {}).get('display_name', 'N/A')
-                job_type = job.get('contract_type', 'N/A')
-                salary_max = job.get('salary_max', 0)
-                salary_str = f"£{salary_max:,.0f}" if salary_max else "N/A"
-                link = job.get('redirect_url', '')
-                
-                self.tree.insert('', 'end', text=str(idx), values=(
-                    date_str, title, company, location_name, job_type, salary_str, link
-                ))
-            
-            self.log_message(f"✓ Fetched {len(jobs)} jobs")
-            self.status_var.set(f"Loaded {len(jobs)} jobs")
-            messagebox.showinfo("Success", f"Loaded {len(jobs)} jobs!")
-            
+            if incremental:
+                # Each country keeps its own high-water mark
+                jobs = []
+                for country in countries:
+                    result = sync_search(
+                        client, self.store, search_term, location, country, max_results=max_results,
+                        on_page=on_sync_page, cancel_event=cancel_event,
+                    )
+                    jobs.extend(result.new_jobs)
+                    if not result.complete and not cancel_event.is_set():
+                        self.fetch_queue.put((generation, 'log', (
+                            f"⚠ {country.upper()}: stopped at max results; "
+                            f"sync again for older new postings")))
+            elif len(countries) > 1:
+                result = client.search_countries(
+                    countries, search_term, location, max_results=max_results, use_cache=use_cache,
+                    on_page=on_country_page, cancel_event=cancel_event,
+                )
+                for country, error in result.errors.items():
+                    self.fetch_queue.put((generation, 'log', f"✗ {country.upper()} failed: {error}"))
+                jobs = result.jobs
+            else:
+                jobs = client.search(
+                    search_term, location, max_results=max_results, country=countries[0],
+                    use_cache=use_cache, on_page=on_page, cancel_event=cancel_event,
+                )
+            status = 'cancelled' if cancel_event.is_set() else 'done'
+            self.fetch_queue.put((generation, status, len(jobs)))
         except Exception as e:
-            self.log_message(f"✗ Error: {e}")
-            messagebox.showerror("Error", f"Failed to fetch jobs: {e}")
+            self.fetch_queue.put((generation, 'error', e))
+    
+    def _enriched(self, page_jobs):
+        """Job records with skills and score extracted (worker thread)"""
+        return self.skill_extractor.enrich(parse_results(page_jobs))
+    
+    def _without_duplicates(self, page_jobs):
+        """Drop stored postings flagged as reposts, if hiding them (worker thread)"""
+        if not self.hide_duplicates or self.store.deduplicator is None:
+            return page_jobs
+        duplicates = self.store.duplicate_ids(job_id(job) for job in page_jobs)
+        if not duplicates:
+            return page_jobs
+        return [job for job in page_jobs if job_id(job) not in duplicates]
+    
+    def _drain_fetch_queue(self, generation):
+        """Move fetched pages into the table, at most ROWS_PER_TICK rows per call"""
+        if generation != self.fetch_generation:
+            return
+        finished = None
+        rows = 0
+        while rows < ROWS_PER_TICK:
+            try:
+                message_generation, kind, payload = self.fetch_queue.get_nowait()
+            except queue.Empty:
+                break
+            if message_generation != generation:
+                continue
+            if kind == 'page':
+                page_jobs, pages_done, total_pages = payload
+                # Also appends to current_jobs, which the model adopted
+                with METRICS.timer('render'):
+                    self.table_model.extend(page_jobs)
+                self.market_stats.extend(page_jobs)
+                rows += len(page_jobs)
+                self.progress.config(maximum=total_pages, value=pages_done)
+                self.progress_var.set(f"Page {pages_done}/{total_pages}")
+            elif kind == 'log':
+                self.log_message(payload)
+            else:
+                finished = (kind, payload)
+                break
+        
+        # The table is bound to its model, so this only re-renders one screenful
+        if self.stored_view is not None:
+            self.stored_view.invalidate()
+            self.stored_count_var.set(f"{len(self.stored_view):,} stored jobs")
+        with METRICS.timer('render'):
+            self.tree.refresh()
+        
+        if finished:
+            self._finish_fetch(*finished)
+        else:
+            # A backlog is left after a full batch: continue as soon as Tk has handled its events
+            delay = 1 if rows >= ROWS_PER_TICK else QUEUE_POLL_MS
+            self.root.after(delay, self._drain_fetch_queue, generation)
+    
+    def _reset_fetch_controls(self):
+        """Re-enable fetching once a fetch has finished or been abandoned"""
+        self.processing = False
+        self.fetch_button.config(state='normal')
+        self.cancel_button.config(state='disabled')
+    
+    def _finish_fetch(self, kind, payload):
+        """Restore controls and report the outcome of a fetch"""
+        self._reset_fetch_controls()
+        
+        if kind == 'error':
+            self.log_message(f"✗ Error: {payload}")
+            messagebox.showerror("Error", f"Failed to fetch jobs: {payload}")
             self.status_var.set("Error fetching jobs")
+        elif kind == 'cancelled':
+            self.log_message(f"Fetch cancelled after {len(self.current_jobs)} jobs")
+            self.status_var.set(f"Cancelled - loaded {len(self.current_jobs)} jobs")
+        elif not self.current_jobs and self.incremental_var.get():
+            self.log_message("No new jobs since last sync")
+            self.status_var.set("Up to date")
+        elif not self.current_jobs:
+            messagebox.showinfo("Info", "No jobs found")
+            self.log_message("No jobs found for this search")
+            self.status_var.set("Ready")
+        else:
+            self.log_message(f"✓ {self.background_action} {len(self.current_jobs)} jobs")
+            self.status_var.set(f"Loaded {len(self.current_jobs)} jobs")
+            if self.archive_var.get() and self.background_action == 'Fetched':
+                self.archive_snapshot()
+        
+        # Imports never touch the API, so there are no cache stats to report
+        cache = self.fetch_client.cache if self.background_action == 'Fetched' else None
+        if cache is not None:
+            stats = cache.stats()
+            self.log_message(f"Cache: {stats['hits']} hits / {stats['misses']} misses")
+    
+    def cancel_fetch(self):
+        """Abort the in-flight fetch"""
+        if self.processing:
+            self.cancel_event.set()
+            self.log_message("Cancelling fetch...")
+            self.cancel_button.config(state='disabled')
+    
+    def _scored(self, job):
+        """Job with skills extracted; stored-view rows are scored as they scroll into view"""
+        if job.skills is None:
+            self.skill_extractor.enrich([job])
+        return job
+    
+    @staticmethod
+    def _job_row(job):
+        """Table values for a Job record"""
+        return (
+            job.created_date or 'N/A',
+            str(job.score) if job.score is not None else 'N/A',
+            job.category or 'N/A',
+            job.title or 'N/A',
+            job.company or 'N/A',
+            job.location or 'N/A',
+            (job.country or '').upper(),
+            job.contract_type or 'N/A',
+            format_salary(job.salary_max, job.country),
+            ', '.join(job.skills or ()),
+            job.redirect_url,
+        )
     
     def on_tree_click(self, event):
         """Handle double-click on table row"""
-        item = self.tree.identify_row(event.y)
-        if item:
-            values = self.tree.item(item, "values")
-            if len(values) > 6:
-                link = values[6]
+        values = self.tree.values_at(event.y)
+        if values:
+            if len(values) > 10:
+                link = values[-1]
                 if link.startswith("http"):
                     self.log_message(f"Opening job link...")
                     webbrowser.open(link)
     
     def save_to_json(self):
-        """Save results to JSON"""
-        if not self.current_jobs:
+        """Save the displayed results, streamed to JSON or NDJSON"""
+        if not len(self.tree):
             messagebox.showwarning("Warning", "No jobs to save")
             return
         
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("JSON files", "*.json"), ("NDJSON files", "*.ndjson"),
+                       ("Compressed JSON", "*.json.gz"), ("Compressed NDJSON", "*.ndjson.gz"),
+                       ("All files", "*.*")]
         )
         if filename:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(self.current_jobs, f, ensure_ascii=False, indent=4)
-            self.log_message(f"✓ Saved {len(self.current_jobs)} jobs to {filename}")
-            messagebox.showinfo("Success", f"Saved {len(self.current_jobs)} jobs!")
+            count = export_jobs(self.tree.model, filename)
+            self.log_message(f"✓ Saved {count} jobs to {filename}")
+            messagebox.showinfo("Success", f"Saved {count} jobs!")
     
     def export_csv(self):
-        """Export results to CSV (TODO)"""
-        self.log_message("TODO: CSV export feature")
-        messagebox.showinfo("Info", "CSV export coming soon!")
+        """Export the displayed results to CSV (table columns only)"""
+        if not len(self.tree):
+            messagebox.showwarning("Warning", "No jobs to export")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("Compressed CSV", "*.csv.gz"), ("All files", "*.*")]
+        )
+        if filename:
+            columns = [CSV_EXPORT_COLUMNS[col] for col in self.tree.tree['columns']]
+            count = export_jobs(self.tree.model, filename, columns=columns)
+            self.log_message(f"✓ Exported {count} jobs to {filename}")
+            messagebox.showinfo("Success", f"Exported {count} jobs!")
     
     def import_json(self):
-        """Import jobs from JSON (TODO)"""
-        self.log_message("TODO: JSON import feature")
-        messagebox.showinfo("Info", "JSON import coming soon!")
+        """Import jobs from a JSON / NDJSON file without blocking the UI"""
+        if self.processing:
+            return
+        filename = filedialog.askopenfilename(
+            filetypes=[("JSON / NDJSON", "*.json *.ndjson *.jsonl *.gz"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        self.log_message(f"Importing {filename}...")
+        self.status_var.set("Importing jobs...")
+        self.current_jobs = []
+        self.results_watcher = None
+        self.table_model.load(self.current_jobs)
+        self.market_stats.clear()
+        self.show_stored_var.set(False)
+        self.show_results_model()
+        self.progress_var.set("Batch 0")
+        self._start_background('Imported', self._import_worker, filename)
+    
+    def _import_worker(self, generation, cancel_event, filename):
+        """Stream jobs from a file onto the queue in batches"""
+        count = 0
+        try:
+            for batch_no, batch in enumerate(iter_batches(iter_jobs(filename)), 1):
+                if cancel_event.is_set():
+                    break
+                count += len(batch)
+                self.fetch_queue.put((generation, 'page', (self._enriched(batch), batch_no, batch_no)))
+            status = 'cancelled' if cancel_event.is_set() else 'done'
+            self.fetch_queue.put((generation, status, count))
+        except Exception as e:
+            self.fetch_queue.put((generation, 'error', e))
     
     def clear_results(self):
         """Clear results table"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        if self.processing:
+            # Abandon the in-flight fetch; its late pages carry a stale generation
+            self.cancel_event.set()
+            self.fetch_generation += 1
+            self._reset_fetch_controls()
+            self.progress_var.set("")
         self.current_jobs = []
+        self.results_watcher = None
+        self.table_model.load(self.current_jobs)
+        self.market_stats.clear()
+        self.show_stored_var.set(False)
+        self.show_results_model()
         self.log_message("Cleared all results")
     
+    def show_results_model(self):
+        """Bind the table to the current search or the paged job store"""
+        if self.show_stored_var.get():
+            self.stored_view = self._stored_view()
+            self.tree.set_model(self.stored_view)
+            self.stored_count_var.set(f"{len(self.stored_view):,} stored jobs")
+        else:
+            self.stored_view = None
+            self.tree.set_model(self.table_model)
+            self.stored_count_var.set("")
+    
+    def _stored_view(self):
+        """Store query matching the table model's sort column and date range"""
+        model = self.table_model
+        order_by = STORE_SORT_COLUMNS.get(model.sort_column, 'created')
+        descending = model.sort_reverse if model.sort_column else True
+        where, params = created_between(*model.date_range) if model.date_range else ("", ())
+        if self.hide_duplicates:
+            where = f"{where} AND {UNIQUE_ONLY}" if where else UNIQUE_ONLY
+        return self.store.view(order_by, descending, where, params)
+    
+    def toggle_duplicates(self):
+        """Show or hide near-duplicates in the stored view and later fetches"""
+        self.hide_duplicates = self.hide_duplicates_var.get()
+        if self.stored_view is not None:
+            self.show_results_model()
+    
+    def sort_by(self, column):
+        """Sort the results by a column; clicking again reverses the order"""
+        self.table_model.sort(column)
+        if self.stored_view is not None:
+            self.show_results_model()
+        else:
+            self.tree.refresh()
+        arrow = " ▼" if self.table_model.sort_reverse else " ▲"
+        for col, text in self.column_titles.items():
+            self.tree.heading(col, text=text + (arrow if col == column else ""))
+    
+    def filter_by_date(self):
+        """Show only jobs created within the From/To dates"""
+        try:
+            start_text = self.date_from_entry.get().strip()
+            end_text = self.date_to_entry.get().strip()
+            start = parse_day(start_text) if start_text else None
+            end = parse_day(end_text, end=True) if end_text else None
+        except ValueError:
+            messagebox.showerror("Error", "Dates must be in YYYY-MM-DD format")
+            return
+        self.table_model.filter_by_date(start, end)
+        self.show_results_model()
+        self.status_var.set(f"Showing {len(self.tree):,} jobs")
+    
+    def schedule_text_filter(self, *_):
+        """Filter once typing pauses, not on every keystroke"""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.filter_by_text)
+    
+    def filter_by_text(self):
+        """Show only loaded jobs matching the search box, in the current sort order"""
+        self.search_after_id = None
+        query = self.search_var.get()
+        self.table_model.filter_by_text(query)
+        # The index covers this session's jobs, not the whole store
+        self.show_stored_var.set(False)
+        self.show_results_model()
+        if query.strip():
+            self.status_var.set(f"Showing {len(self.tree):,} of {len(self.current_jobs):,} jobs")
+        else:
+            self.status_var.set(f"Showing {len(self.tree):,} jobs")
+    
+    def filter_by_area(self):
+        """Show only loaded jobs near a place or inside a box, within the salary range"""
+        near = self.near_entry.get().strip()
+        bbox = self.bbox_entry.get().strip()
+        try:
+            minimum, maximum = (float(text) if text else None for text in
+                                (self.min_salary_entry.get().strip(),
+                                 self.max_salary_entry.get().strip()))
+            radius = box = None
+            if near:
+                lat, lon = self.table_model.geo_index.locate(near)
+                radius = (lat, lon, to_km(float(self.within_entry.get().strip() or 10)))
+            elif bbox:
+                box = parse_box(bbox)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.table_model.filter_by_area(radius, box)
+        self.table_model.filter_by_salary(minimum, maximum)
+        # The index covers this session's jobs, not the whole store
+        self.show_stored_var.set(False)
+        self.show_results_model()
+        self.status_var.set(f"Showing {len(self.tree):,} of {len(self.current_jobs):,} jobs")
+    
+    def reset_area_filter(self):
+        """Clear the area and salary filters"""
+        for entry in (self.near_entry, self.bbox_entry, self.min_salary_entry, self.max_salary_entry):
+            entry.delete(0, tk.END)
+        self.table_model.filter_by_area()
+        self.table_model.filter_by_salary()
+        self.show_results_model()
+        self.status_var.set(f"Showing {len(self.tree):,} jobs")
+    
+    def reset_date_filter(self):
+        """Clear the date range filter"""
+        self.date_from_entry.delete(0, tk.END)
+        self.date_to_entry.delete(0, tk.END)
+        self.table_model.filter_by_date(None, None)
+        self.show_results_model()
+    
+    def refresh_metrics(self):
+        """Redraw the metrics panel and status bar summary, then reschedule"""
+        if METRICS.enabled:
+            self.metrics_var.set(METRICS.summary())
+            self.metrics_text.config(state='normal')
+            self.metrics_text.delete('1.0', tk.END)
+            self.metrics_text.insert('1.0', METRICS.report())
+            self.metrics_text.config(state='disabled')
+        self.root.after(METRICS_REFRESH_MS, self.refresh_metrics)
+    
+    def refresh_statistics(self):
+        """Redraw the Statistics panel when jobs were added or cleared, then reschedule"""
+        if len(self.market_stats) != self.stats_size:
+            self.stats_size = len(self.market_stats)
+            self.stats_text.config(state='normal')
+            self.stats_text.delete('1.0', tk.END)
+            self.stats_text.insert('1.0', self.market_stats.report())
+            self.stats_text.config(state='disabled')
+        self.root.after(STATS_REFRESH_MS, self.refresh_statistics)
+    
+    def load_market_stats(self):
+        """Fetch aggregate statistics for the search tab's query on a worker thread"""
+        app_id = os.getenv("ADZUNA_APP_ID")
+        api_key = os.getenv("ADZUNA_API_KEY")
+        if not app_id or not api_key:
+            messagebox.showerror("Error", "API credentials not found")
+            return
+        try:
+            country = parse_countries(self.countries_entry.get())[0]
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        search_term = self.search_entry.get() or "python"
+        location = self.location_entry.get().strip()
+        
+        # Loaded jobs stand in for any part the API can't provide
+        analytics = MarketAnalytics(get_client(app_id, api_key), self.market_stats)
+        
+        # Each load gets its own queue, so it can't pick up the trends worker's result
+        results = queue.Queue()
+        
+        def worker():
+            try:
+                results.put(('report', analytics.report(search_term, location, country)))
+            except Exception as e:
+                results.put(('error', e))
+        
+        self.market_button.config(state='disabled')
+        self._set_market_text(f"Loading market stats for '{search_term}'...")
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(QUEUE_POLL_MS, self._poll_market_queue, results, self.market_button)
+    
+    def archive_snapshot(self):
+        """Append this fetch's jobs to the snapshot archive as one segment"""
+        try:
+            segment = self.archive.append(self.current_jobs, self.search_entry.get() or "python",
+                                          self.location_entry.get().strip())
+        except OSError as e:
+            self.log_message(f"✗ Archive failed: {e}")
+            return
+        if segment is not None:
+            self.log_message(f"✓ Archived {len(segment):,} jobs to {self.archive.path}")
+    
+    def load_archive_trends(self):
+        """Read salary trends from the snapshot archive on a worker thread"""
+        try:
+            countries = parse_countries(self.countries_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        country = countries[0] if len(countries) == 1 else None
+        results = queue.Queue()
+        
+        def worker():
+            try:
+                # Only the date, salary and label columns are mapped
+                stats = load_stats(self.archive, countries=countries)
+                text = (f"{format_trends(stats, 'week', country)}\n\n{stats.report()}"
+                        if len(stats) else f"No archived jobs in {self.archive.path}")
+                results.put(('trends', text))
+            except Exception as e:
+                results.put(('error', e))
+        
+        self.trends_button.config(state='disabled')
+        self._set_market_text(f"Reading {self.archive.path}...")
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(QUEUE_POLL_MS, self._poll_market_queue, results, self.trends_button)
+    
+    def _poll_market_queue(self, results, button):
+        """Show a market report or archive trends once its worker has finished"""
+        try:
+            kind, payload = results.get_nowait()
+        except queue.Empty:
+            self.root.after(QUEUE_POLL_MS, self._poll_market_queue, results, button)
+            return
+        button.config(state='normal')
+        if kind == 'error':
+            self._set_market_text(f"✗ Error: {payload}")
+            return
+        if kind == 'trends':
+            self._set_market_text(payload)
+            return
+        self._set_market_text(payload.format())
+        self.log_message(f"✓ Market stats: {payload.api_requests} API requests")
+    
+    def _set_market_text(self, text):
+        """Replace the market panel's contents"""
+        self.market_text.config(state='normal')
+        self.market_text.delete('1.0', tk.END)
+        self.market_text.insert('1.0', text)
+        self.market_text.config(state='disabled')
+    
+    def browse_watch_manifest(self):
+        """Pick the saved searches file for watch mode"""
+        filename = filedialog.askopenfilename(
+            filetypes=[("Saved searches", "*.json *.ndjson *.jsonl *.csv *.gz"), ("All files", "*.*")]
+        )
+        if filename:
+            self.watch_manifest_entry.delete(0, tk.END)
+            self.watch_manifest_entry.insert(0, filename)
+    
+    def toggle_watch(self):
+        """Start watching the saved searches, or stop the running watch"""
+        if self.watcher is not None:
+            self._stop_watch("Stopped")
+            self.log_message("Watch stopped")
+            return
+        if self.processing:
+            messagebox.showwarning("Warning", "Wait for the current fetch to finish")
+            return
+        app_id = os.getenv("ADZUNA_APP_ID")
+        api_key = os.getenv("ADZUNA_API_KEY")
+        if not app_id or not api_key:
+            messagebox.showerror("Error", "API credentials not found")
+            return
+        try:
+            queries = load_manifest(self.watch_manifest_entry.get().strip())
+            every = float(self.watch_every_entry.get().strip())
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Can't start watch: {e}")
+            return
+        
+        # The shared client keeps its connections open between cycles
+        watcher = Watcher(get_client(app_id, api_key), queries, every * 60,
+                          on_deltas=lambda run: self._on_watch_run(watcher, run))
+        self.watcher = watcher
+        # The Results tab shows this watch until another fetch, import or clear replaces it
+        self.current_jobs = []
+        self.results_watcher = watcher
+        self.table_model.load(self.current_jobs)
+        self.market_stats.clear()
+        self.show_stored_var.set(False)
+        self.show_results_model()
+        threading.Thread(target=self._watch_worker, args=(watcher,), daemon=True).start()
+        self.watch_button.config(text="⏹ Stop watch")
+        self.watch_status_var.set(f"Watching {len(watcher.queries)} searches every {every:g} min")
+        self.log_message(f"Watching {len(watcher.queries)} saved searches")
+        self.root.after(WATCH_POLL_MS, self._poll_watch_queue, watcher)
+    
+    def _stop_watch(self, status):
+        """Stop the running watch and reset its controls"""
+        self.watcher.stop()
+        self.watcher = None
+        self.watch_button.config(text="👀 Start watch")
+        self.watch_status_var.set(status)
+    
+    def _watch_worker(self, watcher):
+        """Run a watch until stopped; report a crash instead of dying silently (watch thread)"""
+        try:
+            watcher.run()
+        except Exception as e:
+            watcher.stop()
+            self.watch_queue.put((watcher, 'error', e))
+    
+    def _on_watch_run(self, watcher, run):
+        """Store and score a run's new and changed jobs, then hand it to the UI (watch thread)"""
+        jobs = [delta.job for delta in run.deltas if delta.job is not None]
+        if jobs:
+            self.skill_extractor.enrich(jobs)
+            self.store.upsert_jobs(jobs)
+        self.watch_queue.put((watcher, 'run', run))
+    
+    def _poll_watch_queue(self, watcher):
+        """Apply this watch's finished runs while it is the running watch"""
+        while True:
+            try:
+                source, kind, payload = self.watch_queue.get_nowait()
+            except queue.Empty:
+                break
+            if source is not watcher:
+                # Left over from a watch that has since been stopped
+                continue
+            if kind == 'error':
+                self.log_message(f"✗ Watch stopped: {payload}")
+                if watcher is self.watcher:
+                    self._stop_watch("Stopped by an error")
+            else:
+                self._apply_watch_run(watcher, payload)
+        if watcher is self.watcher:
+            self.root.after(WATCH_POLL_MS, self._poll_watch_queue, watcher)
+    
+    def _apply_watch_run(self, watcher, run):
+        """Add new jobs to the results, replace changed ones and drop expired ones"""
+        if run.error:
+            self.log_message(f"✗ Watch {run.query.key}: {run.error}")
+            return
+        counts = run.counts()
+        self.log_message(f"👀 {run.query.key}: {counts['new']} new, {counts['changed']} changed, "
+                         f"{counts['expired']} expired")
+        if not run.deltas or watcher is not self.results_watcher:
+            # The Results tab shows something else now; the deltas are stored and logged only
+            return
+        changed = {delta.job_id: delta.job for delta in run.deltas if delta.kind == 'changed'}
+        expired = {delta.job_id for delta in run.deltas if delta.kind == 'expired'}
+        if expired:
+            # Still shown if another saved search in this watch returns it
+            for ids in list(watcher.state.searches.values()):
+                expired.difference_update(ids)
+        if changed or expired:
+            # In place: the table model adopted current_jobs
+            self.current_jobs[:] = [changed.get(job.id, job) for job in self.current_jobs
+                                    if job.id not in expired]
+            self.table_model.load(self.current_jobs)
+            self.market_stats.load(self.current_jobs)
+        shown = {job.id for job in self.current_jobs}
+        new = [delta.job for delta in run.deltas if delta.kind == 'new' and delta.job_id not in shown]
+        if new:
+            self.table_model.extend(new)
+            self.market_stats.extend(new)
+        if self.stored_view is not None:
+            self.stored_view.invalidate()
+        self.tree.refresh()
+        self.status_var.set(f"Watching - {len(self.current_jobs):,} jobs")
+    
+    def toggle_metrics(self):
+        """Turn metrics collection on or off"""
+        if self.metrics_enabled_var.get():
+            METRICS.enable()
+        else:
+            METRICS.disable()
+            self.metrics_var.set("")
+    
+    def export_metrics(self, extension):
+        """Save a metrics snapshot as Prometheus text or JSON"""
+        filetypes = ([("Prometheus text", "*.prom"), ("All files", "*.*")] if extension == '.prom'
+                     else [("JSON files", "*.json"), ("All files", "*.*")])
+        filename = filedialog.asksaveasfilename(defaultextension=extension, filetypes=filetypes)
+        if filename:
+            METRICS.write(filename)
+            self.log_message(f"✓ Metrics saved to {filename}")
+    
     def refresh_results(self):
-        """Refresh results display"""
-        self.log_message("Refreshed display")
+        """Re-run the search, bypassing the response cache"""
+        self.log_message("Refreshing from Adzuna (bypassing cache)...")
+        self.fetch_jobs(use_cache=False)
 
 
 def main():
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Salary-trend load time: snapshot archive vs JSON saves.
+
+Writes --days daily snapshots of --jobs postings each (a pool of
+postings that come and go, with descriptions) to a SnapshotArchive and,
+for --json-days of them, to pretty-printed JSON as save_to_json does.
+Then times loading the salary trend both ways and reports the Python
+heap peak (memory-mapped columns are page cache, not heap):
+
+    python benchmarks/bench_archive.py --days 180 --jobs 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adzuna.archive import SnapshotArchive, load_stats  # noqa: E402
+from adzuna.job_io import export_jobs, iter_jobs  # noqa: E402
+from adzuna.job_record import Job, as_job  # noqa: E402
+from adzuna.stats import MarketStats  # noqa: E402
+
+DAY = 86400
+START = 1704067200  # 2024-01-01
+
+
+def make_snapshots(days, jobs_per_day, description_words, rng):
+    """Yield (fetch time, jobs) per day; a tenth of the postings turn over daily."""
+    vocabulary = [f"w{i}" for i in range(5000)]
+    companies = [f"Company {i}" for i in range(800)]
+    cities = ["London", "Manchester", "Leeds", "Bristol", "Glasgow", "Cardiff"]
+    next_id = 0
+    live = []
+    for day in range(days):
+        fetched = START + day * DAY
+        live = live[jobs_per_day // 10:] if live else []
+        while len(live) < jobs_per_day:
+            live.append(Job(
+                id=str(next_id), title=f"Engineer {next_id}",
+                description=' '.join(rng.choice(vocabulary) for _ in range(description_words)),
+                created=fetched - rng.randrange(DAY), country='gb',
+                salary_max=rng.choice((None, rng.randrange(25000, 90000) * (1 + day / 1000))),
+                company=rng.choice(companies), location=rng.choice(cities),
+                redirect_url=f"https://www.adzuna.co.uk/details/{next_id}"))
+            next_id += 1
+        yield fetched, live
+
+
+def timed(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--days', type=int, default=180)
+    parser.add_argument('--jobs', type=int, default=2000, help="postings per snapshot")
+    parser.add_argument('--json-days', type=int, default=10,
+                        help="snapshots also saved as JSON (the JSON load is extrapolated)")
+    parser.add_argument('--description-words', type=int, default=150)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = SnapshotArchive(os.path.join(tmp, 'archive'))
+        json_paths = []
+        start = time.perf_counter()
+        for day, (fetched, jobs) in enumerate(make_snapshots(
+                args.days, args.jobs, args.description_words, random.Random(args.seed))):
+            archive.append(jobs, 'engineer', 'UK', fetched=fetched)
+            if day < args.json_days:
+                path = os.path.join(tmp, f'snapshot-{day}.json')
+                export_jobs(jobs, path)
+                json_paths.append(path)
+        rows = args.days * args.jobs
+        size = sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(archive.path) for name in names)
+        print(f"{rows:,} rows in {args.days} segments ({size / 2**20:,.0f} MB) written in "
+              f"{time.perf_counter() - start:.1f}s")
+
+        # A fresh archive object, as in a new process
+        stats, elapsed, peak = timed(lambda: load_stats(SnapshotArchive(archive.path)))
+        weeks = stats.time_series('week')
+        print(f"archive, by snapshot  {elapsed:>7.2f}s  heap peak {peak / 2**20:>6.1f} MB  "
+              f"{len(weeks)} weeks")
+        stats, elapsed, peak = timed(lambda: load_stats(SnapshotArchive(archive.path), by='created'))
+        print(f"archive, by posting   {elapsed:>7.2f}s  heap peak {peak / 2**20:>6.1f} MB  "
+              f"{len(stats):,} distinct postings")
+        month = START + (args.days - 30) * DAY
+        stats, elapsed, peak = timed(lambda: load_stats(SnapshotArchive(archive.path), month))
+        print(f"archive, last 30 days {elapsed:>7.2f}s  heap peak {peak / 2**20:>6.1f} MB")
+
+        def load_json():
+            stats = MarketStats()
+            for path in json_paths:
+                stats.extend(as_job(job) for job in iter_jobs(path))
+            return stats
+
+        _, elapsed, peak = timed(load_json)
+        scale = args.days / max(1, len(json_paths))
+        print(f"JSON, {len(json_paths)} snapshots     {elapsed:>7.2f}s  heap peak {peak / 2**20:>6.1f} MB  "
+              f"(~{elapsed * scale:.0f}s for {args.days})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
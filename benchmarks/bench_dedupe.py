@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection over a synthetic backlog with known reposts.
+
+Generates postings with distinct descriptions, plus reposts of earlier
+postings with a few words changed and a reworded title, stores them and
+runs the MinHash/LSH backlog pass. Reports throughput and precision /
+recall against the known reposts:
+
+    python benchmarks/bench_dedupe.py --count 200000 --repost-rate 0.15
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adzuna.dedupe import DEFAULT_THRESHOLD, Deduplicator  # noqa: E402
+from adzuna.job_store import JobStore  # noqa: E402
+
+TITLE_PREFIXES = ("", "Senior ", "Lead ", "Junior ", "Remote ")
+ROLES = ("Python Developer", "Data Engineer", "Backend Engineer", "DevOps Engineer",
+         "Software Engineer", "Machine Learning Engineer", "Platform Engineer")
+
+
+def make_backlog(count, repost_rate, edits, description_words, seed):
+    """(jobs, {repost id: original id})."""
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    jobs, reposts = [], {}
+    for i in range(count):
+        if jobs and rng.random() < repost_rate:
+            original = rng.choice(jobs)
+            words = original['description'].split()
+            for _ in range(edits):
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            title = rng.choice(TITLE_PREFIXES) + original['title'].split(' ', 1)[-1]
+            # Chains of reposts all belong to the first posting
+            reposts[str(i)] = reposts.get(original['id'], original['id'])
+            description = ' '.join(words)
+        else:
+            title = rng.choice(TITLE_PREFIXES) + rng.choice(ROLES)
+            description = ' '.join(rng.choice(vocabulary) for _ in range(description_words))
+        jobs.append({'id': str(i), 'title': title, 'description': description,
+                     'company': {'display_name': f"Agency {rng.randrange(500)}"}})
+    return jobs, reposts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=50000)
+    parser.add_argument('--repost-rate', type=float, default=0.15)
+    parser.add_argument('--edits', type=int, default=3, help="words changed per repost")
+    parser.add_argument('--description-words', type=int, default=80)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    jobs, reposts = make_backlog(args.count, args.repost_rate, args.edits,
+                                 args.description_words, args.seed)
+    with tempfile.TemporaryDirectory() as workdir:
+        store = JobStore(os.path.join(workdir, 'dedupe.db'))
+        store.upsert_jobs(jobs)
+        start = time.perf_counter()
+        result = Deduplicator(store, args.threshold).backlog(
+            on_batch=lambda r: print(f"\r{r.checked:,} checked, {len(r.duplicates):,} duplicates",
+                                     end='', file=sys.stderr))
+        elapsed = time.perf_counter() - start
+        size_mb = os.path.getsize(store.path) / 1e6
+        store.close()
+    print(file=sys.stderr)
+
+    found = result.duplicates
+    true_positives = sum(1 for id_ in found if id_ in reposts)
+    precision = true_positives / len(found) if found else 1.0
+    recall = true_positives / len(reposts) if reposts else 1.0
+    canonical_ok = sum(1 for id_, (canonical, _) in found.items() if reposts.get(id_) == canonical)
+    print(f"postings           {len(jobs):>10,}")
+    print(f"known reposts      {len(reposts):>10,}")
+    print(f"flagged            {len(found):>10,}")
+    print(f"precision          {precision:>10.3f}")
+    print(f"recall             {recall:>10.3f}")
+    print(f"right canonical    {canonical_ok / true_positives if true_positives else 1.0:>10.3f}")
+    print(f"seconds            {elapsed:>10.1f}")
+    print(f"postings/sec       {len(jobs) / elapsed:>10,.0f}")
+    print(f"database MB        {size_mb:>10.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
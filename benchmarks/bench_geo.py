@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Radius and bounding-box filter latency over a large result set.
+
+Scatters --count jobs around a few UK cities (most postings cluster in
+metro areas), then times the grid index queries and the same filters
+through JobTableModel combined with a salary range, against a scan that
+computes every job's distance:
+
+    python benchmarks/bench_geo.py --count 100000 --radius 15
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adzuna.geo_index import GeoIndex, haversine_km, to_km  # noqa: E402
+from adzuna.job_record import Job  # noqa: E402
+from adzuna.table_model import JobTableModel  # noqa: E402
+
+CITIES = {
+    'London': (51.5074, -0.1278, 0.45),
+    'Manchester': (53.4808, -2.2426, 0.12),
+    'Birmingham': (52.4862, -1.8904, 0.12),
+    'Leeds': (53.8008, -1.5491, 0.08),
+    'Bristol': (51.4545, -2.5879, 0.08),
+    'Edinburgh': (55.9533, -3.1883, 0.08),
+    'Cardiff': (51.4816, -3.1791, 0.07),
+}
+
+
+def make_jobs(count, rng):
+    names = list(CITIES)
+    weights = [share for _, _, share in CITIES.values()]
+    jobs = []
+    for i in range(count):
+        city = rng.choices(names, weights)[0]
+        lat, lon, _ = CITIES[city]
+        jobs.append(Job(id=str(i), title=f'Job {i}', location=city, area=('UK', city),
+                        latitude=lat + rng.gauss(0, 0.25), longitude=lon + rng.gauss(0, 0.35),
+                        salary_max=rng.choice((None, rng.randrange(20000, 120000)))))
+    return jobs
+
+
+def best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--radius', type=float, default=15, help='miles')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.count, random.Random(args.seed))
+    start = time.perf_counter()
+    index = GeoIndex(jobs)
+    print(f"{args.count:,} jobs indexed in {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"({len(index.cells):,} cells)")
+
+    lat, lon = index.locate('London')
+    km = to_km(args.radius)
+    elapsed, matches = best_of(lambda: index.within_radius(lat, lon, km), args.repeat)
+    print(f"within {args.radius:g} mi of London  {elapsed * 1000:>8.1f} ms  {len(matches):,} jobs")
+
+    scan, expected = best_of(lambda: [i for i, job in enumerate(jobs)
+                                      if haversine_km(lat, lon, job.latitude, job.longitude) <= km],
+                             1)
+    assert matches == expected
+    print(f"full distance scan         {scan * 1000:>8.1f} ms")
+
+    elapsed, matches = best_of(lambda: index.within_box(53.3, -2.6, 53.7, -1.9), args.repeat)
+    print(f"Manchester bounding box    {elapsed * 1000:>8.1f} ms  {len(matches):,} jobs")
+
+    model = JobTableModel(jobs, geo_index=index)
+    model.filter_by_area(radius=(lat, lon, km))
+    model.filter_by_salary(50000, None)
+    model.sort('Salary', reverse=True)
+
+    def combined():
+        model.filter_by_salary(50000, None)
+        return len(model)
+
+    combined()
+    elapsed, shown = best_of(combined, args.repeat)
+    print(f"+ salary >= 50k, by salary {elapsed * 1000:>8.1f} ms  {shown:,} jobs")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
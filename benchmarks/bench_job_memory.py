@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory and parse time of raw result dicts vs Job records.
+
+Runs headless:
+
+    python benchmarks/bench_job_memory.py
+    python benchmarks/bench_job_memory.py --count 500000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adzuna.job_record import parse_results  # noqa: E402
+
+
+def make_payload(n):
+    """JSON text of n synthetic results shaped like an Adzuna response."""
+    return json.dumps([
+        {
+            'id': str(4000000000 + i),
+            'title': f"Python Developer {i}",
+            'description': "Build and maintain data pipelines in Python. " * 4,
+            'created': f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00Z",
+            'redirect_url': f"https://www.adzuna.co.uk/jobs/land/ad/{4000000000 + i}",
+            'salary_min': 25000 + i % 50000,
+            'salary_max': 30000 + i % 70000,
+            'salary_is_predicted': '0',
+            'contract_type': 'permanent',
+            'contract_time': 'full_time',
+            'company': {'display_name': f"Company {i % 997}", '__CLASS__': 'Adzuna::API::Response::Company'},
+            'location': {'display_name': f"Town {i % 311}", 'area': ['UK', 'England', f"Town {i % 311}"],
+                         '__CLASS__': 'Adzuna::API::Response::Location'},
+            'category': {'label': 'IT Jobs', 'tag': 'it-jobs', '__CLASS__': 'Adzuna::API::Response::Category'},
+            'latitude': 51.5 + (i % 100) / 1000,
+            'longitude': -0.1 - (i % 100) / 1000,
+            '__CLASS__': 'Adzuna::API::Response::Job',
+        }
+        for i in range(n)
+    ])
+
+
+def measure(build):
+    """(result, peak MB, retained MB, seconds) for build()."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 1e6, retained / 1e6, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000)
+    args = parser.parse_args()
+
+    payload = make_payload(args.count)
+
+    print(f"{'records':>8} {'form':>6} {'peak MB':>9} {'retained MB':>12} {'seconds':>8}")
+    dicts, peak, retained, elapsed = measure(lambda: json.loads(payload))
+    print(f"{args.count:>8} {'dicts':>6} {peak:>9.1f} {retained:>12.1f} {elapsed:>8.2f}")
+    del dicts
+
+    # Parse then drop the dicts: what the GUI keeps after ingestion
+    jobs, peak, retained, elapsed = measure(lambda: parse_results(json.loads(payload)))
+    print(f"{args.count:>8} {'jobs':>6} {peak:>9.1f} {retained:>12.1f} {elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Compare JSON backends on a corpus of Adzuna search responses.
+
+For every installed backend (see adzuna/json_codec.py) times decoding
+raw response bytes, decoding plus parsing into Job records, decode_jobs()
+and re-encoding each result as the job store does. The corpus is either
+responses recorded in the response cache or synthetic pages from the
+mock server:
+
+    python benchmarks/bench_json_codec.py --cache-dir ~/.cache/adzuna
+    python benchmarks/bench_json_codec.py --pages 400 --description-bytes 1500
+"""
+
+import argparse
+import gc
+import gzip
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from adzuna import json_codec  # noqa: E402
+from adzuna.job_record import parse_results  # noqa: E402
+from mock_adzuna import page_body  # noqa: E402
+
+
+def load_cache_corpus(directory):
+    """Raw response bodies from response-cache entries."""
+    bodies = []
+    for root, _, files in os.walk(os.path.expanduser(directory)):
+        for name in sorted(files):
+            if name.endswith('.json.gz'):
+                with gzip.open(os.path.join(root, name), 'rb') as f:
+                    entry = json_codec.loads(f.read())
+                bodies.append(json_codec.dumps(entry.get('data') or {}).encode('utf-8'))
+    return bodies
+
+
+def best_ms(fn, items, repeat):
+    """Fastest of repeat passes of fn over items, in ms.
+
+    Outputs are dropped as we go, so a pass never holds more than one
+    decoded page, as in the fetch pipeline.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def run(bodies, repeat):
+    results = [result for body in bodies for result in json_codec.loads(body)['results']]
+    rows = {}
+    for backend in json_codec.available_backends():
+        json_codec.set_backend(backend)
+        rows[backend] = {
+            'loads': best_ms(json_codec.loads, bodies, repeat),
+            'loads+parse': best_ms(lambda body: parse_results(json_codec.loads(body)['results']),
+                                   bodies, repeat),
+            'decode_jobs': best_ms(json_codec.decode_jobs, bodies, repeat),
+            'dumps': best_ms(json_codec.dumps, results, repeat),
+        }
+    json_codec.set_backend()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cache-dir', help="use responses recorded in this response cache")
+    parser.add_argument('--pages', type=int, default=400)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--description-bytes', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.cache_dir:
+        bodies = load_cache_corpus(args.cache_dir)
+        if not bodies:
+            parser.error(f"no cached responses in {args.cache_dir}")
+    else:
+        bodies = [page_body('gb', page, args.page_size, args.pages * args.page_size,
+                            args.description_bytes) for page in range(1, args.pages + 1)]
+    size_mb = sum(len(body) for body in bodies) / 1e6
+    print(f"{len(bodies)} responses, {size_mb:.1f} MB")
+
+    rows = run(bodies, args.repeat)
+    baseline = rows['json']
+    print(f"{'backend':<10}" + ''.join(f"{name:>20}" for name in baseline))
+    for backend, times in rows.items():
+        cells = ''.join(f"{ms:>10.1f} ms {baseline[name] / ms:>5.1f}x" for name, ms in times.items())
+        print(f"{backend:<10}{cells}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of fetch, parse, skill extraction, store, sort,
+export and render.
+
+Runs the real client against a local mock Adzuna server (in a separate
+process) and reports jobs/sec, per-page latency percentiles, per-stage
+times and peak memory. Results are written as JSON so runs on different
+commits can be compared:
+
+    python benchmarks/bench_pipeline.py --pages 40 --latency-ms 30 --output base.json
+    python benchmarks/bench_pipeline.py --pages 40 --latency-ms 30 --compare base.json
+
+The render stage needs a display and is skipped without one.
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from adzuna.client import AdzunaClient  # noqa: E402
+from adzuna.job_io import export_jobs  # noqa: E402
+from adzuna.job_record import parse_results  # noqa: E402
+from adzuna.job_store import JobStore  # noqa: E402
+from adzuna.table_model import JobTableModel  # noqa: E402
+from adzuna.skills import enrich  # noqa: E402
+from mock_adzuna import MockConfig, start_in_subprocess  # noqa: E402
+
+# Metrics where a larger value is better; everything else is a cost
+HIGHER_IS_BETTER = {'fetch_jobs_per_sec', 'pipeline_jobs_per_sec'}
+
+
+class TimedClient(AdzunaClient):
+    """Client that records per-page latency (retries included) and statuses."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_latencies = []
+        self.statuses = {}
+        get = self.session.get
+
+        def counting_get(*get_args, **get_kwargs):
+            response = get(*get_args, **get_kwargs)
+            self.statuses[response.status_code] = self.statuses.get(response.status_code, 0) + 1
+            return response
+        self.session.get = counting_get
+
+    def get_json(self, url, params=None, cancel_event=None):
+        start = time.perf_counter()
+        try:
+            return super().get_json(url, params, cancel_event)
+        finally:
+            self.page_latencies.append((time.perf_counter() - start) * 1000)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak / 1e6 if sys.platform == 'darwin' else peak / 1e3
+
+
+def render_ms(records):
+    """Time binding the records to a VirtualTable, or None without a display."""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    from virtual_table import VirtualTable
+    from adzuna_smart_gui import AdzunaJobScraperGUI
+
+    model = JobTableModel(records)
+    columns = ('Date', 'Score', 'Category', 'Title', 'Company', 'Location', 'Country', 'Type',
+               'Salary', 'Skills', 'Link')
+    table = VirtualTable(root, columns, lambda idx, job: (str(idx + 1), AdzunaJobScraperGUI._job_row(job)))
+    table.pack(fill='both', expand=True)
+    root.update()
+    start = time.perf_counter()
+    table.set_model(model)
+    root.update_idletasks()
+    elapsed = (time.perf_counter() - start) * 1000
+    root.destroy()
+    return elapsed
+
+
+def run_once(args, api_base, workdir):
+    """One pass of the pipeline; returns (stage ms, client)."""
+    client = TimedClient('bench', 'bench', pool_size=max(10, args.workers),
+                         backoff=0.01, max_retries=args.max_retries, api_base=api_base)
+    stages = {}
+
+    def stage(name, fn):
+        start = time.perf_counter()
+        result = fn()
+        stages[name] = (time.perf_counter() - start) * 1000
+        return result
+
+    jobs = stage('fetch', lambda: client.search(
+        'python', 'UK', max_results=args.pages * args.page_size,
+        results_per_page=args.page_size, max_workers=args.workers, use_cache=False))
+    records = stage('parse', lambda: parse_results(jobs))
+    stage('enrich', lambda: enrich(records))
+
+    store = JobStore(os.path.join(workdir, 'bench.db'))
+    stage('store', lambda: store.upsert_jobs(jobs))
+    store.close()
+
+    def sort():
+        model = JobTableModel(records)
+        for column in ('Date', 'Salary', 'Company'):
+            model.sort(column)
+            model.view()
+    stage('sort', sort)
+
+    for fmt in ('json', 'ndjson', 'csv'):
+        stage(f'export_{fmt}', lambda: export_jobs(records, os.path.join(workdir, f'jobs.{fmt}')))
+
+    if args.render:
+        elapsed = render_ms(records)
+        if elapsed is not None:
+            stages['render'] = elapsed
+
+    client.close()
+    return len(jobs), stages, client
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    config = MockConfig(count=args.pages * args.page_size, description_bytes=args.description_bytes,
+                        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                        error_rate=args.error_rate, rate_429=args.rate_429, seed=args.seed)
+    process, api_base = start_in_subprocess(config)
+    runs, latencies, statuses = [], [], {}
+    job_count = 0
+    try:
+        if args.tracemalloc:
+            tracemalloc.start()
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory() as workdir:
+                job_count, stages, client = run_once(args, api_base, workdir)
+            runs.append(stages)
+            latencies.extend(client.page_latencies)
+            for status, n in client.statuses.items():
+                statuses[str(status)] = statuses.get(str(status), 0) + n
+        traced_peak = tracemalloc.get_traced_memory()[1] / 1e6 if args.tracemalloc else None
+        if args.tracemalloc:
+            tracemalloc.stop()
+    finally:
+        process.terminate()
+        process.join()
+
+    # Median over repeats for each stage
+    stage_ms = {name: statistics.median(run[name] for run in runs if name in run)
+                for name in runs[0]}
+    total_ms = sum(ms for name, ms in stage_ms.items() if name != 'render')
+    metrics = {
+        'jobs': job_count,
+        'fetch_jobs_per_sec': job_count / (stage_ms['fetch'] / 1000) if stage_ms['fetch'] else 0.0,
+        'pipeline_jobs_per_sec': job_count / (total_ms / 1000) if total_ms else 0.0,
+        'page_latency_p50_ms': percentile(latencies, 50),
+        'page_latency_p99_ms': percentile(latencies, 99),
+        'page_latency_max_ms': max(latencies),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    if traced_peak is not None:
+        metrics['peak_traced_mb'] = traced_peak
+    metrics.update({f'{name}_ms': ms for name, ms in stage_ms.items()})
+
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        },
+        'config': dict(config.to_dict(), pages=args.pages, page_size=args.page_size,
+                       workers=args.workers, repeat=args.repeat),
+        'http_statuses': statuses,
+        'metrics': metrics,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print metric changes against a baseline; returns the regressed metrics."""
+    regressions = []
+    print(f"\n{'metric':<24} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, value in current['metrics'].items():
+        old = baseline['metrics'].get(name)
+        if old is None or name == 'jobs':
+            continue
+        change = (value - old) / old * 100 if old else 0.0
+        worse = -change if name in HIGHER_IS_BETTER else change
+        flag = '  REGRESSION' if worse > threshold else ''
+        if flag:
+            regressions.append(name)
+        print(f"{name:<24} {old:>12.2f} {value:>12.2f} {change:>+7.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--description-bytes', type=int, default=500)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--jitter-ms', type=float, default=10.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of 500 responses")
+    parser.add_argument('--rate-429', type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument('--max-retries', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-render', dest='render', action='store_false')
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help="also report peak Python allocations (slows every stage)")
+    parser.add_argument('--output', help="write results as JSON")
+    parser.add_argument('--compare', help="baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="percent worse than baseline that counts as a regression")
+    args = parser.parse_args()
+
+    results = run(args)
+    print(f"{'metric':<24} {'value':>12}")
+    for name, value in results['metrics'].items():
+        print(f"{name:<24} {value:>12.2f}")
+    print(f"HTTP statuses: {results['http_statuses']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
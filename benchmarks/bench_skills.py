@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Skill extraction throughput against a large dictionary.
+
+Builds a dictionary of --terms skills (the built-in ones plus generated
+one- to three-word terms) and synthetic descriptions that mention a few
+of them among filler words, then times the Aho-Corasick extraction
+in-process and across the process pool:
+
+    python benchmarks/bench_skills.py --count 100000 --terms 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from adzuna.job_record import Job  # noqa: E402
+from adzuna.skills import SkillExtractor, iter_enriched, load_skills  # noqa: E402
+
+
+def make_dictionary(terms, rng):
+    skills = load_skills()
+    while len(skills) < terms:
+        words = [f"tool{rng.randrange(terms)}" for _ in range(rng.choice((1, 1, 2, 3)))]
+        skills.append((' '.join(words).title(), ()))
+    return skills[:terms]
+
+
+def make_jobs(count, skills, description_words, rng):
+    filler = [f"w{i}" for i in range(5000)]
+    jobs = []
+    for i in range(count):
+        words = [rng.choice(filler) for _ in range(description_words)]
+        for _ in range(rng.randrange(3, 12)):
+            words[rng.randrange(len(words))] = rng.choice(skills)[0]
+        jobs.append(Job(id=str(i), title=f"{rng.choice(skills)[0]} Engineer",
+                        description=' '.join(words)))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--terms', type=int, default=5000)
+    parser.add_argument('--description-words', type=int, default=120)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = make_dictionary(args.terms, rng)
+    jobs = make_jobs(args.count, skills, args.description_words, rng)
+
+    start = time.perf_counter()
+    extractor = SkillExtractor(skills)
+    build = time.perf_counter() - start
+    print(f"{len(skills):,} skills, automaton built in {build * 1000:.0f} ms")
+
+    sample = jobs[:min(len(jobs), 10000)]
+    start = time.perf_counter()
+    extractor.enrich(sample)
+    single = (time.perf_counter() - start) / len(sample)
+    print(f"in-process         {1 / single:>10,.0f} jobs/sec "
+          f"({single * args.count:.1f}s projected for {args.count:,})")
+
+    start = time.perf_counter()
+    found = sum(len(job.skills) for job in iter_enriched(jobs, extractor, args.workers))
+    elapsed = time.perf_counter() - start
+    print(f"{args.workers} workers  {args.count / elapsed:>10,.0f} jobs/sec "
+          f"({elapsed:.1f}s for {args.count:,}, {found / args.count:.1f} skills/job)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
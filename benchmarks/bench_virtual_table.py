@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark populate / scroll / clear timings of the results table.
+
+Compares VirtualTable against a plain Treeview with one item per row.
+Needs a display (use xvfb-run on headless machines):
+
+    python benchmarks/bench_virtual_table.py
+    python benchmarks/bench_virtual_table.py --sizes 10000 100000 500000 --naive-max 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from virtual_table import VirtualTable  # noqa: E402
+
+COLUMNS = ('Date', 'Title', 'Company', 'Location', 'Type', 'Salary', 'Link')
+SCROLL_STEPS = 200
+
+
+def make_jobs(n):
+    """Synthetic jobs shaped like Adzuna results."""
+    return [
+        {
+            'created': f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00Z",
+            'title': f"Python Developer {i}",
+            'company': {'display_name': f"Company {i % 997}"},
+            'location': {'display_name': f"Town {i % 311}"},
+            'contract_type': 'permanent',
+            'salary_max': 30000 + i % 70000,
+            'redirect_url': f"https://example.com/job/{i}",
+        }
+        for i in range(n)
+    ]
+
+
+def row_values(idx, job):
+    return str(idx + 1), (
+        job['created'][:10], job['title'], job['company']['display_name'],
+        job['location']['display_name'], job['contract_type'],
+        f"£{job['salary_max']:,.0f}", job['redirect_url'],
+    )
+
+
+def timed(fn, root):
+    start = time.perf_counter()
+    fn()
+    root.update_idletasks()
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_virtual(root, jobs):
+    frame = ttk.Frame(root)
+    frame.pack(fill='both', expand=True)
+    table = VirtualTable(frame, COLUMNS, row_values)
+    table.pack(fill='both', expand=True)
+    root.update()
+
+    populate = timed(lambda: table.set_model(jobs), root)
+    offsets = [random.randrange(len(jobs)) for _ in range(SCROLL_STEPS)]
+    scroll = timed(lambda: [table.scroll_to(o) for o in offsets], root) / SCROLL_STEPS
+    clear = timed(table.clear, root)
+
+    frame.destroy()
+    return populate, scroll, clear
+
+
+def bench_naive(root, jobs):
+    frame = ttk.Frame(root)
+    frame.pack(fill='both', expand=True)
+    tree = ttk.Treeview(frame, columns=COLUMNS)
+    tree.pack(fill='both', expand=True)
+    root.update()
+
+    def populate():
+        for idx, job in enumerate(jobs):
+            text, values = row_values(idx, job)
+            tree.insert('', 'end', text=text, values=values)
+
+    def scroll():
+        for _ in range(SCROLL_STEPS):
+            tree.yview_moveto(random.random())
+
+    def clear():
+        for item in tree.get_children():
+            tree.delete(item)
+
+    result = timed(populate, root), timed(scroll, root) / SCROLL_STEPS, timed(clear, root)
+    frame.destroy()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 500000])
+    parser.add_argument('--naive-max', type=int, default=10000,
+                        help="largest size to also run the plain Treeview baseline for")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.geometry("1200x600")
+
+    print(f"{'rows':>8} {'table':>9} {'populate ms':>12} {'scroll ms/step':>15} {'clear ms':>10}")
+    for size in args.sizes:
+        jobs = make_jobs(size)
+        runs = [('virtual', bench_virtual)]
+        if size <= args.naive_max:
+            runs.append(('treeview', bench_naive))
+        for name, bench in runs:
+            populate, scroll, clear = bench(root, jobs)
+            print(f"{size:>8} {name:>9} {populate:>12.1f} {scroll:>15.3f} {clear:>10.1f}")
+
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
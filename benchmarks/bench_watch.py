@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Watch mode over many cycles: per-cycle time, heap and idle CPU.
+
+Runs --searches saved searches of --results jobs each against the local
+mock API for --cycles back-to-back cycles, through one Watcher (and so
+one pooled client), and reports the Python heap after the first, fifth and
+last cycles; a flat heap means the watch can run indefinitely. Then
+times --idle seconds of waiting between cycles to show the CPU it costs:
+
+    python benchmarks/bench_watch.py --searches 5 --results 500 --cycles 50
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from adzuna.batch import Query  # noqa: E402
+from adzuna.client import AdzunaClient  # noqa: E402
+from adzuna.watch import Watcher  # noqa: E402
+from mock_adzuna import MockAdzunaServer, MockConfig  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--searches', type=int, default=5)
+    parser.add_argument('--results', type=int, default=500, help="max_results per search")
+    parser.add_argument('--cycles', type=int, default=50)
+    parser.add_argument('--idle', type=float, default=5.0, help="seconds of idle waiting to time")
+    args = parser.parse_args()
+
+    queries = [Query(f"term{i}", max_results=args.results) for i in range(args.searches)]
+    with MockAdzunaServer(MockConfig(count=args.results)) as server:
+        client = AdzunaClient("bench", "bench", api_base=server.api_base)
+        deltas = []
+        watcher = Watcher(client, queries, interval=0, jitter=0,
+                          on_deltas=lambda run: deltas.append(len(run.deltas)))
+        tracemalloc.start()
+        heap = []
+        start = time.perf_counter()
+        for cycle in range(args.cycles):
+            watcher.run(cycles=1)
+            watcher.due.clear()
+            heap.append(tracemalloc.get_traced_memory()[0])
+        elapsed = time.perf_counter() - start
+        tracemalloc.stop()
+        print(f"{args.cycles} cycles x {args.searches} searches x {args.results} jobs: "
+              f"{elapsed / args.cycles * 1000:.0f} ms/cycle, "
+              f"{sum(deltas[:args.searches])} deltas in cycle 1, "
+              f"{sum(deltas[args.searches:])} after")
+        # The first cycles grow the interned-string table; after that the heap should not move
+        warm = min(5, args.cycles)
+        print(f"heap after cycle 1 {heap[0] / 2**20:.2f} MB, cycle {warm} {heap[warm - 1] / 2**20:.2f} MB, "
+              f"cycle {args.cycles} {heap[-1] / 2**20:.2f} MB")
+
+        # An interval far longer than the idle window: the watch only waits
+        watcher = Watcher(client, queries, interval=3600, jitter=0)
+        watcher.run(cycles=1)
+        cpu, wall = time.process_time(), time.perf_counter()
+        watcher.stop_event.wait(args.idle)
+        print(f"idle {time.perf_counter() - wall:.1f}s: {(time.process_time() - cpu) * 1000:.1f} ms CPU")
+        client.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Adzuna search API, for benchmarks.
+
+Serves ``/v1/api/jobs/<country>/search/<page>`` with deterministic
+synthetic results. The total result count, description size, per-request
+latency and the share of 500 / 429 responses are configurable. Point a
+client at it with ``AdzunaClient(..., api_base=server.api_base)``.
+
+Run standalone:
+
+    python benchmarks/mock_adzuna.py --port 8765 --count 10000 --latency-ms 40
+"""
+
+import argparse
+import json
+import multiprocessing
+import random
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PATH = "/v1/api/jobs"
+
+CONTRACT_TYPES = ("permanent", "contract", None)
+DESCRIPTION_WORDS = ("python", "django", "data", "pipelines", "cloud", "aws", "teams",
+                     "build", "maintain", "services", "api", "sql", "kubernetes", "remote")
+
+
+class MockConfig:
+    """What the mock server returns and how it misbehaves."""
+
+    def __init__(self, count=10000, description_bytes=500, latency_ms=0.0, jitter_ms=0.0,
+                 error_rate=0.0, rate_429=0.0, retry_after=0, seed=0):
+        self.count = count
+        self.description_bytes = description_bytes
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.seed = seed
+
+    def to_dict(self):
+        return dict(vars(self))
+
+
+def make_result(index, country, description_bytes):
+    """One synthetic result shaped like an Adzuna search result."""
+    rng = random.Random(index)
+    words = []
+    size = 0
+    while size < description_bytes:
+        word = rng.choice(DESCRIPTION_WORDS)
+        words.append(word)
+        size += len(word) + 1
+    town = f"Town {index % 311}"
+    return {
+        "id": str(4000000000 + index),
+        "title": f"Python Developer {index}",
+        "description": " ".join(words)[:description_bytes],
+        "created": f"2024-{index % 12 + 1:02d}-{index % 28 + 1:02d}T{index % 24:02d}:00:00Z",
+        "redirect_url": f"https://www.adzuna.co.uk/jobs/land/ad/{4000000000 + index}",
+        "salary_min": 25000 + index % 50000,
+        "salary_max": 30000 + index % 70000,
+        "salary_is_predicted": "0",
+        "contract_type": CONTRACT_TYPES[index % 3],
+        "company": {"display_name": f"Company {index % 997}"},
+        "location": {"display_name": town, "area": [country.upper(), town]},
+        "category": {"label": "IT Jobs", "tag": "it-jobs"},
+        "latitude": 51.5 + (index % 100) / 1000,
+        "longitude": -0.1 - (index % 100) / 1000,
+    }
+
+
+@lru_cache(maxsize=4096)
+def page_body(country, page, results_per_page, count, description_bytes):
+    """Encoded JSON response for one page (cached, results are deterministic)."""
+    start = (page - 1) * results_per_page
+    stop = min(count, start + results_per_page)
+    results = [make_result(i, country, description_bytes) for i in range(start, stop)]
+    return json.dumps({"count": count, "mean": 45000, "results": results}).encode()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle + delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        config = self.server.config
+        url = urlparse(self.path)
+        parts = url.path[len(API_PATH):].strip("/").split("/")
+        if not url.path.startswith(API_PATH) or len(parts) != 3 or parts[1] != "search":
+            return self._send(404, b'{"exception": "NOT_FOUND"}')
+        try:
+            page = int(parts[2])
+        except ValueError:
+            return self._send(400, b'{"exception": "BAD_PAGE"}')
+        query = parse_qs(url.query)
+        results_per_page = int(query.get("results_per_page", ["10"])[0])
+
+        delay = config.latency_ms + (self.server.uniform(0, config.jitter_ms) if config.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000)
+
+        roll = self.server.uniform(0, 1)
+        if roll < config.error_rate:
+            return self._send(500, b'{"exception": "INTERNAL"}')
+        if roll < config.error_rate + config.rate_429:
+            return self._send(429, b'{"exception": "RATE_LIMIT"}',
+                              {"Retry-After": str(config.retry_after)})
+
+        body = page_body(parts[0], page, results_per_page, config.count, config.description_bytes)
+        self._send(200, body)
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockAdzunaServer(ThreadingHTTPServer):
+    """Threaded mock server; use as a context manager to run it in the background."""
+
+    daemon_threads = True
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        super().__init__((host, port), MockHandler)
+        self.config = config or MockConfig()
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._thread = None
+
+    def uniform(self, a, b):
+        with self._rng_lock:
+            return self._rng.uniform(a, b)
+
+    @property
+    def api_base(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PATH}"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def _serve(config, ready):
+    server = MockAdzunaServer(config)
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_in_subprocess(config):
+    """Run a mock server in its own process so it doesn't share our GIL.
+
+    Returns (process, api_base); terminate the process when done.
+    """
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(config, ready), daemon=True)
+    process.start()
+    port = ready.get(timeout=10)
+    return process, f"http://127.0.0.1:{port}{API_PATH}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--description-bytes', type=int, default=500)
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = MockConfig(args.count, args.description_bytes, args.latency_ms, args.jitter_ms,
+                        args.error_rate, args.rate_429)
+    server = MockAdzunaServer(config, port=args.port)
+    print(f"Mock Adzuna API at {server.api_base}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
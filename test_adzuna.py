@@ -1,18 +1,18 @@
 ﻿import unittest
 from unittest.mock import patch, MagicMock
-import sys
 
-# Mock tkinter for testing
-sys.modules['tkinter'] = MagicMock()
+# The API functions are headless; only the GUI test needs tkinter
+from adzuna import api
 
-# Import after mocking tkinter
-import importlib
-adzuna_scraper = importlib.import_module('AdzunaApiScraper')
+try:
+    import AdzunaApiScraper
+except ImportError:  # Python built without tkinter
+    AdzunaApiScraper = None
 
 class TestAdzunaJobScraper(unittest.TestCase):
     """Test cases for Adzuna API job scraper."""
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_adzuna_jobs_success(self, mock_get):
         """Test successful API call to Adzuna returns jobs."""
         mock_response = MagicMock()
@@ -23,32 +23,54 @@ class TestAdzunaJobScraper(unittest.TestCase):
         }
         mock_get.return_value = mock_response
         
-        result = adzuna_scraper.get_adzuna_jobs('test_id', 'test_key', 'python', 'UK')
+        result = api.get_adzuna_jobs('test_id', 'test_key', 'python', 'UK')
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['title'], 'Python Dev')
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_adzuna_jobs_api_error(self, mock_get):
         """Test API error handling returns empty list."""
         mock_get.side_effect = Exception("API Error")
         
-        result = adzuna_scraper.get_adzuna_jobs('test_id', 'test_key', 'python', 'UK')
+        result = api.get_adzuna_jobs('test_id', 'test_key', 'python', 'UK')
         self.assertEqual(result, [])
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_adzuna_jobs_no_results(self, mock_get):
         """Test handling when no results are returned."""
         mock_response = MagicMock()
         mock_response.json.return_value = {'results': []}
         mock_get.return_value = mock_response
         
-        result = adzuna_scraper.get_adzuna_jobs('test_id', 'test_key', 'python', 'UK')
+        result = api.get_adzuna_jobs('test_id', 'test_key', 'python', 'UK')
         self.assertEqual(result, [])
 
+    @unittest.skipIf(AdzunaApiScraper is None, "tkinter is not available")
+    def test_csv_export_uses_table_columns(self):
+        """Test CSV saves carry the columns the results table shows."""
+        import csv
+        import os
+        import tempfile
+        from adzuna.job_record import Job
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'jobs.csv')
+            job = Job(id='1', title='Python Developer', skills=('python', 'sql'), score=42,
+                      category='IT Jobs', redirect_url='https://example.com/1')
+            with patch.object(AdzunaApiScraper, 'current_jobs', [job]), \
+                    patch.object(AdzunaApiScraper, 'messagebox'), \
+                    patch.object(AdzunaApiScraper.filedialog, 'asksaveasfilename', return_value=path):
+                AdzunaApiScraper.save_to_json()
+            with open(path, newline='', encoding='utf-8') as f:
+                header, row = list(csv.reader(f))
+        self.assertEqual(header, ['Date', 'Score', 'Category', 'Title', 'Company', 'Location',
+                                  'Type', 'Salary Max', 'Skills', 'Link'])
+        self.assertEqual(row[1:4], ['42', 'IT Jobs', 'Python Developer'])
+
+
 class TestAdzunaIntegration(unittest.TestCase):
     """Integration tests for the Adzuna job scraper team."""
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_full_search_pipeline(self, mock_get):
         """Test complete search workflow returns job objects."""
         mock_response = MagicMock()
@@ -65,13 +87,13 @@ class TestAdzunaIntegration(unittest.TestCase):
         }
         mock_get.return_value = mock_response
         
-        result = adzuna_scraper.get_adzuna_jobs('app123', 'key456', 'python', 'London')
+        result = api.get_adzuna_jobs('app123', 'key456', 'python', 'London')
         
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['title'], 'Senior Python Dev')
         self.assertIn('redirect_url', result[0])
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_multiple_jobs_returned(self, mock_get):
         """Test multiple jobs are returned and parsed correctly."""
         mock_response = MagicMock()
@@ -84,7 +106,7 @@ class TestAdzunaIntegration(unittest.TestCase):
         }
         mock_get.return_value = mock_response
         
-        result = adzuna_scraper.get_adzuna_jobs('app1', 'key1', 'dev', 'US')
+        result = api.get_adzuna_jobs('app1', 'key1', 'dev', 'US')
         
         self.assertEqual(len(result), 3)
     
@@ -0,0 +1,225 @@
+import json
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from adzuna import client as adzuna_client
+from adzuna.job_record import Job
+from adzuna.rate_limit import RateLimiter
+from adzuna.response_cache import ResponseCache
+
+
+def make_page(count, n, start=0):
+    """Build a fake Adzuna search response with n results."""
+    response = MagicMock()
+    response.json.return_value = {
+        'count': count,
+        'results': [{'id': str(start + i), 'title': f'Job {start + i}'} for i in range(n)],
+    }
+    return response
+
+
+def make_raw_page(count, n, start=0):
+    """Build a fake search response carrying its body as raw bytes."""
+    response = make_page(count, n, start)
+    response.content = json.dumps(response.json.return_value).encode('utf-8')
+    return response
+
+
+class TestPagination(unittest.TestCase):
+    """Test cases for paginated job fetching."""
+
+    def test_plan_pages(self):
+        """Test page planning is capped by both count and max_results."""
+        self.assertEqual(adzuna_client.plan_pages(120, 500, 50), [1, 2, 3])
+        self.assertEqual(adzuna_client.plan_pages(1000, 75, 50), [1, 2])
+        self.assertEqual(adzuna_client.plan_pages(0, 100, 50), [])
+
+    @patch('requests.Session.get')
+    def test_fetches_remaining_pages_in_order(self, mock_get):
+        """Test all planned pages are fetched and merged in page order."""
+        def fake_get(url, params=None, timeout=None):
+            page = int(url.rsplit('/', 1)[1])
+            return make_page(120, 50 if page < 3 else 20, start=(page - 1) * 50)
+        mock_get.side_effect = fake_get
+
+        jobs = adzuna_client.fetch_jobs_paginated('id', 'key', max_results=500)
+
+        self.assertEqual(len(jobs), 120)
+        self.assertEqual([job['id'] for job in jobs], [str(i) for i in range(120)])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_stops_at_max_results(self, mock_get):
+        """Test fetching stops once max_results jobs are collected."""
+        mock_get.side_effect = lambda url, params=None, timeout=None: make_page(10000, 50)
+
+        jobs = adzuna_client.fetch_jobs_paginated('id', 'key', max_results=120)
+
+        self.assertEqual(len(jobs), 120)
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_on_page_progress_and_cancel(self, mock_get):
+        """Test pages are reported in order and cancel stops the search."""
+        mock_get.side_effect = lambda url, params=None, timeout=None: make_page(500, 50)
+        cancel_event = threading.Event()
+        progress = []
+
+        def on_page(page_jobs, pages_done, total_pages):
+            progress.append((len(page_jobs), pages_done, total_pages))
+            if pages_done == 2:
+                cancel_event.set()
+
+        client = adzuna_client.AdzunaClient('id', 'key')
+        jobs = client.search(max_results=500, on_page=on_page, cancel_event=cancel_event)
+
+        self.assertEqual(progress, [(50, 1, 10), (50, 2, 10)])
+        self.assertEqual(len(jobs), 100)
+
+    @patch('requests.Session.get')
+    def test_cancel_interrupts_rate_limit_wait(self, mock_get):
+        """Test cancelling while pages wait on the rate limiter returns the jobs so far."""
+        mock_get.side_effect = lambda url, params=None, timeout=None: make_page(500, 50)
+        cancel_event = threading.Event()
+        # One token: page 1 goes through, later pages wait until the cancel
+        limiter = RateLimiter(per_minute=1, per_day=None, sleep=lambda s: cancel_event.set())
+        client = adzuna_client.AdzunaClient('id', 'key', rate_limiter=limiter)
+
+        jobs = client.search(max_results=200, cancel_event=cancel_event)
+
+        self.assertEqual(len(jobs), 50)
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_search_countries_fans_out_and_tags(self, mock_get):
+        """Test each country endpoint is searched and results are tagged and merged."""
+        def fake_get(url, params=None, timeout=None):
+            country = url.split('/')[-3]
+            if country == 'de':
+                return make_status(500)
+            self.assertNotIn('where', params)
+            return make_page(2, 2, start=100 if country == 'us' else 0)
+        mock_get.side_effect = fake_get
+        pages = []
+
+        client = adzuna_client.AdzunaClient('id', 'key', max_retries=0)
+        result = client.search_countries(['gb', 'US', 'de'], 'python', '', max_results=10,
+                                         on_page=lambda country, *args: pages.append(country))
+
+        self.assertEqual([(job['country'], job['id']) for job in result.jobs],
+                         [('gb', '0'), ('gb', '1'), ('us', '100'), ('us', '101')])
+        self.assertEqual(result.counts, {'gb': 2, 'us': 2})
+        self.assertEqual(list(result.errors), ['de'])
+        self.assertEqual(sorted(pages), ['gb', 'us'])
+
+    @patch('requests.Session.get')
+    def test_search_as_jobs(self, mock_get):
+        """Test as_jobs decodes response bytes into tagged Job records, cached or not."""
+        def fake_get(url, params=None, timeout=None):
+            page = int(url.rsplit('/', 1)[1])
+            return make_raw_page(70, 50 if page == 1 else 20, start=(page - 1) * 50)
+        mock_get.side_effect = fake_get
+
+        client = adzuna_client.AdzunaClient('id', 'key')
+        jobs = client.search(max_results=100, country='us', as_jobs=True)
+        self.assertEqual(len(jobs), 70)
+        self.assertTrue(all(isinstance(job, Job) for job in jobs))
+        self.assertEqual((jobs[69].id, jobs[69].title, jobs[69].country), ('69', 'Job 69', 'us'))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            client = adzuna_client.AdzunaClient('id', 'key', cache=ResponseCache(tmp))
+            self.assertIsInstance(client.search(max_results=100)[0], dict)
+            calls = mock_get.call_count
+            cached = client.search(max_results=100, as_jobs=True)
+            self.assertEqual(mock_get.call_count, calls)
+            self.assertEqual([job.id for job in cached], [str(i) for i in range(70)])
+            self.assertEqual(cached[0].country, 'gb')
+
+    def test_get_client_keys_on_settings(self):
+        """Test shared clients are reused per credentials and settings, not credentials alone."""
+        first = adzuna_client.get_client('shared', 'key')
+        self.assertIs(adzuna_client.get_client('shared', 'key'), first)
+        retrying = adzuna_client.get_client('shared', 'key', max_retries=0)
+        self.assertIsNot(retrying, first)
+        self.assertEqual((retrying.max_retries, first.max_retries),
+                         (0, adzuna_client.DEFAULT_MAX_RETRIES))
+        self.assertIs(adzuna_client.get_client('shared', 'key', max_retries=0), retrying)
+
+
+def make_status(status_code, headers=None):
+    """Build a fake response with a status code and headers."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(str(status_code))
+    return response
+
+
+@patch('time.sleep')
+class TestRetries(unittest.TestCase):
+    """Test cases for retry, backoff and error surfacing."""
+
+    def setUp(self):
+        self.client = adzuna_client.AdzunaClient('id', 'key', max_retries=2)
+
+    @patch('requests.Session.get')
+    def test_retry_after_honoured_on_429(self, mock_get, mock_sleep):
+        """Test a 429 waits for Retry-After and then succeeds."""
+        mock_get.side_effect = [make_status(429, {'Retry-After': '7'}), make_page(1, 1)]
+
+        data = self.client.get_json('http://example.com')
+
+        self.assertEqual(data['count'], 1)
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch('requests.Session.get')
+    def test_rate_limiter_gates_every_attempt(self, mock_get, mock_sleep):
+        """Test retries draw from the rate limiter too."""
+        self.client.rate_limiter = MagicMock()
+        mock_get.side_effect = [make_status(503), make_page(1, 1)]
+
+        self.client.get_json('http://example.com')
+
+        self.assertEqual(self.client.rate_limiter.acquire.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_connection_errors_exhaust_retries(self, mock_get, mock_sleep):
+        """Test repeated connection errors raise AdzunaAPIError."""
+        mock_get.side_effect = requests.ConnectionError("refused")
+
+        with self.assertRaises(adzuna_client.AdzunaAPIError):
+            self.client.get_json('http://example.com')
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_transient_request_errors_retried(self, mock_get, mock_sleep):
+        """Test a truncated response is retried, and wrapped once retries run out."""
+        mock_get.side_effect = [requests.exceptions.ChunkedEncodingError("truncated"),
+                                make_page(1, 1)]
+        self.assertEqual(self.client.get_json('http://example.com')['count'], 1)
+
+        mock_get.reset_mock()
+        mock_get.side_effect = requests.TooManyRedirects("loop")
+        with self.assertRaises(adzuna_client.AdzunaAPIError):
+            self.client.fetch_page()
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_client_error_not_retried(self, mock_get, mock_sleep):
+        """Test a 401 fails immediately with its status code."""
+        mock_get.return_value = make_status(401)
+
+        with self.assertRaises(adzuna_client.AdzunaAPIError) as ctx:
+            self.client.get_json('http://example.com')
+        self.assertEqual(ctx.exception.status_code, 401)
+        self.assertEqual(mock_get.call_count, 1)
+        mock_sleep.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
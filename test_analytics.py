@@ -0,0 +1,100 @@
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from adzuna.analytics import MarketAnalytics, parse_geodata, parse_histogram
+from adzuna.client import AdzunaClient
+from adzuna.job_record import Job
+from adzuna.response_cache import ResponseCache
+from adzuna.stats import MarketStats
+
+RESPONSES = {
+    'search/1': {'count': 1234, 'mean': 45000.0, 'results': []},
+    'histogram': {'histogram': {'30000': 40, '20000': 10, '40000': 25}},
+    'top_companies': {'leaderboard': [{'canonical_name': 'Acme', 'count': 30, 'average_salary': 50000}]},
+    'geodata': {'locations': [{'location': {'display_name': 'Leeds'}, 'count': 5},
+                              {'location': {'display_name': 'London'}, 'count': 90}]},
+    'history': {'month': {'2024-02': 45500, '2024-01': 44000}},
+}
+
+
+def fake_get(failing=()):
+    def get(url, params=None, timeout=None):
+        endpoint = url.split('/gb/', 1)[1]
+        response = MagicMock(status_code=200)
+        if endpoint in failing:
+            response.status_code = 403
+            response.raise_for_status.side_effect = requests.HTTPError('403')
+        response.json.return_value = RESPONSES[endpoint]
+        return response
+    return get
+
+
+class TestParsers(unittest.TestCase):
+    """Test cases for aggregate response parsing."""
+
+    def test_histogram_sorted_by_band(self):
+        """Test salary bands come back in ascending order."""
+        self.assertEqual(parse_histogram(RESPONSES['histogram']),
+                         [(20000.0, 10), (30000.0, 40), (40000.0, 25)])
+
+    def test_geodata_busiest_first(self):
+        """Test locations are ordered by posting count."""
+        self.assertEqual(parse_geodata(RESPONSES['geodata']), [('London', 90), ('Leeds', 5)])
+
+
+class TestMarketAnalytics(unittest.TestCase):
+    """Test cases for the aggregate report and its local fallback."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = AdzunaClient('id', 'key', backoff=0, cache=ResponseCache(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @patch('requests.Session.get')
+    def test_report_from_api_is_cached(self, mock_get):
+        """Test one request per part, all served from the cache the second time."""
+        mock_get.side_effect = fake_get()
+        report = MarketAnalytics(self.client).report('python', 'London', 'gb')
+        self.assertEqual((report.count, report.mean_salary), (1234, 45000.0))
+        self.assertEqual(report.companies, [('Acme', 30, 50000.0)])
+        self.assertEqual(report.history, [('2024-01', 44000.0), ('2024-02', 45500.0)])
+        self.assertEqual(set(report.sources.values()), {'api'})
+        self.assertEqual(mock_get.call_count, 5)
+        urls = {call.args[0].rsplit('/', 1)[1]: call.kwargs['params'] for call in mock_get.call_args_list}
+        self.assertEqual(urls['histogram']['where'], 'London')
+        self.assertEqual(urls['1']['results_per_page'], 1)
+
+        MarketAnalytics(self.client).report('python', 'London', 'gb')
+        self.assertEqual(mock_get.call_count, 5)
+        self.assertIn('downloading every posting: 25', report.format())
+
+    @patch('requests.Session.get')
+    def test_failed_parts_fall_back_to_local_stats(self, mock_get):
+        """Test only the parts the API refused are computed from loaded jobs."""
+        mock_get.side_effect = fake_get(failing=('geodata', 'histogram'))
+        stats = MarketStats([Job(id='1', location='York', country='gb', salary_max=30000.0),
+                             Job(id='2', location='York', country='gb'),
+                             Job(id='3', location='Paris', country='fr')])
+        report = MarketAnalytics(self.client, lambda: stats).report('python', '', 'gb')
+        self.assertEqual(report.sources['geodata'], 'local')
+        self.assertEqual(report.sources['summary'], 'api')
+        self.assertEqual(report.locations, [('York', 2)])
+        self.assertEqual(sum(count for _, count in report.histogram), 1)
+        self.assertIn('Computed from loaded jobs: ', report.format())
+
+    @patch('requests.Session.get')
+    def test_no_fallback_reports_error(self, mock_get):
+        """Test a failed part without local stats is left out and reported."""
+        mock_get.side_effect = fake_get(failing=('history',))
+        report = MarketAnalytics(self.client).report('python', '', 'gb')
+        self.assertNotIn('history', report.sources)
+        self.assertIn('history unavailable', report.format())
+
+
+if __name__ == '__main__':
+    unittest.main()
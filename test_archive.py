@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from adzuna.archive import SnapshotArchive, format_trends, load_stats
+from adzuna.stats import MarketStats
+from adzuna.table_model import parse_day
+from test_support import make_job
+
+DAY = 86400
+
+
+class TestSnapshotArchive(unittest.TestCase):
+    """Test cases for the columnar snapshot archive."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive = SnapshotArchive(os.path.join(self.tmp.name, 'archive'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Test every Job field survives a segment, in created order."""
+        jobs = [
+            make_job(0, created='2024-03-05', salary=50000, country='gb', company='Acme',
+                     location='London', area=['UK', 'London'], description='Python – 3 days',
+                     latitude=51.5, longitude=-0.12, salary_is_predicted='1',
+                     skills=['Python', 'AWS'], score=80),
+            make_job(1, country='us', title='', contract_type='permanent', skills=[], score=0),
+            make_job(2, created='2024-03-01', salary=40000, country='gb'),
+        ]
+        segment = self.archive.append(jobs, 'python', 'UK', fetched=parse_day('2024-03-06'))
+        self.assertEqual(len(segment), 3)
+        self.assertEqual(len(self.archive), 3)
+
+        restored = list(SnapshotArchive(self.archive.path).iter_jobs())
+        self.assertEqual([job.id for job in restored], ['2', '0', '1'])
+        for job in restored:
+            original = jobs[int(job.id)]
+            self.assertEqual(job.to_dict(), original.to_dict())
+        self.assertIsNone(restored[0].skills)
+        self.assertEqual(restored[2].skills, ())
+
+        self.assertIsNone(self.archive.append([]))
+        self.assertFalse(any(name.startswith('.') for name in os.listdir(self.archive.path)))
+
+    def test_projection_and_pushdown(self):
+        """Test reads return only the asked columns for matching rows, skipping segments."""
+        for day in range(1, 4):
+            fetched = parse_day(f'2024-03-{day:02d}')
+            jobs = [make_job(f'{day}-{i}', created=f'2024-03-{day:02d}', salary=1000 * i,
+                             country='gb' if i % 2 else 'us') for i in range(1, 7)]
+            self.archive.append(jobs, fetched=fetched)
+        self.archive.append([make_job('de', created='2024-02-01', salary=5, country='de')],
+                            fetched=parse_day('2024-03-04'))
+
+        march_2 = (parse_day('2024-03-02'), parse_day('2024-03-02', end=True))
+        self.assertEqual(len(self.archive.segments(*march_2)), 1)
+        self.assertEqual(len(self.archive.segments(countries=['de'])), 1)
+
+        columns = self.archive.read(('id', 'salary_max', 'country'), *march_2, countries=['gb'])
+        self.assertEqual(sorted(columns), ['country', 'id', 'salary_max'])
+        self.assertEqual(list(columns['id']), ['2-1', '2-3', '2-5'])
+        np.testing.assert_array_equal(columns['salary_max'], [1000, 3000, 5000])
+        self.assertEqual(set(columns['country']), {'gb'})
+
+        fetched = self.archive.read(('fetched',), fetched_start=parse_day('2024-03-03'))
+        self.assertEqual(len(fetched['fetched']), 7)
+        self.assertEqual(len(self.archive.read(('id',), start=parse_day('2025-01-01'))['id']), 0)
+
+    def test_load_stats(self):
+        """Test trends count every snapshot by fetch date, or each job once by posting date."""
+        for day in (4, 11):
+            jobs = [make_job(i, created='2024-03-01', salary=1000 * (i + day), country='gb')
+                    for i in range(4)]
+            self.archive.append(jobs, fetched=parse_day(f'2024-03-{day:02d}'))
+        by_fetch = load_stats(self.archive)
+        self.assertEqual(by_fetch.time_series('week'), [('2024-03-04', 4, 5500.0),
+                                                        ('2024-03-11', 4, 12500.0)])
+        by_posting = load_stats(self.archive, by='created', countries=['gb'])
+        self.assertEqual(by_posting.time_series('week'), [('2024-02-26', 4, 12500.0)])
+        self.assertEqual(by_posting.group('country'), [('gb', 4, 4, 12500.0)])
+        self.assertIn('£12,500', format_trends(by_posting, 'week', 'gb'))
+
+        # Columns load the same as the Jobs they came from
+        stats = MarketStats([make_job(0, created='2024-03-01', salary=10, company='Acme',
+                                      country='gb')])
+        stats.extend_columns({'salary_max': np.array([20.0])},
+                             {'company': (np.array([-1], dtype=np.int32), ['Beta'])})
+        self.assertEqual(stats.group('company'), [('Acme', 1, 1, 10.0)])
+        self.assertEqual(stats.percentiles((50,)), {50: 15.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from adzuna.batch import BatchScheduler, Checkpoint, Query, format_report, load_manifest
+from adzuna.errors import AdzunaAPIError
+from adzuna.rate_limit import QuotaExhausted, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for the token buckets."""
+
+    def test_bucket_refills_at_rate(self):
+        """Test a bucket bursts to capacity, then refills continuously."""
+        clock = FakeClock()
+        bucket = TokenBucket(60, 60, clock)
+        for _ in range(60):
+            bucket.take()
+        self.assertAlmostEqual(bucket.wait_time(), 1.0)
+        clock.now = 0.5
+        self.assertAlmostEqual(bucket.wait_time(), 0.5)
+
+    def test_limiter_honours_every_bucket(self):
+        """Test the per-minute bucket throttles once the burst is spent."""
+        clock = FakeClock()
+        limiter = RateLimiter(per_minute=10, per_day=1000, clock=clock, sleep=clock.sleep)
+        for _ in range(10):
+            self.assertEqual(limiter.acquire(), 0.0)
+        limiter.acquire()
+        self.assertAlmostEqual(clock.now, 6.0, places=3)
+        self.assertEqual(limiter.stats()['acquired'], 11)
+
+    def test_daily_quota_exhausted(self):
+        """Test a wait longer than max_wait raises instead of sleeping."""
+        clock = FakeClock()
+        limiter = RateLimiter(per_minute=0, per_day=2, max_wait=60,
+                              clock=clock, sleep=clock.sleep)
+        limiter.acquire()
+        limiter.acquire()
+        with self.assertRaises(QuotaExhausted):
+            limiter.acquire()
+        self.assertEqual(clock.now, 0.0)
+
+
+class TestBatchScheduler(unittest.TestCase):
+    """Test cases for running query manifests."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.calls = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_client(self, fail=()):
+        def search(term, location, max_results, on_page=None, **kwargs):
+            self.calls.append(term)
+            if term in fail:
+                raise fail[term]
+            jobs = [{'id': f'{term}-{i}'} for i in range(3)]
+            on_page(jobs, 1, 1)
+            return jobs
+        client = MagicMock()
+        client.search.side_effect = search
+        return client
+
+    def test_priority_order_and_dedupe(self):
+        """Test queries run highest priority first and duplicates run once."""
+        queries = [Query('low'), Query('high', priority=5), Query('mid', priority=1), Query('low')]
+        results = BatchScheduler(self.make_client(), max_workers=1).run(queries)
+        self.assertEqual(self.calls, ['high', 'mid', 'low'])
+        self.assertEqual([(r.status, r.jobs, r.pages) for r in results], [('done', 3, 1)] * 3)
+        self.assertIn('3 done', format_report(results))
+
+    def test_resume_from_checkpoint(self):
+        """Test finished queries are skipped and failed ones rerun."""
+        path = os.path.join(self.tmp.name, 'batch.checkpoint.json')
+        queries = [Query('a'), Query('b'), Query('c')]
+        client = self.make_client(fail={'b': AdzunaAPIError('HTTP 500')})
+        results = BatchScheduler(client, checkpoint=Checkpoint(path)).run(queries)
+        self.assertEqual(sorted(r.status for r in results), ['done', 'done', 'failed'])
+
+        self.calls.clear()
+        store = MagicMock()
+        results = BatchScheduler(self.make_client(), store, checkpoint=Checkpoint(path)).run(queries)
+        self.assertEqual(self.calls, ['b'])
+        self.assertEqual([r.status for r in results], ['skipped', 'done', 'skipped'])
+        store.upsert_jobs.assert_called_once()
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(len(json.load(f)['done']), 3)
+
+    def test_quota_exhausted_cancels_rest(self):
+        """Test running out of quota stops queued queries."""
+        client = self.make_client(fail={'a': QuotaExhausted('quota', 3600)})
+        results = BatchScheduler(client, max_workers=1).run([Query('a'), Query('b')])
+        self.assertEqual([r.status for r in results], ['failed', 'cancelled'])
+        self.assertEqual(self.calls, ['a'])
+
+    def test_load_csv_manifest(self):
+        """Test CSV manifests accept Adzuna-style column names."""
+        path = os.path.join(self.tmp.name, 'queries.csv')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("what,where,max_results,priority\npython,London,200,2\nrust,,,\n")
+        queries = load_manifest(path)
+        self.assertEqual([(q.search_term, q.location, q.max_results, q.priority) for q in queries],
+                         [('python', 'London', 200, 2), ('rust', 'UK', 100, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,248 @@
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from adzuna import cli
+from adzuna.job_store import JobStore
+
+
+def fake_get(url, params=None, timeout=None):
+    """Adzuna stub with 60 results over two pages of 50."""
+    page = int(url.rsplit('/', 1)[1])
+    n = 50 if page == 1 else 10
+    response = MagicMock()
+    response.json.return_value = {
+        'count': 60,
+        'results': [{'id': str((page - 1) * 50 + i), 'title': f'Job {i}',
+                     'created': f'2024-03-{i % 28 + 1:02d}T10:00:00Z'} for i in range(n)],
+    }
+    return response
+
+
+class TestCli(unittest.TestCase):
+    """Test cases for the command-line entry point."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.tmp.name, 'jobs.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_cli(self, *argv):
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = cli.main(list(argv))
+        return code, out.getvalue(), err.getvalue()
+
+    @patch('requests.Session.get', side_effect=fake_get)
+    def test_paginate_exports_and_stores(self, mock_get):
+        """Test paginate writes every page to the output and the store."""
+        output = os.path.join(self.tmp.name, 'jobs.ndjson')
+        code, _, err = self.run_cli('paginate', 'python', '--app-id', 'cli', '--api-key', 'k',
+                                    '--max-results', '100', '--no-cache', '--store',
+                                    '--db', self.db, '-o', output)
+        self.assertEqual(code, 0)
+        self.assertIn('page 2/2', err)
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual(len([json.loads(line) for line in f]), 60)
+        store = JobStore(self.db)
+        self.assertEqual(store.count(), 60)
+        store.close()
+
+    @patch('requests.Session.get', side_effect=fake_get)
+    def test_paginate_archive_and_trends(self, mock_get):
+        """Test paginate --archive writes a segment that trends reads back."""
+        archive = os.path.join(self.tmp.name, 'archive')
+        code, _, err = self.run_cli('paginate', 'python', '--app-id', 'cli', '--api-key', 'k',
+                                    '--max-results', '100', '--no-cache', '--archive', archive)
+        self.assertEqual(code, 0)
+        self.assertIn('Archived 60 jobs', err)
+        code, out, _ = self.run_cli('trends', '--archive', archive, '--by', 'created',
+                                    '--period', 'month', '-q')
+        self.assertEqual(code, 0)
+        self.assertIn('2024-03-01         60', out)
+        code, out, _ = self.run_cli('trends', '--archive', archive, '--from', '2030-01-01', '-q')
+        self.assertEqual(code, 1)
+
+    @patch('requests.Session.get', side_effect=fake_get)
+    def test_watch_writes_deltas(self, mock_get):
+        """Test watch writes new jobs once, then nothing for an unchanged rerun."""
+        manifest = os.path.join(self.tmp.name, 'queries.csv')
+        with open(manifest, 'w', encoding='utf-8') as f:
+            f.write("what,max_results\npython,100\n")
+        deltas = os.path.join(self.tmp.name, 'deltas.ndjson')
+        for _ in range(2):
+            code, _, err = self.run_cli('watch', manifest, '--app-id', 'cli', '--api-key', 'k',
+                                        '--every', '0', '--cycles', '1', '-o', deltas)
+            self.assertEqual(code, 0)
+        self.assertIn('60 jobs, 0 new', err)
+        with open(deltas, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 60)
+        self.assertTrue(os.path.exists(manifest + '.watch.json'))
+
+    @patch('requests.Session.get', side_effect=fake_get)
+    def test_metrics_file(self, mock_get):
+        """Test --metrics writes counters for the run."""
+        from adzuna.metrics import METRICS
+        path = os.path.join(self.tmp.name, 'run.prom')
+        try:
+            code, _, err = self.run_cli('paginate', 'python', '--app-id', 'cli', '--api-key', 'k',
+                                        '--max-results', '100', '--no-cache', '--metrics', path)
+        finally:
+            METRICS.disable()
+            METRICS.reset()
+        self.assertEqual(code, 0)
+        self.assertIn('API requests: 2', err)
+        with open(path, encoding='utf-8') as f:
+            self.assertIn('adzuna_api_requests_total 2', f.read())
+
+    def test_export_date_range(self):
+        """Test export filters the store by posting date."""
+        store = JobStore(self.db)
+        store.upsert_jobs([{'id': str(i), 'created': f'2024-03-{i:02d}T10:00:00Z'}
+                           for i in range(1, 11)])
+        store.close()
+        output = os.path.join(self.tmp.name, 'march.json')
+        code, _, _ = self.run_cli('export', output, '--db', self.db, '--from', '2024-03-03',
+                                  '--to', '2024-03-05', '--ascending', '-q')
+        self.assertEqual(code, 0)
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual([job['id'] for job in json.load(f)], ['3', '4', '5'])
+
+    def test_export_near_place_and_salary(self):
+        """Test export narrows stored jobs to a radius around a place and a salary range."""
+        store = JobStore(self.db)
+        store.upsert_jobs([
+            {'id': '1', 'latitude': 51.5074, 'longitude': -0.1278, 'salary_max': 60000,
+             'location': {'display_name': 'London'}},
+            {'id': '2', 'latitude': 51.3762, 'longitude': -0.0982, 'salary_max': 40000,
+             'location': {'display_name': 'Croydon'}},
+            {'id': '3', 'latitude': 53.4808, 'longitude': -2.2426, 'salary_max': 65000,
+             'location': {'display_name': 'Manchester'}},
+        ])
+        store.close()
+        output = os.path.join(self.tmp.name, 'near.json')
+        code, _, err = self.run_cli('export', output, '--db', self.db, '--near', 'London',
+                                    '--within', '15', '--ascending', '--order-by', 'title')
+        self.assertEqual(code, 0)
+        self.assertIn('2 of 3 jobs', err)
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual(sorted(job['id'] for job in json.load(f)), ['1', '2'])
+
+        self.run_cli('export', output, '--db', self.db, '--bbox', '50,-3,54,0',
+                     '--min-salary', '50000', '-q')
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual(sorted(job['id'] for job in json.load(f)), ['1', '3'])
+
+        code, _, err = self.run_cli('export', output, '--db', self.db, '--near', 'Atlantis')
+        self.assertEqual(code, 2)
+        self.assertIn('Atlantis', err)
+
+    def test_dedupe_and_unique_export(self):
+        """Test dedupe flags stored reposts and export leaves them out."""
+        text = ' '.join(f'word{i}' for i in range(60))
+        store = JobStore(self.db)
+        store.upsert_jobs([{'id': '1', 'title': 'Python Developer', 'description': text},
+                           {'id': '2', 'title': 'Senior Python Developer', 'description': text},
+                           {'id': '3', 'title': 'Chef', 'description': 'Kitchen brigade lead'}])
+        store.close()
+        code, _, err = self.run_cli('dedupe', '--db', self.db)
+        self.assertEqual(code, 0)
+        self.assertIn('1 near-duplicates of 1 postings', err)
+        output = os.path.join(self.tmp.name, 'unique.json')
+        self.run_cli('export', output, '--db', self.db, '--ascending', '--order-by', 'title', '-q')
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual([job['id'] for job in json.load(f)], ['3', '1'])
+
+    def test_export_with_skills(self):
+        """Test --skills adds score, category and skills columns to CSV exports."""
+        store = JobStore(self.db)
+        store.upsert_jobs([{'id': '1', 'title': 'Python Developer', 'description': 'Django and AWS',
+                            'category': {'label': 'IT Jobs'}}])
+        store.close()
+        output = os.path.join(self.tmp.name, 'scored.csv')
+        code, _, _ = self.run_cli('export', output, '--db', self.db, '--skills', '-q')
+        self.assertEqual(code, 0)
+        with open(output, encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(rows[0]['Category'], 'IT Jobs')
+        self.assertEqual(rows[0]['Skills'], 'Python, Django, AWS')
+        self.assertGreater(int(rows[0]['Score']), 0)
+
+    @patch('requests.Session.get')
+    def test_market_falls_back_to_store(self, mock_get):
+        """Test market reports API aggregates and fills refused parts from the store."""
+        def get(url, params=None, timeout=None):
+            response = MagicMock(status_code=200)
+            if url.endswith('/search/1'):
+                response.json.return_value = {'count': 60, 'mean': 40000, 'results': []}
+            else:
+                response.status_code = 403
+                response.raise_for_status.side_effect = requests.HTTPError('403')
+            return response
+        mock_get.side_effect = get
+        store = JobStore(self.db)
+        store.upsert_jobs([{'id': '1', 'country': 'gb', 'salary_max': 30000,
+                            'company': {'display_name': 'Acme'}}])
+        store.close()
+        output = os.path.join(self.tmp.name, 'market.json')
+        code, out, _ = self.run_cli('market', 'python', '--app-id', 'market', '--api-key', 'k',
+                                    '--db', self.db, '--json', output)
+        self.assertEqual(code, 0)
+        self.assertIn('Jobs: 60', out)
+        with open(output, encoding='utf-8') as f:
+            report = json.load(f)
+        self.assertEqual(report['sources']['summary'], 'api')
+        self.assertEqual(report['sources']['top_companies'], 'local')
+        self.assertEqual(report['top_companies'][0][:2], ['Acme', 1])
+
+    def test_stats(self):
+        """Test stats summarises stored jobs without the flagged reposts."""
+        store = JobStore(self.db)
+        store.upsert_jobs([{'id': str(i), 'title': 'Dev', 'salary_max': 1000 * i, 'country': 'gb',
+                            'company': {'display_name': 'Acme'}} for i in range(1, 5)])
+        store.save_dedupe([], [], [('1', '4')])
+        store.close()
+        code, out, _ = self.run_cli('stats', '--db', self.db)
+        self.assertEqual(code, 0)
+        self.assertIn('Total Jobs Loaded: 3 (3 with salary)', out)
+        self.assertIn('Acme', out)
+
+    def test_missing_credentials(self):
+        """Test API commands refuse to run without credentials."""
+        with patch.dict(os.environ, {'ADZUNA_APP_ID': '', 'ADZUNA_API_KEY': ''}), \
+                patch('dotenv.load_dotenv'), redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit) as raised:
+                cli.main(['search'])
+        self.assertEqual(raised.exception.code, 2)
+
+    def test_does_not_import_tkinter(self):
+        """Test the CLI runs without loading tkinter."""
+        code = ("import sys; from adzuna import cli; cli.build_parser(); "
+                "sys.exit('tkinter' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code],
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(result.returncode, 0)
+
+    def test_option_defaults_match_modules(self):
+        """Test the parser's mirrored defaults agree with the modules they come from."""
+        from adzuna.dedupe import DEFAULT_THRESHOLD
+        from adzuna.job_store import SORT_COLUMNS
+        from adzuna.rate_limit import DEFAULT_PER_DAY, DEFAULT_PER_MINUTE
+        self.assertEqual(cli.DEDUPE_THRESHOLD, DEFAULT_THRESHOLD)
+        self.assertEqual(cli.STORE_SORT_COLUMNS, tuple(sorted(SORT_COLUMNS)))
+        self.assertEqual((cli.PER_MINUTE, cli.PER_DAY), (DEFAULT_PER_MINUTE, DEFAULT_PER_DAY))
+
+
+if __name__ == '__main__':
+    unittest.main()
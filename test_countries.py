@@ -0,0 +1,41 @@
+import unittest
+
+from adzuna.countries import format_salary, get_country, parse_countries
+from adzuna.job_record import Job
+
+
+class TestCountries(unittest.TestCase):
+    """Test cases for country endpoints and salary formatting."""
+
+    def test_format_salary_per_locale(self):
+        """Test symbol, grouping and symbol order follow the country."""
+        self.assertEqual(format_salary(55000, 'gb'), '£55,000')
+        self.assertEqual(format_salary(55000, 'us'), '$55,000')
+        self.assertEqual(format_salary(55000, 'de'), '55.000 €')
+        self.assertEqual(format_salary(55000, 'nl'), '€ 55.000')
+        self.assertEqual(format_salary(55000, 'fr'), '55 000 €')
+        self.assertEqual(format_salary(120000.4, 'ch'), 'CHF 120’000')
+
+    def test_missing_salary_and_country(self):
+        """Test missing salaries show N/A and untagged jobs format as gb."""
+        self.assertEqual(format_salary(None, 'de'), 'N/A')
+        self.assertEqual(format_salary(30000), '£30,000')
+
+    def test_parse_countries(self):
+        """Test country lists are normalized, de-duplicated and validated."""
+        self.assertEqual(parse_countries(' GB, us,de ,gb'), ['gb', 'us', 'de'])
+        self.assertEqual(parse_countries(''), ['gb'])
+        with self.assertRaises(ValueError):
+            parse_countries('gb,xx')
+        self.assertEqual(get_country('AU').currency, 'AUD')
+
+    def test_job_currency_from_country(self):
+        """Test a tagged job reports its country's currency."""
+        job = Job.from_api({'id': '1', 'country': 'pl', 'salary_max': 9000})
+        self.assertEqual(job.currency, 'PLN')
+        self.assertEqual(Job.from_api(job.to_dict()).country, 'pl')
+        self.assertEqual(Job.from_api({'id': '2'}).currency, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
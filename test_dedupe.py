@@ -0,0 +1,123 @@
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+
+from adzuna.dedupe import Deduplicator, shingle_hashes, signature, similarity
+from adzuna.job_store import UNIQUE_ONLY, JobStore
+from test_support import make_result
+
+rng = random.Random(7)
+VOCABULARY = [f"word{i}" for i in range(3000)]
+
+
+def description(words=80):
+    return ' '.join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def repost(text, edits=2):
+    words = text.split()
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+    return ' '.join(words)
+
+
+class TestMinHash(unittest.TestCase):
+    """Test cases for shingling and signatures."""
+
+    def sig(self, text):
+        return signature(shingle_hashes(text))
+
+    def test_similar_texts_score_high(self):
+        """Test a lightly edited repost scores near its true similarity."""
+        text = description()
+        self.assertEqual(similarity(self.sig(text), self.sig(text)), 1.0)
+        self.assertGreater(similarity(self.sig(text), self.sig(repost(text))), 0.6)
+        self.assertLess(similarity(self.sig(text), self.sig(description())), 0.2)
+
+    def test_signatures_are_stable(self):
+        """Test signatures don't depend on the process hash seed."""
+        self.assertEqual(list(self.sig('Senior Python Developer')),
+                         list(self.sig('senior python developer')))
+        self.assertIsNone(self.sig(''))
+
+
+class TestDeduplicator(unittest.TestCase):
+    """Test cases for flagging reposts in the job store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'jobs.db')
+        self.original = description()
+        self.other = description()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_incremental_on_upsert(self):
+        """Test reposts stored later link to the first posting seen."""
+        store = JobStore(self.path, dedupe=True)
+        store.upsert_jobs([
+            make_result(1, title='Python Developer', description=self.original),
+            make_result(2, title='Data Engineer', description=self.other),
+        ])
+        store.upsert_jobs([
+            make_result(3, title='Senior Python Developer', description=repost(self.original)),
+            make_result(4, title='Python Developer (Remote)', description=repost(self.original)),
+        ])
+        self.assertEqual(store.duplicates_of('1'), ['3', '4'])
+        self.assertEqual(store.count(UNIQUE_ONLY), 2)
+        # A re-fetched posting keeps its verdict
+        store.upsert_jobs([make_result(1, title='Python Developer', description=self.original)])
+        self.assertEqual(store.duplicate_ids(['1', '3']), {'3'})
+        store.close()
+
+    def test_backlog_and_rebuild(self):
+        """Test the backlog pass covers jobs stored without dedupe, in order."""
+        store = JobStore(self.path)
+        jobs = [make_result(i, title='Developer', description=repost(self.original, 3))
+                for i in range(10, 13)]
+        store.upsert_jobs(jobs + [make_result(13, title='Engineer', description=self.other)])
+        result = Deduplicator(store).backlog(batch_size=2)
+        self.assertEqual(result.checked, 4)
+        self.assertEqual({d: c for d, (c, _) in result.duplicates.items()}, {'11': '10', '12': '10'})
+        self.assertEqual(Deduplicator(store).backlog().checked, 0)
+
+        store.reset_dedupe()
+        self.assertEqual(store.count(UNIQUE_ONLY), 4)
+        self.assertEqual(Deduplicator(store, threshold=1.01).backlog().duplicates, {})
+        store.close()
+
+    def test_concurrent_upserts_keep_one_canonical(self):
+        """Test reposts stored from several threads at once link to a single posting."""
+        store = JobStore(self.path, dedupe=True)
+        jobs = [make_result(i, title='Python Developer', description=repost(self.original))
+                for i in range(8)]
+        barrier = threading.Barrier(len(jobs))
+        bucket_members = store.bucket_members
+
+        def slow_bucket_members(buckets):
+            # Widen the gap between reading the buckets and saving the verdict
+            members = bucket_members(buckets)
+            time.sleep(0.01)
+            return members
+
+        store.bucket_members = slow_bucket_members
+
+        def upsert(posting):
+            barrier.wait()
+            store.upsert_jobs([posting])
+
+        threads = [threading.Thread(target=upsert, args=(posting,)) for posting in jobs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(store.count(UNIQUE_ONLY), 1)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
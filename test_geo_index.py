@@ -0,0 +1,94 @@
+import unittest
+
+from adzuna.geo_index import GeoIndex, haversine_km, parse_box, to_km
+from adzuna.table_model import JobTableModel
+from test_support import make_job
+
+
+class TestGeoIndex(unittest.TestCase):
+    """Test cases for the grid index behind area filters."""
+
+    def setUp(self):
+        self.jobs = [
+            make_job(0, location='London', latitude=51.5074, longitude=-0.1278,
+                     salary=60000, created='2024-03-01T10:00:00Z'),
+            make_job(1, location='Croydon', latitude=51.3762, longitude=-0.0982,
+                     salary=45000, created='2024-02-01T10:00:00Z'),
+            make_job(2, location='Reading', latitude=51.4543, longitude=-0.9781,
+                     salary=50000, created='2024-03-02T10:00:00Z'),
+            make_job(3, location='Manchester', latitude=53.4808, longitude=-2.2426,
+                     salary=55000, created='2024-03-03T10:00:00Z'),
+            make_job(4, location='London', latitude=51.5155, longitude=-0.0922,
+                     created='2024-03-04T10:00:00Z'),
+            make_job(5, location='Remote', salary=70000),
+        ]
+        self.index = GeoIndex(self.jobs)
+
+    def brute_force(self, lat, lon, km):
+        return [i for i, job in enumerate(self.jobs) if job.latitude is not None
+                and haversine_km(lat, lon, job.latitude, job.longitude) <= km]
+
+    def test_haversine_and_units(self):
+        """Test distances and mile conversion."""
+        self.assertAlmostEqual(haversine_km(51.5074, -0.1278, 53.4808, -2.2426), 262, delta=2)
+        self.assertAlmostEqual(to_km(10), 16.09344)
+        with self.assertRaises(ValueError):
+            to_km(10, 'ft')
+
+    def test_within_radius_matches_brute_force(self):
+        """Test radius queries agree with checking every job, whole cells included."""
+        for km in (1, 16, 70, 300, 25000):
+            self.assertEqual(self.index.within_radius(51.5074, -0.1278, km),
+                             self.brute_force(51.5074, -0.1278, km))
+        self.assertEqual(self.index.within_radius(51.5074, -0.1278, 16), [0, 1, 4])
+
+    def test_within_box(self):
+        """Test bounding boxes, including one across the antimeridian."""
+        self.assertEqual(self.index.within_box(*parse_box('51,-1,52,0')), [0, 1, 2, 4])
+        pacific = GeoIndex([
+            make_job(0, location='Fiji', latitude=-17.7, longitude=178.0),
+            make_job(1, location='Samoa', latitude=-13.8, longitude=-172.1),
+            make_job(2, location='Perth', latitude=-31.9, longitude=115.9),
+        ])
+        self.assertEqual(pacific.within_box(-20, 170, -10, -170), [0, 1])
+        with self.assertRaises(ValueError):
+            parse_box('52,0,51,1')
+
+    def test_locate(self):
+        """Test centres come from coordinates or places among the loaded jobs."""
+        self.assertEqual(self.index.locate('53.5, -2.2'), (53.5, -2.2))
+        lat, lon = self.index.locate('london')
+        self.assertAlmostEqual(lat, (51.5074 + 51.5155) / 2)
+        self.assertEqual(self.index.locate('Manchester'), (53.4808, -2.2426))
+        with self.assertRaises(ValueError):
+            self.index.locate('Atlantis')
+        with self.assertRaises(ValueError):
+            self.index.locate('95,0')
+
+    def test_model_combines_area_salary_and_date(self):
+        """Test the table model ANDs the area, salary and date filters."""
+        model = JobTableModel(self.jobs, geo_index=GeoIndex())
+        model.filter_by_area(radius=(51.5074, -0.1278, to_km(50)))
+        self.assertEqual([job.id for job in model], ['0', '1', '2', '4'])
+
+        model.filter_by_salary(48000, None)
+        self.assertEqual([job.id for job in model], ['0', '2'])
+
+        model.sort('Salary', reverse=True)
+        self.assertEqual([job.id for job in model], ['0', '2'])
+
+        model.filter_by_salary()
+        model.sort('Date')
+        model.filter_by_date(1709251200, None)  # 2024-03-01
+        self.assertEqual([job.id for job in model], ['0', '2', '4'])
+
+        model.filter_by_area(box=(53, -3, 54, -2))
+        model.filter_by_date(None, None)
+        self.assertEqual([job.id for job in model], ['3'])
+
+        model.filter_by_area()
+        self.assertEqual(len(model), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
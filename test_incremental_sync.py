@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from adzuna.incremental_sync import sync_search
+from adzuna.job_store import JobStore
+from test_support import make_result
+
+
+class FakeClient:
+    """Serves newest-first pages from a list of jobs."""
+
+    def __init__(self, jobs, per_page=2):
+        self.jobs = jobs
+        self.per_page = per_page
+        self.fetch_page = MagicMock(side_effect=self._page)
+
+    def _page(self, what, where, page, results_per_page, country, filters, use_cache,
+              cancel_event=None):
+        ordered = sorted(self.jobs, key=lambda j: j['created'], reverse=True)
+        start = (page - 1) * self.per_page
+        return {'count': len(ordered), 'results': ordered[start:start + self.per_page]}
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Test cases for incremental sync."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = JobStore(os.path.join(self.tmp.name, 'jobs.db'))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_second_run_stops_at_high_water_mark(self):
+        """Test a re-run only pulls postings newer than the last run."""
+        jobs = [make_result(i, created=f'2024-01-{i + 1:02d}T00:00:00Z') for i in range(6)]
+        client = FakeClient(jobs)
+
+        first = sync_search(client, self.store, results_per_page=2)
+        self.assertEqual(len(first.new_jobs), 6)
+        self.assertEqual(first.pages_fetched, 4)
+
+        client.jobs = jobs + [make_result(10, created='2024-01-20T00:00:00Z')]
+        client.fetch_page.reset_mock()
+        second = sync_search(client, self.store, results_per_page=2)
+
+        self.assertEqual([job['id'] for job in second.new_jobs], ['10'])
+        self.assertTrue(second.reached_known)
+        # Page 1 ends on the posting at the mark; page 2 is older and stops the walk
+        self.assertEqual(second.pages_fetched, 2)
+        filters = client.fetch_page.call_args[0][5]
+        self.assertEqual(filters['sort_by'], 'date')
+        self.assertIn('max_days_old', filters)
+
+    def test_ties_at_mark_are_not_repeated(self):
+        """Test postings stamped exactly at the mark are not reported twice."""
+        jobs = [make_result(i, created='2024-01-05T00:00:00Z') for i in (1, 2)]
+        client = FakeClient(jobs, per_page=50)
+        sync_search(client, self.store)
+
+        result = sync_search(client, self.store)
+
+        self.assertEqual(result.new_jobs, [])
+        self.assertEqual(self.store.count(), 2)
+
+    def test_capped_run_resumes_down_to_mark(self):
+        """Test postings skipped by max_results are fetched by the next sync."""
+        jobs = [make_result(i, created=f'2024-01-{i + 1:02d}T00:00:00Z') for i in range(3)]
+        client = FakeClient(jobs)
+        sync_search(client, self.store, results_per_page=2)
+
+        client.jobs = jobs + [make_result(i, created=f'2024-01-{i + 1:02d}T00:00:00Z')
+                              for i in range(10, 15)]
+        capped = sync_search(client, self.store, max_results=2, results_per_page=2)
+        self.assertEqual([job['id'] for job in capped.new_jobs], ['14', '13'])
+        self.assertFalse(capped.complete)
+
+        rest = sync_search(client, self.store, results_per_page=2)
+        self.assertEqual([job['id'] for job in rest.new_jobs], ['12', '11', '10'])
+        self.assertTrue(rest.complete)
+        self.assertEqual(sync_search(client, self.store, results_per_page=2).new_jobs, [])
+
+    def test_cancelled_run_keeps_mark(self):
+        """Test a cancelled sync leaves the mark for the next run."""
+        jobs = [make_result(1, created='2024-01-01T00:00:00Z')]
+        client = FakeClient(jobs)
+        sync_search(client, self.store)
+        client.jobs = jobs + [make_result(2, created='2024-01-02T00:00:00Z')]
+        cancel = MagicMock()
+        cancel.is_set.return_value = True
+        result = sync_search(client, self.store, cancel_event=cancel)
+        self.assertFalse(result.complete)
+        self.assertEqual([job['id'] for job in sync_search(client, self.store).new_jobs], ['2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
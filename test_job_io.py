@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from adzuna import job_io
+from test_support import make_result
+
+
+def make_jobs(n):
+    return [make_result(i, title=f'Dev "{i}", senior', company='Acme', salary=1000.5 * i,
+                        created='2024-01-02T03:04:05Z') for i in range(n)]
+
+
+class TestJobIO(unittest.TestCase):
+    """Test cases for streaming export and import."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_json_matches_json_dump(self):
+        """Test streamed JSON is byte-identical to the old json.dump output."""
+        jobs = make_jobs(3)
+        job_io.write_json(iter(jobs), self.path('jobs.json'))
+
+        with open(self.path('jobs.json'), encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(jobs, ensure_ascii=False, indent=4))
+
+    def test_round_trip_all_formats(self):
+        """Test every JSON format reads back what was written."""
+        jobs = make_jobs(25)
+        for name in ('a.json', 'a.json.gz', 'a.ndjson', 'a.jsonl.gz'):
+            with self.subTest(name=name):
+                self.assertEqual(job_io.export_jobs(jobs, self.path(name)), 25)
+                self.assertEqual(list(job_io.iter_jobs(self.path(name))), jobs)
+
+    @patch('adzuna.job_io.READ_CHUNK', 5)
+    def test_incremental_reader_handles_small_chunks(self):
+        """Test array elements split across read chunks decode correctly."""
+        data = make_jobs(10) + [12345, 'a,]b', None]
+        with open(self.path('a.json'), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        self.assertEqual(list(job_io.iter_jobs(self.path('a.json'))), data)
+
+    def test_reads_adzuna_response_object(self):
+        """Test a saved API response yields its results list."""
+        with open(self.path('resp.json'), 'w', encoding='utf-8') as f:
+            json.dump({'count': 2, 'results': make_jobs(2)}, f)
+
+        self.assertEqual(len(list(job_io.iter_jobs(self.path('resp.json')))), 2)
+
+    def test_csv_projects_columns(self):
+        """Test CSV export only carries the requested columns."""
+        job_io.export_jobs(make_jobs(2), self.path('a.csv'), columns=('Title', 'Salary Max'))
+
+        with open(self.path('a.csv'), encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], 'Title,Salary Max')
+        self.assertEqual(lines[2], '"Dev ""1"", senior",1000.5')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from adzuna.job_record import Job, as_dict, as_job, parse_created, parse_results
+
+RESULT = {
+    'id': '4123',
+    'title': 'Python Developer',
+    'description': 'Build things',
+    'created': '2024-03-05T10:00:00Z',
+    'redirect_url': 'https://example.com/4123',
+    'salary_min': 40000,
+    'salary_max': '55000',
+    'salary_is_predicted': '1',
+    'contract_type': 'permanent',
+    'company': {'display_name': 'Acme Ltd'},
+    'location': {'display_name': 'Leeds', 'area': ['UK', 'England', 'Leeds']},
+    'category': {'label': 'IT Jobs', 'tag': 'it-jobs'},
+}
+
+
+class TestJob(unittest.TestCase):
+    """Test cases for the compact job record."""
+
+    def test_from_api_flattens_nested_fields(self):
+        """Test nested names, numbers and dates are parsed once."""
+        job = Job.from_api(RESULT)
+        self.assertEqual(job.id, '4123')
+        self.assertEqual(job.company, 'Acme Ltd')
+        self.assertEqual(job.location, 'Leeds')
+        self.assertEqual(job.area, ('UK', 'England', 'Leeds'))
+        self.assertEqual(job.category_tag, 'it-jobs')
+        self.assertEqual(job.salary_max, 55000.0)
+        self.assertTrue(job.salary_is_predicted)
+        self.assertEqual(job.created, parse_created('2024-03-05T10:00:00Z'))
+        self.assertEqual(job.created_date, '2024-03-05')
+
+    def test_missing_fields(self):
+        """Test sparse or malformed results still parse."""
+        job = Job.from_api({'redirect_url': 'https://example.com/x', 'created': 'not a date',
+                            'salary_max': 'n/a'})
+        self.assertEqual(job.id, 'https://example.com/x')
+        self.assertIsNone(job.created)
+        self.assertEqual(job.created_date, '')
+        self.assertIsNone(job.salary_max)
+        self.assertIsNone(job.company)
+
+    def test_repeated_strings_are_shared(self):
+        """Test company names from separate payloads end up as one object."""
+        a, b = parse_results([{'company': {'display_name': ''.join(['Ac', 'me'])}},
+                              {'company': {'display_name': ''.join(['Acm', 'e'])}}])
+        self.assertIs(a.company, b.company)
+
+    def test_round_trip(self):
+        """Test to_dict reproduces the fields Job keeps."""
+        job = Job.from_api(RESULT)
+        again = Job.from_api(job.to_dict())
+        for name in Job.__slots__[:-1]:
+            self.assertEqual(getattr(again, name), getattr(job, name), name)
+
+    def test_raw_kept_on_request(self):
+        """Test keep_raw preserves the original payload."""
+        self.assertIs(Job.from_api(RESULT, keep_raw=True).raw, RESULT)
+        self.assertNotIn('__CLASS__', Job.from_api(dict(RESULT, __CLASS__='x')).raw)
+
+    def test_as_job_and_as_dict(self):
+        """Test the helpers accept either representation."""
+        job = as_job(RESULT)
+        self.assertIsInstance(job, Job)
+        self.assertIs(as_job(job), job)
+        self.assertIs(as_dict(RESULT), RESULT)
+        self.assertEqual(as_dict(job)['company'], {'display_name': 'Acme Ltd'})
+
+
+if __name__ == '__main__':
+    unittest.main()
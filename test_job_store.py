@@ -0,0 +1,72 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from adzuna.job_store import JobStore
+from test_support import make_result
+
+
+class TestJobStore(unittest.TestCase):
+    """Test cases for the SQLite job store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = JobStore(os.path.join(self.tmp.name, 'jobs.db'))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_upsert_dedupes_by_id(self):
+        """Test re-fetched jobs update in place and keep first_seen."""
+        self.store.upsert_jobs([make_result(i) for i in range(10)])
+        first = self.store.get_seen(['3'])['3']
+
+        self.store.upsert_jobs([make_result(3, title='Renamed')])
+
+        self.assertEqual(self.store.count(), 10)
+        seen = self.store.get_seen(['3'])['3']
+        self.assertEqual(seen[0], first[0])
+        self.assertGreaterEqual(seen[1], first[1])
+        titles = [job['title'] for job in self.store.query(limit=100)]
+        self.assertIn('Renamed', titles)
+
+    def test_query_pages_in_order(self):
+        """Test paged queries honour the requested sort order."""
+        self.store.upsert_jobs([make_result(i, salary=1000 * i) for i in range(50)])
+
+        page = self.store.query(offset=10, limit=5, order_by='salary_max', descending=False)
+
+        self.assertEqual([job['id'] for job in page], ['10', '11', '12', '13', '14'])
+
+    def test_view_is_a_lazy_sequence(self):
+        """Test StoreView indexes across page boundaries."""
+        self.store.upsert_jobs([make_result(i, salary=1000 * i) for i in range(450)])
+        view = self.store.view(order_by='salary_max', descending=False)
+
+        self.assertEqual(len(view), 450)
+        self.assertEqual(view[0].id, '0')
+        self.assertEqual(view[449].id, '449')
+        self.assertEqual(view[-1].id, '449')
+        with self.assertRaises(IndexError):
+            view[450]
+
+    def test_older_database_gains_country_column(self):
+        """Test opening a database without the country column migrates it."""
+        path = os.path.join(self.tmp.name, 'old.db')
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE jobs (id TEXT PRIMARY KEY, title TEXT, company TEXT, "
+                     "location TEXT, contract_type TEXT, salary_min REAL, salary_max REAL, "
+                     "created TEXT, redirect_url TEXT, raw TEXT NOT NULL, "
+                     "first_seen REAL NOT NULL, last_seen REAL NOT NULL)")
+        conn.close()
+
+        store = JobStore(path)
+        store.upsert_jobs([make_result(1, country='de')])
+        self.assertEqual(store.count("country = ?", ('de',)), 1)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import unittest
+
+from adzuna import json_codec
+from adzuna.job_record import parse_results
+
+RESULTS = [
+    {'id': 4000000001, 'title': 'Python Developer', 'description': 'Django, APIs — remote',
+     'created': '2024-03-01T10:00:00Z', 'redirect_url': 'https://example.com/1',
+     'salary_min': 50000, 'salary_max': 60000.5, 'salary_is_predicted': '1',
+     'contract_type': 'permanent', 'company': {'display_name': 'Acme', '__CLASS__': 'Company'},
+     'location': {'display_name': 'London', 'area': ['UK', 'London']},
+     'category': {'label': 'IT Jobs', 'tag': 'it-jobs'}, 'latitude': 51.5, 'longitude': -0.12,
+     'adref': 'eyJhbGciOi'},
+    {'id': '2', 'title': 'Data Engineer', 'created': None, 'company': None,
+     'location': {'display_name': 'Leeds', 'area': None}},
+    {'redirect_url': 'https://example.com/3'},
+]
+
+
+class TestJsonCodec(unittest.TestCase):
+    """Test cases for the pluggable JSON backends."""
+
+    def setUp(self):
+        self.body = json.dumps({'count': 3, 'results': RESULTS}).encode('utf-8')
+
+    def tearDown(self):
+        json_codec.set_backend()
+
+    def test_backends_agree(self):
+        """Test every installed backend decodes and encodes like stdlib json."""
+        data = {'title': 'Développeur £', 'salary': 55000.5, 'tags': [1, None, True]}
+        for backend in json_codec.available_backends():
+            with self.subTest(backend=backend):
+                json_codec.set_backend(backend)
+                self.assertEqual(json_codec.loads(self.body), json.loads(self.body))
+                self.assertEqual(json_codec.loads(self.body.decode('utf-8')), json.loads(self.body))
+                self.assertEqual(json.loads(json_codec.dumps(data)), data)
+                self.assertIn('£', json_codec.dumps(data))
+                with self.assertRaises(ValueError):
+                    json_codec.loads(b'{"results": [')
+
+    def test_decode_jobs_matches_parse_results(self):
+        """Test decode_jobs builds the same Jobs as decoding then parsing."""
+        expected = parse_results([dict(result, country='us')
+                                  for result in json.loads(self.body)['results']])
+        for backend in json_codec.available_backends():
+            with self.subTest(backend=backend):
+                json_codec.set_backend(backend)
+                jobs = json_codec.decode_jobs(self.body, country='us')
+                self.assertEqual([job.to_dict() for job in jobs],
+                                 [job.to_dict() for job in expected])
+
+    def test_decode_jobs_tolerates_non_object_fields(self):
+        """Test a result whose company/location/category aren't objects still decodes."""
+        body = json.dumps({'count': 2, 'results': [
+            {'id': '1', 'company': 'Acme', 'location': 'London', 'category': 'IT Jobs'},
+            RESULTS[1],
+        ]})
+        for backend in json_codec.available_backends():
+            with self.subTest(backend=backend):
+                json_codec.set_backend(backend)
+                odd, normal = json_codec.decode_jobs(body)
+                self.assertEqual((odd.id, odd.company, odd.location, odd.area, odd.category),
+                                 ('1', None, None, (), None))
+                self.assertEqual(normal.location, 'Leeds')
+
+    def test_unknown_backend(self):
+        """Test asking for a backend that doesn't exist fails clearly."""
+        with self.assertRaises(ValueError):
+            json_codec.set_backend('simplejson')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+from unittest.mock import patch, MagicMock
+
+from adzuna.client import AdzunaClient
+from adzuna.metrics import METRICS, Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for counters, stage timers and exports."""
+
+    def test_disabled_records_nothing(self):
+        """Test a disabled registry ignores counters and timers."""
+        metrics = Metrics()
+        metrics.incr('api_requests_total')
+        with metrics.timer('decode'):
+            pass
+        self.assertEqual(metrics.counter('api_requests_total'), 0)
+        self.assertEqual(metrics.stage('decode'), (0, 0.0))
+
+    def test_counters_with_labels(self):
+        """Test labelled counters are kept apart and summed without labels."""
+        metrics = Metrics(enabled=True)
+        metrics.incr('api_responses_total', status=200)
+        metrics.incr('api_responses_total', status=200)
+        metrics.incr('api_responses_total', status=429)
+        self.assertEqual(metrics.counter('api_responses_total', status=200), 2)
+        self.assertEqual(metrics.counter('api_responses_total'), 3)
+
+    def test_prometheus_histogram(self):
+        """Test histogram buckets are cumulative in the Prometheus text."""
+        metrics = Metrics(enabled=True, buckets=(0.01, 0.1))
+        metrics.observe('stage_seconds', 0.005, stage='decode')
+        metrics.observe('stage_seconds', 0.05, stage='decode')
+        metrics.observe('stage_seconds', 5.0, stage='decode')
+        text = metrics.to_prometheus()
+        self.assertIn('# TYPE adzuna_stage_seconds histogram', text)
+        self.assertIn('adzuna_stage_seconds_bucket{stage="decode",le="0.01"} 1', text)
+        self.assertIn('adzuna_stage_seconds_bucket{stage="decode",le="0.1"} 2', text)
+        self.assertIn('adzuna_stage_seconds_bucket{stage="decode",le="+Inf"} 3', text)
+        self.assertIn('adzuna_stage_seconds_count{stage="decode"} 3', text)
+
+    def test_write_by_extension(self):
+        """Test .prom files get Prometheus text and others JSON."""
+        metrics = Metrics(enabled=True)
+        metrics.incr('cache_hits_total')
+        with tempfile.TemporaryDirectory() as tmp:
+            prom, js = os.path.join(tmp, 'm.prom'), os.path.join(tmp, 'm.json')
+            metrics.write(prom)
+            metrics.write(js)
+            with open(prom, encoding='utf-8') as f:
+                self.assertIn('adzuna_cache_hits_total 1', f.read())
+            with open(js, encoding='utf-8') as f:
+                self.assertEqual(json.load(f)['counters'][0]['value'], 1)
+            self.assertEqual(sorted(os.listdir(tmp)), ['m.json', 'm.prom'])
+
+
+class TestClientInstrumentation(unittest.TestCase):
+    """Test cases for metrics recorded by the API client."""
+
+    def setUp(self):
+        METRICS.reset()
+        METRICS.enable()
+
+    def tearDown(self):
+        METRICS.disable()
+        METRICS.reset()
+
+    @patch('requests.Session.get')
+    def test_requests_retries_and_stages(self, mock_get):
+        """Test a retried request counts twice and times every stage."""
+        failed = MagicMock(status_code=500, elapsed=timedelta(milliseconds=1))
+        ok = MagicMock(status_code=200, elapsed=timedelta(milliseconds=1))
+        ok.json.return_value = {'count': 1, 'results': [{'id': '1'}]}
+        mock_get.side_effect = [failed, ok]
+
+        client = AdzunaClient('id', 'key', backoff=0)
+        client.get_json('https://api.adzuna.com/v1/api/jobs/gb/search/1')
+
+        self.assertEqual(METRICS.counter('api_requests_total'), 2)
+        self.assertEqual(METRICS.counter('api_retries_total'), 1)
+        self.assertEqual(METRICS.counter('api_responses_total', status=500), 1)
+        for stage in ('http_wait', 'http_transfer'):
+            self.assertEqual(METRICS.stage(stage)[0], 2)
+        self.assertEqual(METRICS.stage('decode')[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import gzip
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+from adzuna import client as adzuna_client
+from adzuna.response_cache import ResponseCache, cache_key
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the on-disk response cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self.tmp.name, ttl=60)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_is_normalized(self):
+        """Test case and whitespace differences map to the same key."""
+        self.assertEqual(cache_key('gb', 'Python  Dev', 'London', 1),
+                         cache_key('GB', 'python dev', ' london ', 1))
+        self.assertNotEqual(cache_key('gb', 'python', 'London', 1),
+                            cache_key('gb', 'python', 'London', 2))
+
+    def test_round_trip_and_counters(self):
+        """Test a stored response is served back and counted as a hit."""
+        key = cache_key('gb', 'python', 'UK', 1)
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, {'count': 1, 'results': [{'title': 'Dev'}]})
+
+        self.assertEqual(self.cache.get(key)['results'][0]['title'], 'Dev')
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_expired_entries_miss(self):
+        """Test entries older than the TTL are not served."""
+        key = cache_key('gb', 'python', 'UK', 1)
+        self.cache.put(key, {'results': []})
+        with patch('time.time', return_value=time.time() + 120):
+            self.assertIsNone(self.cache.get(key))
+
+    def test_foreign_entries_are_dropped(self):
+        """Test an entry that is not a gzipped JSON object is removed and missed."""
+        for body in (b'[1, 2]', b'"data"', b'not json'):
+            with self.subTest(body=body):
+                key = cache_key('gb', 'python', 'UK', 1)
+                self.cache.put(key, {'results': []})
+                path = self.cache._path(key)
+                with gzip.open(path, 'wb') as f:
+                    f.write(body)
+
+                self.assertIsNone(self.cache.get(key))
+                self.assertFalse(os.path.exists(path))
+
+    def test_evicts_least_recently_used(self):
+        """Test eviction removes the oldest-used entries first."""
+        keys = [cache_key('gb', f'term {i}', 'UK', 1) for i in range(3)]
+        for i, key in enumerate(keys):
+            self.cache.put(key, {'results': ['x' * 2000]})
+            path = self.cache._path(key)
+            os.utime(path, (1000 + i, 1000 + i))
+
+        self.cache.max_bytes = self.cache.size_bytes() - 1
+        self.cache.evict()
+
+        self.assertIsNone(self.cache.get(keys[0]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+
+    @patch('requests.Session.get')
+    def test_client_serves_hits_and_bypasses(self, mock_get):
+        """Test the client reads through the cache unless bypassed."""
+        response = MagicMock()
+        response.json.return_value = {'count': 1, 'results': [{'title': 'Dev'}]}
+        mock_get.return_value = response
+        client = adzuna_client.AdzunaClient('id', 'key', cache=self.cache)
+
+        client.search('python', 'UK')
+        client.search('python', 'UK')
+        self.assertEqual(mock_get.call_count, 1)
+
+        client.search('python', 'UK', use_cache=False)
+        self.assertEqual(mock_get.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+
+from adzuna.job_record import Job
+from adzuna.skills import SkillExtractor, SkillMatcher, enrich, iter_enriched, load_skills, parse_skills
+
+
+class TestSkillMatcher(unittest.TestCase):
+    """Test cases for the token-level Aho-Corasick matcher."""
+
+    def setUp(self):
+        self.matcher = SkillMatcher(parse_skills([
+            'Java', 'JavaScript: js', 'C++', 'C#', '.NET', 'Machine learning: ml',
+            'Learning management', 'Google Cloud Platform: gcp', 'Cloud',
+        ]))
+
+    def names(self, text):
+        return [self.matcher.names[i] for i in self.matcher.find(text)]
+
+    def test_whole_tokens_only(self):
+        """Test skills match whole tokens, casefolded, not inside other words."""
+        self.assertEqual(self.names('JavaScript, not JAVA. Javanese'), ['JavaScript', 'Java'])
+        self.assertEqual(self.names('C++ and C# on .NET'), ['C++', 'C#', '.NET'])
+
+    def test_phrases_and_overlaps(self):
+        """Test multi-word skills, overlapping phrases and nested matches."""
+        self.assertEqual(self.names('machine learning management'),
+                         ['Machine learning', 'Learning management'])
+        self.assertEqual(self.names('Google Cloud Platform'), ['Cloud', 'Google Cloud Platform'])
+        self.assertEqual(self.names('google cloud storage'), ['Cloud'])
+
+    def test_aliases_map_to_name(self):
+        """Test an alias reports its canonical skill once, in first-seen order."""
+        self.assertEqual(self.names('ML, js and machine learning'), ['Machine learning', 'JavaScript'])
+
+
+class TestSkillExtractor(unittest.TestCase):
+    """Test cases for scoring and enrichment."""
+
+    def setUp(self):
+        self.extractor = SkillExtractor()
+
+    def test_title_and_focus_raise_score(self):
+        """Test skills in the title and in the search weigh more."""
+        _, body_only = self.extractor.extract('Engineer', 'Python and Docker')
+        skills, in_title = self.extractor.extract('Python Engineer', 'Python and Docker')
+        self.assertEqual(skills, ('Python', 'Docker'))
+        self.assertGreater(in_title, body_only)
+        self.extractor.focus_on('docker')
+        self.assertGreater(self.extractor.extract('Engineer', 'Python and Docker')[1], body_only)
+        self.assertEqual(self.extractor.extract('Chef', 'Kitchen brigade'), ((), 0))
+
+    def test_enrich_round_trips(self):
+        """Test enriched jobs keep skills and score through to_dict."""
+        job = enrich([Job(id='1', title='Data Engineer', description='Spark, Kafka and SQL')])[0]
+        self.assertEqual(job.skills, ('Spark', 'Kafka', 'SQL'))
+        again = Job.from_api(job.to_dict())
+        self.assertEqual((again.skills, again.score), (job.skills, job.score))
+
+    def test_process_pool_keeps_order(self):
+        """Test the pooled stream yields every job, in order, with the in-process results."""
+        jobs = [{'id': str(i), 'title': 'Dev', 'description': 'Rust' if i % 2 else 'Go lang Redis'}
+                for i in range(25)]
+        pooled = list(iter_enriched(jobs, self.extractor, workers=2, chunk_size=4))
+        self.assertEqual([job.id for job in pooled], [str(i) for i in range(25)])
+        for job in pooled:
+            self.assertEqual((job.skills, job.score), self.extractor.extract(job.title, job.description))
+
+    def test_load_skills_file(self):
+        """Test a custom dictionary file replaces the built-in skills."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'skills.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('# ours\nCOBOL\nMainframe: z/os, ibm z\n')
+            self.assertEqual(load_skills(path), [('COBOL', ()), ('Mainframe', ('z/os', 'ibm z'))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+
+from adzuna.stats import MarketStats
+from adzuna.table_model import parse_day
+from test_support import make_job
+
+
+class TestMarketStats(unittest.TestCase):
+    """Test cases for the vectorized statistics engine."""
+
+    def setUp(self):
+        self.jobs = [
+            make_job(0, created='2024-03-04T01:00:00Z', salary=30000, company='Acme',
+                     location='London', country='gb'),
+            make_job(1, created='2024-03-06T01:00:00Z', salary=50000, company='Acme',
+                     location='London', country='gb'),
+            make_job(2, created='2024-03-12T01:00:00Z', salary=70000, company='Beta',
+                     location='Leeds', country='gb'),
+            make_job(3, created='2024-03-13T01:00:00Z', company='Acme',
+                     location='Leeds', country='gb'),
+            make_job(4, salary=90000, location='London', country='gb'),
+            make_job(5, created='2024-03-05T01:00:00Z', salary=100000, company='Acme',
+                     location='New York', country='us'),
+        ]
+        self.stats = MarketStats(self.jobs)
+
+    def test_extend_grows_past_capacity(self):
+        """Test columns keep every job when extended page by page."""
+        stats = MarketStats()
+        for start in range(0, 3000, 50):
+            stats.extend(make_job(i, salary=float(i)) for i in range(start, start + 50))
+        self.assertEqual(len(stats), 3000)
+        np.testing.assert_array_equal(stats.column('salary_max'), np.arange(3000.0))
+
+    def test_percentiles_per_country(self):
+        """Test percentiles ignore missing salaries and other countries."""
+        self.assertEqual(self.stats.percentiles((0, 50, 100), country='gb'),
+                         {0: 30000.0, 50: 60000.0, 100: 90000.0})
+        self.assertEqual(self.stats.percentiles(country='de'), {})
+
+    def test_group_counts_and_medians(self):
+        """Test groups are ordered by size with medians of known salaries."""
+        self.assertEqual(self.stats.group('company', country='gb'),
+                         [('Acme', 3, 2, 40000.0), ('Beta', 1, 1, 70000.0)])
+        self.assertEqual(self.stats.group('location', top=1), [('London', 3, 3, 50000.0)])
+
+    def test_time_series(self):
+        """Test weekly buckets start on Monday and skip undated jobs."""
+        self.assertEqual(self.stats.time_series('week', country='gb'),
+                         [('2024-03-04', 2, 40000.0), ('2024-03-11', 2, 70000.0)])
+        self.assertEqual(self.stats.time_series('month'), [('2024-03-01', 5, 60000.0)])
+        with self.assertRaises(ValueError):
+            self.stats.time_series('year')
+
+    def test_date_range(self):
+        """Test start/end narrow the selection like the table's date filter."""
+        start, end = parse_day('2024-03-05'), parse_day('2024-03-12', end=True)
+        self.assertEqual(len(self.stats.salaries(start=start, end=end)), 3)
+
+    def test_report_and_clear(self):
+        """Test the text report and that clear() empties every column."""
+        report = self.stats.report()
+        self.assertIn('Total Jobs Loaded: 6 (5 with salary)', report)
+        self.assertIn('Top companies:', report)
+        self.stats.clear()
+        self.assertEqual(self.stats.report(), 'No jobs loaded')
+        self.assertEqual(len(self.stats.column('company')), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
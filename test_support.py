@@ -0,0 +1,27 @@
+"""Shared test fixtures: Adzuna search results and the Job records built from them."""
+
+from adzuna.job_record import Job
+
+
+def make_result(i, **fields):
+    """Search result dict for job i, shaped like the Adzuna API's.
+
+    fields are result keys and override the defaults (id, title). As
+    shorthands, company and location may be plain names, area goes into
+    the location object and salary sets salary_max.
+    """
+    result = {'id': str(i), 'title': f'Job {i}'}
+    if 'salary' in fields:
+        fields['salary_max'] = fields.pop('salary')
+    for key in ('company', 'location'):
+        if isinstance(fields.get(key), str):
+            fields[key] = {'display_name': fields[key]}
+    if 'area' in fields:
+        fields['location'] = dict(fields.get('location') or {}, area=fields.pop('area'))
+    result.update(fields)
+    return result
+
+
+def make_job(i, **fields):
+    """Job record for job i; fields as for make_result."""
+    return Job.from_api(make_result(i, **fields))
@@ -0,0 +1,68 @@
+import unittest
+
+from adzuna.table_model import JobTableModel, parse_day
+from test_support import make_job
+
+
+class TestJobTableModel(unittest.TestCase):
+    """Test cases for the sort/filter engine."""
+
+    def setUp(self):
+        self.jobs = [
+            make_job(0, created='2024-03-05T10:00:00Z', salary=50000, company='beta'),
+            make_job(1, created='2024-01-10T09:00:00Z', company='Alpha'),
+            make_job(2, created='2024-02-20T12:00:00Z', salary=70000, company='gamma'),
+            make_job(3, salary=30000, company='delta'),
+        ]
+        self.model = JobTableModel(self.jobs)
+
+    def ids(self):
+        return [job.id for job in self.model]
+
+    def test_unsorted_view_is_load_order(self):
+        """Test the model shows jobs in load order until sorted."""
+        self.assertEqual(self.ids(), ['0', '1', '2', '3'])
+
+    def test_sort_and_toggle(self):
+        """Test sorting by a column and re-sorting reverses it."""
+        self.model.sort('Salary')
+        self.assertEqual(self.ids(), ['1', '3', '0', '2'])
+        self.model.sort('Salary')
+        self.assertEqual(self.ids(), ['2', '0', '3', '1'])
+
+    def test_string_sort_is_case_insensitive(self):
+        """Test text columns sort casefolded."""
+        self.model.sort('Company')
+        self.assertEqual(self.ids(), ['1', '0', '3', '2'])
+
+    def test_date_range_filter(self):
+        """Test date filtering bisects the date index and excludes undated jobs."""
+        self.model.filter_by_date(parse_day('2024-02-01'), parse_day('2024-03-05', end=True))
+        self.assertEqual(self.ids(), ['0', '2'])
+
+        self.model.sort('Salary', reverse=True)
+        self.assertEqual(self.ids(), ['2', '0'])
+
+        self.model.filter_by_date(None, None)
+        self.assertEqual(len(self.model), 4)
+
+    def test_date_range_keeps_load_order_until_sorted(self):
+        """Test a date range alone keeps load order; sorting by Date uses the date index."""
+        self.model.filter_by_date(parse_day('2024-01-01'), None)
+        self.assertEqual(self.ids(), ['0', '1', '2'])
+        self.model.sort('Date')
+        self.assertEqual(self.ids(), ['1', '2', '0'])
+        self.model.sort('Date')
+        self.assertEqual(self.ids(), ['0', '2', '1'])
+
+    def test_extend_adopts_list(self):
+        """Test appended jobs reach both the view and the adopted list."""
+        self.model.sort('Date')
+        self.model.extend([make_job(4, created='2023-12-31T00:00:00Z', company='Acme')])
+
+        self.assertEqual(len(self.jobs), 5)
+        self.assertEqual(self.ids(), ['3', '4', '1', '2', '0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from adzuna.table_model import JobTableModel, parse_day
+from adzuna.text_index import TextIndex, parse_query
+from test_support import make_job
+
+
+class TestTextIndex(unittest.TestCase):
+    """Test cases for the inverted index behind the search box."""
+
+    def setUp(self):
+        self.jobs = [
+            make_job(0, title='Senior Python Developer', company='Acme',
+                     description='Django and AWS'),
+            make_job(1, title='Java Engineer', company='Globex',
+                     description='Spring, some Python'),
+            make_job(2, title='C++ Developer', company='Initech',
+                     description='Low latency trading'),
+            make_job(3, title='Python Data Engineer', company='Acme',
+                     description='Pandas, C# a plus'),
+        ]
+        self.index = TextIndex(self.jobs)
+
+    def test_prefix_and_case(self):
+        """Test terms match token prefixes case-insensitively."""
+        self.assertEqual(self.index.search('PYTH'), [0, 1, 3])
+        self.assertEqual(self.index.search('c++'), [2])
+        self.assertEqual(self.index.search('c#'), [3])
+        self.assertEqual(self.index.search('glob'), [1])
+
+    def test_and_not(self):
+        """Test terms are ANDed and -term / NOT term exclude."""
+        self.assertEqual(self.index.search('python engineer'), [1, 3])
+        self.assertEqual(self.index.search('python AND engineer -java'), [3])
+        self.assertEqual(self.index.search('NOT acme'), [1, 2])
+        self.assertIsNone(self.index.search('  '))
+        self.assertEqual(parse_query('a -b NOT c d'), (['a', 'd'], ['b', 'c']))
+
+    def test_incremental_add(self):
+        """Test jobs added later are searchable at the next positions."""
+        self.assertEqual(self.index.search('rust'), [])
+        self.index.add([make_job(4, title='Rust Developer', company='Acme')])
+        self.assertEqual(self.index.search('rust'), [4])
+        self.assertEqual(self.index.search('developer'), [0, 2, 4])
+
+
+class TestModelTextFilter(unittest.TestCase):
+    """Test cases for text search combined with sorting and date ranges."""
+
+    def setUp(self):
+        jobs = [
+            make_job(0, title='Python Developer', created='2024-03-05T10:00:00Z', salary=50000),
+            make_job(1, title='Java Developer', created='2024-01-10T09:00:00Z', salary=90000),
+            make_job(2, title='Python Lead', created='2024-02-20T12:00:00Z', salary=70000),
+        ]
+        self.model = JobTableModel(jobs[:2], text_index=TextIndex())
+        self.model.extend(jobs[2:])
+
+    def ids(self):
+        return [job.id for job in self.model]
+
+    def test_matches_follow_sort(self):
+        """Test matches are shown in the current sort order."""
+        self.model.filter_by_text('python')
+        self.assertEqual(self.ids(), ['0', '2'])
+        self.model.sort('Salary', reverse=True)
+        self.assertEqual(self.ids(), ['2', '0'])
+        self.model.filter_by_text('')
+        self.assertEqual(self.ids(), ['1', '2', '0'])
+
+    def test_combined_with_date_range(self):
+        """Test text and date filters intersect."""
+        self.model.filter_by_text('developer')
+        self.model.filter_by_date(parse_day('2024-02-01'), None)
+        self.assertEqual(self.ids(), ['0'])
+
+    def test_reload_resets_index(self):
+        """Test load() rebuilds the index for the new jobs."""
+        self.model.load([make_job(7, title='Go Developer')])
+        self.model.filter_by_text('python')
+        self.assertEqual(self.ids(), [])
+        self.model.filter_by_text('go')
+        self.assertEqual(self.ids(), ['7'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from adzuna.batch import Query
+from adzuna.errors import AdzunaAPIError
+from adzuna.watch import DeltaLog, Watcher, WatchState, content_hash
+from test_support import make_job
+
+
+class TestWatchState(unittest.TestCase):
+    """Test cases for diffing runs of a saved search."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_new_changed_expired(self):
+        """Test each kind of delta against the previous run."""
+        state = WatchState()
+        first = state.diff('python', [make_job('1'), make_job('2'), make_job('3')])
+        self.assertEqual([(d.kind, d.job_id) for d in first], [('new', '1'), ('new', '2'), ('new', '3')])
+        second = state.diff('python', [make_job('1'), make_job('2', salary=50000), make_job('4')])
+        self.assertEqual([(d.kind, d.job_id) for d in second],
+                         [('changed', '2'), ('new', '4'), ('expired', '3')])
+        self.assertIsNone(second[-1].job)
+        self.assertEqual(state.diff('python', [make_job('1'), make_job('2', salary=50000),
+                                               make_job('4')]), [])
+
+    def test_content_hash_ignores_unhashed_fields(self):
+        """Test only visible fields change the hash."""
+        a = make_job('1', created='2024-03-01T00:00:00Z')
+        b = make_job('1', created='2024-03-02T00:00:00Z')
+        self.assertEqual(content_hash(a), content_hash(b))
+        self.assertNotEqual(content_hash(a), content_hash(make_job('1', title='Developer')))
+
+    def test_state_persists(self):
+        """Test a saved state carries over, so nothing is reported as new again."""
+        path = os.path.join(self.tmp.name, 'watch.json')
+        state = WatchState(path)
+        state.diff('python', [make_job('1')])
+        state.save()
+        restored = WatchState(path)
+        self.assertIn('python', restored)
+        self.assertEqual(restored.diff('python', [make_job('1')]), [])
+
+
+class TestWatcher(unittest.TestCase):
+    """Test cases for scheduled re-runs."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.results = [[make_job('1'), make_job('2')]]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_client(self):
+        def search(term, location, max_results, **kwargs):
+            self.assertFalse(kwargs['use_cache'])
+            result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+            if isinstance(result, Exception):
+                raise result
+            return result
+        client = MagicMock()
+        client.search.side_effect = search
+        return client
+
+    def test_baseline_then_deltas(self):
+        """Test emit_initial=False records a baseline and reports later changes only."""
+        runs = []
+        self.results = [[make_job('1'), make_job('2')], [make_job('2'), make_job('3')]]
+        watcher = Watcher(self.make_client(), [Query('python')], interval=0, jitter=0,
+                          on_deltas=runs.append, emit_initial=False)
+        self.assertEqual(watcher.run(cycles=2), 2)
+        self.assertEqual(runs[0].deltas, [])
+        self.assertEqual(runs[0].jobs, 2)
+        self.assertEqual(runs[1].counts(), {'new': 1, 'changed': 0, 'expired': 1})
+
+    def test_failed_run_keeps_state(self):
+        """Test an API error reports nothing rather than every job expiring."""
+        runs = []
+        self.results = [[make_job('1')], AdzunaAPIError('HTTP 500'), [make_job('1')]]
+        watcher = Watcher(self.make_client(), [Query('python')], interval=0, jitter=0,
+                          on_deltas=runs.append)
+        watcher.run(cycles=3)
+        self.assertEqual([len(run.deltas) for run in runs], [1, 0, 0])
+        self.assertEqual(runs[1].error, 'HTTP 500')
+
+    def test_stop_ends_run(self):
+        """Test stop() from on_deltas ends the watch after the current run."""
+        watcher = Watcher(self.make_client(), [Query('python'), Query('rust')],
+                          interval=3600, jitter=0)
+        watcher.on_deltas = lambda run: watcher.stop()
+        self.assertEqual(watcher.run(), 1)
+
+    def test_delta_log(self):
+        """Test deltas are appended as NDJSON."""
+        path = os.path.join(self.tmp.name, 'deltas.ndjson')
+        watcher = Watcher(self.make_client(), [Query('python')], interval=0, jitter=0,
+                          on_deltas=DeltaLog(path))
+        watcher.run(cycles=2)
+        with open(path, encoding='utf-8') as f:
+            events = [json.loads(line) for line in f]
+        self.assertEqual([(e['event'], e['id']) for e in events], [('new', '1'), ('new', '2')])
+        self.assertEqual(events[0]['job']['title'], 'Job 1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+"""
+Virtualized results table for large job lists.
+
+A plain ttk.Treeview keeps one item per row, so inserting or clearing
+tens of thousands of jobs stalls the UI. VirtualTable instead keeps a
+fixed pool of Treeview items - enough to fill the visible area plus a
+small overscan - and re-binds them to rows of an in-memory model as the
+user scrolls. Populating, reloading and clearing are just model swaps.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+DEFAULT_ROW_HEIGHT = 20
+DEFAULT_OVERSCAN = 2
+
+
+class VirtualTable:
+    """Treeview that only materializes the rows currently on screen.
+
+    row_values(index, row) must return (text, values) for the '#0'
+    column and the data columns respectively.
+    """
+
+    def __init__(self, parent, columns, row_values, overscan=DEFAULT_OVERSCAN):
+        self.row_values = row_values
+        self.overscan = overscan
+        self.model = []
+        self.offset = 0
+        self.visible_rows = 1
+        self.selected_index = None
+        self.slots = []
+
+        self.frame = ttk.Frame(parent)
+
+        self.vsb = ttk.Scrollbar(self.frame, command=self.yview)
+        self.vsb.pack(side='right', fill='y')
+
+        self.tree = ttk.Treeview(self.frame, selectmode='browse')
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.tree['columns'] = columns
+
+        self.row_height = self._row_height()
+
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Up>', lambda e: self._on_arrow(-1))
+        self.tree.bind('<Down>', lambda e: self._on_arrow(1))
+        self.tree.bind('<Prior>', lambda e: self.scroll(-self.visible_rows))
+        self.tree.bind('<Next>', lambda e: self.scroll(self.visible_rows))
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+
+    def _row_height(self):
+        """Row height in pixels from the current Treeview style."""
+        style = ttk.Style(self.tree)
+        try:
+            height = int(style.lookup('Treeview', 'rowheight') or 0)
+        except (tk.TclError, ValueError):
+            height = 0
+        return height or DEFAULT_ROW_HEIGHT
+
+    # ----- Geometry passthroughs -----
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def column(self, *args, **kwargs):
+        return self.tree.column(*args, **kwargs)
+
+    def heading(self, *args, **kwargs):
+        return self.tree.heading(*args, **kwargs)
+
+    def bind(self, *args, **kwargs):
+        return self.tree.bind(*args, **kwargs)
+
+    def xview(self, *args):
+        return self.tree.xview(*args)
+
+    def configure(self, **kwargs):
+        return self.tree.configure(**kwargs)
+
+    # ----- Model -----
+    def set_model(self, rows):
+        """Show a new row sequence. O(1) in len(rows) plus one screenful."""
+        self.model = rows
+        self.offset = 0
+        self.selected_index = None
+        self.refresh()
+
+    def clear(self):
+        """Empty the table."""
+        self.set_model([])
+
+    def refresh(self):
+        """Re-render after the model grew, shrank or was reordered in place."""
+        self.offset = max(0, min(self.offset, self._max_offset()))
+        self._render()
+
+    def __len__(self):
+        return len(self.model)
+
+    def index_of_item(self, item):
+        """Model index bound to a Treeview item, or None."""
+        if item in self.slots:
+            index = self.offset + self.slots.index(item)
+            if index < len(self.model):
+                return index
+        return None
+
+    def index_at(self, y):
+        """Model index of the row at pixel y, or None."""
+        return self.index_of_item(self.tree.identify_row(y))
+
+    def row_at(self, y):
+        """Model row at pixel y, or None."""
+        index = self.index_at(y)
+        return None if index is None else self.model[index]
+
+    def values_at(self, y):
+        """Displayed values of the row at pixel y, or ()."""
+        item = self.tree.identify_row(y)
+        return self.tree.item(item, 'values') if item else ()
+
+    # ----- Scrolling -----
+    def _max_offset(self):
+        return max(0, len(self.model) - self.visible_rows)
+
+    def scroll_to(self, offset):
+        """Make model row offset the first visible row."""
+        offset = max(0, min(int(offset), self._max_offset()))
+        if offset != self.offset:
+            self.offset = offset
+            self._render()
+
+    def scroll(self, rows):
+        """Scroll by a number of rows (negative scrolls up)."""
+        self.scroll_to(self.offset + rows)
+        return 'break'
+
+    def see(self, index):
+        """Scroll so model row index is visible."""
+        if index < self.offset:
+            self.scroll_to(index)
+        elif index >= self.offset + self.visible_rows:
+            self.scroll_to(index - self.visible_rows + 1)
+
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, what)."""
+        if not args:
+            return self._fractions()
+        if args[0] == 'moveto':
+            self.scroll_to(float(args[1]) * len(self.model))
+        elif args[0] == 'scroll':
+            step = self.visible_rows if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+
+    def _fractions(self):
+        total = len(self.model)
+        if not total:
+            return (0.0, 1.0)
+        return (self.offset / total, min(1.0, (self.offset + self.visible_rows) / total))
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        delta = event.delta if abs(event.delta) < 120 else event.delta // 120
+        return self.scroll(-delta * 3)
+
+    def _on_arrow(self, step):
+        """Keyboard navigation that scrolls the model at the window edges."""
+        if not self.model:
+            return 'break'
+        current = self.selected_index if self.selected_index is not None else self.offset - step
+        index = max(0, min(len(self.model) - 1, current + step))
+        self.selected_index = index
+        self.see(index)
+        self._render()
+        return 'break'
+
+    def _on_configure(self, event):
+        rows = max(1, (event.height - self.row_height) // self.row_height)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.refresh()
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if selection:
+            index = self.index_of_item(selection[0])
+            if index is not None:
+                self.selected_index = index
+
+    # ----- Rendering -----
+    def _render(self):
+        """Bind the visible model window onto the pooled Treeview items."""
+        wanted = min(self.visible_rows + self.overscan, len(self.model) - self.offset)
+        while len(self.slots) < wanted:
+            self.slots.append(self.tree.insert('', 'end'))
+        while len(self.slots) > max(wanted, 0):
+            self.tree.delete(self.slots.pop())
+
+        selected_item = None
+        for slot, item in enumerate(self.slots):
+            index = self.offset + slot
+            text, values = self.row_values(index, self.model[index])
+            self.tree.item(item, text=text, values=values)
+            if index == self.selected_index:
+                selected_item = item
+
+        if selected_item is not None:
+            self.tree.selection_set(selected_item)
+            self.tree.focus(selected_item)
+        elif self.tree.selection():
+            self.tree.selection_set(())
+        self.vsb.set(*self._fractions())